@@ -6,7 +6,7 @@ August 2021
 GDELTbase.py
 
   Class for creating/maintaining data directory structure, bulk downloading of
-GDELT files with column reduction, parsing/cleaning to JSON format, and export
+GDELT files with column reduction, parsing/cleaning to Parquet files, and export
 of cleaned records to MongoDB.
 
   Basic use should be by import and implementation within an IDE, or by editing
@@ -21,55 +21,60 @@ use.
 'scripts' directory this Python script is located in, given the creation of
 directories 'GDELTdata' and 'EDAlogs' parallel to 'scripts' upon first
 GDELTbase and GDELTeda class initializations.
-If those directories are not already present, a fallback method for
-string-literal directory reorientation may be found in GDELTbase shared class
-data at this tag: # A01a - backup path specification.
-Any given user's project directory must be specified there.
-See also GDELTeda.py, tag # A02b - Project directory path, as any given user's
-project directory must be specified for that os.chdir() call, also.
+GDELTbase resolves 'GDELTdata' from this file's own location, independent of
+the current working directory, and its methods use absolute paths throughout
+rather than changing directories. GDELTeda does the same for 'EDAlogs'.
 
 Contents:
   A00 - GDELTbase
     A01 - shared class data (toolData, localDb)
-      A01a - backup path specification
-      Note: Specification at A01a should be changed to suit a user's desired
-            directory structure, given their local filesystem.
     A02 - __init__ w/ instanced data (localFiles)
   B00 - class methods
     B01 - updateLocalFilesIndex
     B02 - clearLocalFilesIndex
     B03 - showLocalFiles
     B04 - wipeLocalFiles
+      B04a - removeFile
     B05 - extensionToTableName
     B06 - isFileDownloaded
     B07 - downloadGDELTFile
     B08 - downloadGDELTDay
-    B09 - cleanFile (includes the following field/subfield parser functions)
-      B09a - themeSplitter
-      B09b - locationsSplitter
-      B09c - personsSplitter
-      B09d - organizationsSplitter
-      B09e - toneSplitter
-      B09f - countSplitter
-      B09g - One-liner date conversion function for post-read_csv use
-      B09h - llConverter
+    B09 - cleanFile
     B10 - cleanTable
     B11 - mongoFile
     B12 - mongoTable
+    B13 - bulkInsert
+    B14 - loadCleanFile
+    B15 - ensureIndexes
+    B16 - readRawFile (includes the following field/subfield parser functions)
+      B16a - subfieldSplitter
+      B16b - toneSplitter
+      B16c - One-liner date conversion function for post-read_csv use
+      B16d - llConverter
+    B17 - arrowToRecords
+    B18 - cleanMongoTable
   C00 - main w/ testing
 '''
 
 import pandas as pd
 import numpy as np
 import os
+import gc
+import shutil
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import pymongo
-import wget
-import json
-from time import time
-from datetime import datetime, tzinfo
-from zipfile import ZipFile as zf
-from pprint import pprint as pp
-from urllib.error import HTTPError
+from pymongo.write_concern import WriteConcern
+import requests
+from requests.adapters import HTTPAdapter
+import orjson
+from time import perf_counter_ns
+from io import BytesIO
+from pathlib import Path
+from zipfile import ZipFile as zf, BadZipFile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import repeat
 
 # A00
 class GDELTbase:
@@ -82,19 +87,26 @@ toolData - dict with these key - value pairs:
   path - os.path path objects, 'raw' and 'clean', per-table
   names - lists of string column names, per-table, original and reduced
   extensions - dict mapping table names to file extensions, per-table
+  compression - dict mapping table names to cleaned file Parquet codecs
   columnTypes - dicts mapping table column names to appropriate types
+  arrowTypes - dicts mapping table column names to pyarrow types
+  rowBuilder - dict mapping table names to generated record builders
+  subfields - dicts listing GKG location/count subfield names and types
 
 localDb - dict with these key - value pairs:
 client - pymongo.MongoClient()
 database - pymongo.MongoClient().capstone
 collections - dict mapping table names to suitable mongoDB collections
+indexes - dict mapping table names to index keys and uniqueness
 
 Instanced class data:
 --------------------
 
-localFiles - dict, per-table keys for lists of local 'raw' and 'clean'
+localFiles - dict, per-table keys for sets of local 'raw' and 'clean'
 filenames
 
+session - requests.Session, shared by all downloads for connection reuse
+
 Class methods:
 -------------
 
@@ -110,15 +122,16 @@ cleanFile()
 cleanTable()
 mongoFile()
 mongoTable()
+bulkInsert()
+loadCleanFile()
+ensureIndexes()
+readRawFile()
+arrowToRecords()
+cleanMongoTable()
   '''
 
   # A01 - shared class data
   toolData = {}
-  # A01a - backup path specification
-  #   Failsafe path for local main project directory. Must be changed to suit
-  # location of any given end-user's 'script' directory in case directory
-  # 'GDELTdata' is not present one directory up.
-  toolData['projectPath'] = 'C:\\Users\\urf\\Projects\\WGU capstone'
   #  Controls generation of datafile download URLs in downloadGDELTDay()/File()
   toolData['URLbase'] = "http://data.gdeltproject.org/gdeltv2/"
   #  Used in forming URLs for datafile download
@@ -127,13 +140,21 @@ mongoTable()
     'gkg'      : "gkg.csv.zip",
     'mentions' : "mentions.CSV.zip",
     }
+  #   Parquet compression codecs for cleaned files, used in cleanFile(). GKG's
+  # long free-text columns compress far better with gzip, which more than
+  # pays for its extra CPU in disk bytes written and later read back.
+  toolData['compression'] = {
+    'events'   : 'snappy',
+    'gkg'      : 'gzip',
+    'mentions' : 'snappy',
+    }
 
   #  These paths are set relative to the location of this script, one directory
-  # up, in 'GDELTdata', parallel to the script directory.
+  # up, in 'GDELTdata', parallel to the script directory. Resolved once here
+  # from __file__, so they don't depend on the current working directory.
   toolData['path'] = {}
-  toolData['path']['base']= os.path.join(os.path.abspath(__file__),
-                                         os.path.realpath('..'),
-                                         'GDELTdata')
+  toolData['path']['base'] = str(
+    Path(__file__).resolve().parent.parent / 'GDELTdata')
   toolData['path']['events'] = {
     'table': os.path.join(toolData['path']['base'], 'events'),
     'raw': os.path.join(toolData['path']['base'], 'events', 'raw'),
@@ -161,7 +182,15 @@ mongoTable()
     'realtimeC' : os.path.join(toolData['path']['base'], 'mentions',
                                'realtimeClean')
     }
-  
+  #   Flat (table, state, path) listing of every data directory, built once at
+  # class load so that index/wipe/init loops skip the nested dict lookups.
+  toolData['pathPairs'] = []
+  for pairTable in ['events', 'gkg', 'mentions']:
+    for pairState in ['raw', 'clean', 'realtimeR', 'realtimeC']:
+      toolData['pathPairs'].append(
+        (pairTable, pairState, toolData['path'][pairTable][pairState]))
+  del pairTable, pairState
+
   #   These mappings and lists are for recognition of all possible
   # column names, and the specific discarding of a number of columns
   # which have been predetermined as unnecessary in the context of
@@ -344,36 +373,40 @@ mongoTable()
   
   #   These mappings are used in automated dtype application to Pandas
   # DataFrame collections of GDELT records, part of preprocessing.
+  #   Fixed-width NumPy types are used for numeric fields, and 'category'
+  # for low-cardinality string codes (country, type, and CAMEO event codes).
+  # Lat/Long fields stay strings on ingest, as stray '#' characters must be
+  # stripped before their float conversion in cleanFile().
   toolData['columnTypes'] = {}
   toolData['columnTypes']['events'] = {
-    'GLOBALEVENTID' : type(1),
+    'GLOBALEVENTID' : np.int64,
     'Actor1Code': pd.StringDtype(),
     'Actor1Name': pd.StringDtype(),
-    'Actor1CountryCode': pd.StringDtype(),
-    'Actor1Type1Code' : pd.StringDtype(),
-    'Actor1Type2Code' : pd.StringDtype(),
-    'Actor1Type3Code' : pd.StringDtype(),
+    'Actor1CountryCode': 'category',
+    'Actor1Type1Code' : 'category',
+    'Actor1Type2Code' : 'category',
+    'Actor1Type3Code' : 'category',
     'Actor2Code': pd.StringDtype(),
     'Actor2Name': pd.StringDtype(),
-    'Actor2CountryCode': pd.StringDtype(),
-    'Actor2Type1Code' : pd.StringDtype(),
-    'Actor2Type2Code' : pd.StringDtype(),
-    'Actor2Type3Code' : pd.StringDtype(),
-    'IsRootEvent': type(True),
-    'EventCode': pd.StringDtype(),
-    'EventBaseCode': pd.StringDtype(),
-    'EventRootCode': pd.StringDtype(),
-    'QuadClass': type(1),
-    'AvgTone': type(1.1),
-    'Actor1Geo_Type': type(1),
+    'Actor2CountryCode': 'category',
+    'Actor2Type1Code' : 'category',
+    'Actor2Type2Code' : 'category',
+    'Actor2Type3Code' : 'category',
+    'IsRootEvent': np.bool_,
+    'EventCode': 'category',
+    'EventBaseCode': 'category',
+    'EventRootCode': 'category',
+    'QuadClass': np.int8,
+    'AvgTone': np.float64,
+    'Actor1Geo_Type': np.int8,
     'Actor1Geo_FullName': pd.StringDtype(),
     'Actor1Geo_Lat': pd.StringDtype(),
     'Actor1Geo_Long': pd.StringDtype(),
-    'Actor2Geo_Type': type(1),
+    'Actor2Geo_Type': np.int8,
     'Actor2Geo_FullName': pd.StringDtype(),
     'Actor2Geo_Lat': pd.StringDtype(),
     'Actor2Geo_Long': pd.StringDtype(),
-    'ActionGeo_Type': type(1),
+    'ActionGeo_Type': np.int8,
     'ActionGeo_FullName': pd.StringDtype(),
     'ActionGeo_Lat': pd.StringDtype(),
     'ActionGeo_Long': pd.StringDtype(),
@@ -387,22 +420,85 @@ mongoTable()
     'V2DocumentIdentifier' : pd.StringDtype(),
     }
   toolData['columnTypes']['mentions'] = {
-    'GLOBALEVENTID' : type(1),
+    'GLOBALEVENTID' : np.int64,
     'EventTimeDate' : pd.StringDtype(),
     'MentionTimeDate' : pd.StringDtype(),
-    'MentionType' : pd.StringDtype(),
+    'MentionType' : 'category',
     'MentionSourceName' : pd.StringDtype(),
     'MentionIdentifier' : pd.StringDtype(),
-    'InRawText' : type(True),
-    'Confidence' : type(1),
-    'MentionDocTone' : type(1.1),
+    'InRawText' : np.bool_,
+    'Confidence' : np.int8,
+    'MentionDocTone' : np.float64,
+    }
+
+  #   Arrow equivalents of the above, used by pyarrow's CSV reader in
+  # cleanFile(). Reduced columns without a mapping (GKG's subfield columns)
+  # are read as plain strings for later parsing.
+  toolData['arrowTypes'] = {}
+  for arrowTable in ['events', 'gkg', 'mentions']:
+    toolData['arrowTypes'][arrowTable] = {}
+    for arrowColumn in toolData['names'][arrowTable]['reduced']:
+      arrowType = toolData['columnTypes'][arrowTable].get(arrowColumn,
+                                                          pd.StringDtype())
+      if isinstance(arrowType, pd.StringDtype):
+        arrowType = pa.string()
+      elif str(arrowType) == 'category':
+        arrowType = pa.dictionary(pa.int32(), pa.string())
+      else:
+        arrowType = pa.from_numpy_dtype(np.dtype(arrowType))
+      toolData['arrowTypes'][arrowTable][arrowColumn] = arrowType
+  del arrowTable, arrowColumn, arrowType
+
+  #   Per-table record builders for loadCleanFile(), generated once from the
+  # reduced column names. Each is a single dict display over a row tuple,
+  # e.g. "def rowBuilder(row): return {'GLOBALEVENTID' : row[0], ...}",
+  # which skips the per-record zip() and dict() calls of a generic builder.
+  toolData['rowBuilder'] = {}
+  for builderTable in ['events', 'gkg', 'mentions']:
+    builderItems = []
+    for builderIndex, builderColumn in enumerate(
+      toolData['names'][builderTable]['reduced']):
+      builderItems.append("%r : row[%d]" % (builderColumn, builderIndex))
+    builderNamespace = {}
+    exec("def rowBuilder(row):\n  return {%s}\n" % (', '.join(builderItems)),
+         builderNamespace)
+    toolData['rowBuilder'][builderTable] = builderNamespace['rowBuilder']
+  del builderTable, builderItems, builderIndex, builderColumn
+  del builderNamespace
+
+  #   GKG subfield names and types, in '#'-delimited position order, for
+  # V1Locations and V1Counts segments parsed in cleanFile(). Empty subfields
+  # are stored as None.
+  toolData['subfields'] = {
+    'V1Locations' : [
+      ('Type', int),
+      ('FullName', str),
+      ('CountryCode', str),
+      ('ADM1Code', str),
+      ('Latitude', float),
+      ('Longitude', float),
+      ('FeatureID', str),
+      ],
+    'V1Counts' : [
+      ('CountType', str),
+      ('Count', int),
+      ('ObjectType', str),
+      ('LocationType', int),
+      ('LocationFullName', str),
+      ('LocationCountryCode', str),
+      ('LocationADM1Code', str),
+      ('LocationLatitude', float),
+      ('LocationLongitude', float),
+      ('LocationFeatureID', str),
+      ],
     }
 
   #   The pymongo MongoClient() specification here may be modified to
   # meet user requirements, given their own preference for non-default
   # specification of MongoDB instance connection parameters.
   localDb = {}
-  localDb['client'] = pymongo.MongoClient()
+  localDb['client'] = pymongo.MongoClient(w = 1, journal = False,
+                                          maxPoolSize = 32)
   localDb['database'] = localDb['client'].capstone
   localDb['collections'] = {
     'events'   : localDb['database'].GDELT.events,
@@ -414,6 +510,21 @@ mongoTable()
     'gkg'      : localDb['database'].GDELT.realtime.gkg,
     'mentions' : localDb['database'].GDELT.realtime.mentions,
     }
+  #   Per-table index specifications, applied to batch and realtime
+  # collections by ensureIndexes() ahead of inserts. GLOBALEVENTID and
+  # GKGRECORDID are unique per record, so re-inserting a cleaned file skips
+  # records already present; mentions may share a GLOBALEVENTID.
+  localDb['indexes'] = {
+    'events'   : {'keys' : [('DATEADDED', pymongo.ASCENDING),
+                            ('GLOBALEVENTID', pymongo.ASCENDING)],
+                  'unique' : True},
+    'gkg'      : {'keys' : [('V21DATE', pymongo.ASCENDING),
+                            ('GKGRECORDID', pymongo.ASCENDING)],
+                  'unique' : True},
+    'mentions' : {'keys' : [('MentionTimeDate', pymongo.ASCENDING),
+                            ('GLOBALEVENTID', pymongo.ASCENDING)],
+                  'unique' : False},
+    }
 
 
   # A02 - init w/ instanced local file detection
@@ -426,49 +537,41 @@ populate localFiles.
 
     self.localFiles = {
       'events' : {
-        'raw' : [],
-        'clean' : [],
-        'realtimeR' : [],
-        'realtimeC' : [],
+        'raw' : set(),
+        'clean' : set(),
+        'realtimeR' : set(),
+        'realtimeC' : set(),
         },
       'gkg' : {
-        'raw' : [],
-        'clean' : [],
-        'realtimeR' : [],
-        'realtimeC' : [],
+        'raw' : set(),
+        'clean' : set(),
+        'realtimeR' : set(),
+        'realtimeC' : set(),
         },
       'mentions' : {
-        'raw' : [],
-        'clean' : [],
-        'realtimeR' : [],
-        'realtimeC' : [],
+        'raw' : set(),
+        'clean' : set(),
+        'realtimeR' : set(),
+        'realtimeC' : set(),
         },
       }
 
-    # checking base data directory, create if not present
-    if not os.path.isdir(self.toolData['path']['base']):
-      # Makes use of backup path for project directory, string-literal
-      os.chdir(self.toolData['projectPath'])
-      os.mkdir(self.toolData['path']['base'])
-    # switch to data directory
-    os.chdir(self.toolData['path']['base'])
-
-    for table in ['events', 'gkg', 'mentions']:
-      thisTablePath = self.toolData['path'][table]['table']
-      if os.path.isdir(thisTablePath):
-        os.chdir(thisTablePath)
-      else:
-        os.mkdir(thisTablePath)
-        os.chdir(thisTablePath)
-      for state in ['raw', 'clean', 'realtimeR', 'realtimeC']:
-        thisStatePath = self.toolData['path'][table][state]
-        if not os.path.isdir(thisStatePath):
-          os.mkdir(thisStatePath)
-        os.chdir(thisTablePath)
-      os.chdir(self.toolData['path']['base'])
+    #   Checking base, table, and state data directories, creating any which
+    # are not present. All paths are absolute, so no directory changes are
+    # needed, and makedirs() fills in missing parents along the way.
+    for table, state, thisStatePath in self.toolData['pathPairs']:
+      os.makedirs(thisStatePath, exist_ok = True)
 
     self.updateLocalFilesIndex()
 
+    #   A single session keeps connections to data.gdeltproject.org alive
+    # between downloads, and its pool is sized to match downloadGDELTDay()'s
+    # worker threads so that each can hold its own connection.
+    self.session = requests.Session()
+    adapter = HTTPAdapter(pool_connections = 16, pool_maxsize = 16)
+    self.session.mount('http://', adapter)
+    self.session.mount('https://', adapter)
+
 
 # B00 - class methods
 
@@ -488,21 +591,18 @@ output:
 ------
 
   See parameter description for 'verbose' for printed output.
-  Updates instanced data 'localFiles' dictionary of datafile lists.
+  Updates instanced data 'localFiles' dictionary of datafile sets.
     '''
     self.clearLocalFilesIndex()
     if verbose:
       print("  Updating local files index...")
-    os.chdir(self.toolData['path']['base'])
-    for table in ['events', 'gkg', 'mentions']:
-      thisTablePath = self.toolData['path'][table]['table']
-      os.chdir(thisTablePath)
-      for state in ['raw', 'clean', 'realtimeR', 'realtimeC']:
-        os.chdir(self.toolData['path'][table][state])
-        for fileName in os.listdir(self.toolData['path'][table][state]):
-          if fileName not in self.localFiles[table][state]:
-            self.localFiles[table][state].append(fileName)
-      os.chdir(self.toolData['path']['base'])
+    localFiles = self.localFiles
+    scandir = os.scandir
+    for table, state, statePath in self.toolData['pathPairs']:
+      #   scandir() yields DirEntry names without per-entry stat calls, and
+      # set.update() handles de-duplication in one pass.
+      with scandir(statePath) as entries:
+        localFiles[table][state].update(entry.name for entry in entries)
 
   # B02
   def clearLocalFilesIndex(self):
@@ -510,9 +610,8 @@ output:
 lists of local files.
     '''
 
-    for table in ['events', 'gkg', 'mentions']:
-      for state in ['raw', 'clean', 'realtimeR', 'realtimeC']:
-        self.localFiles[table][state] = []
+    for table, state, statePath in self.toolData['pathPairs']:
+      self.localFiles[table][state] = set()
 
 
   # B03
@@ -553,7 +652,7 @@ See parameter description for 'full' for printed output.
                 (state, self.toolData['path'][table][state]))
           print("  %i files." % (len(self.localFiles[table][state])))
           if full:
-            for file in self.localFiles[table][state]:
+            for file in sorted(self.localFiles[table][state]):
               print("    ", file)
       if mode == 'realtime':
         print("Table: '%s', path: '%s'" % \
@@ -563,7 +662,7 @@ See parameter description for 'full' for printed output.
                 (state, self.toolData['path'][table][state]))
           print("  %i files." % (len(self.localFiles[table][state])))
           if full:
-            for file in self.localFiles[table][state]:
+            for file in sorted(self.localFiles[table][state]):
               print("    ", file)
     print("")
 
@@ -587,7 +686,7 @@ Controls what table's files will be deleted.
 stateList - string, default 'clean'
    Controls what type of file will be deleted.
  These values are permitted:
-   'clean' - default, removes cleaned GDELT json documents.
+   'clean' - default, removes cleaned GDELT parquet files.
    'raw' - removes downloaded and extracted GDELT csv datafiles.
    'both' - both of the above operations.
    'realtime' - 'both', but for realtime datafile directories
@@ -614,34 +713,58 @@ Deletes parameter-specified local GDELT files.
       'all' : ['raw', 'clean', 'realtimeR', 'realtimeC'],
     }
     stateList = stateDict[state]
-    timecheck = time()
+
+    # B04a - removeFile
+    #   Returns None for a deleted file, or the error's message, so deletions
+    # can run in a thread pool and be reported afterwards, in order.
+    def removeFile(filePath):
+      try:
+        os.unlink(filePath)
+        return None
+      except OSError as e:
+        return e.strerror
+
+    timecheck = perf_counter_ns()
     filesWiped = 0
-    os.chdir(self.toolData['path']['base'])
     print("Deleting files currently present in GDELTdata:")
     for table in tableList:
-      os.chdir(self.toolData['path'][table]['table'])
       print("  Table:", table)
       for state in stateList:
-        os.chdir(self.toolData['path'][table][state])
+        statePath = self.toolData['path'][table][state]
         print("    state:", state, ",",
               len(self.localFiles[table][state]), "files.")
-        for fileName in os.listdir(self.toolData['path'][table][state]):
-          filePath = os.path.join(self.toolData['path'][table][state],
-                                  fileName)
-          if verbose:
-            print("      deleting", fileName, end = '...')
-          if not os.path.isfile(filePath):
-            print("  filePath failure!", filePath)
-            continue
+        #   Without per-file reporting, the whole state directory is removed
+        # and recreated in one call, rather than unlinking files one by one.
+        if not verbose:
+          filesWiped += len(self.localFiles[table][state])
+          shutil.rmtree(statePath, ignore_errors = True)
+          os.makedirs(statePath, exist_ok = True)
+          self.localFiles[table][state] = set()
+          continue
+        #   scandir() DirEntry objects carry their file type from the directory
+        # listing, so no stat call is made per file, and unlink() releases the
+        # GIL, so files are deleted from a thread pool.
+        fileEntries = []
+        with os.scandir(statePath) as entries:
+          for entry in entries:
+            if entry.is_file():
+              fileEntries.append(entry)
+            else:
+              print("      deleting", entry.name, end = '...')
+              print("  filePath failure!", entry.path)
+        with ThreadPoolExecutor(max_workers = 8) as executor:
+          errors = list(executor.map(
+            removeFile, [entry.path for entry in fileEntries]))
+        for entry, error in zip(fileEntries, errors):
+          print("      deleting", entry.name, end = '...')
+          if error is None:
+            print(" good delete!")
+            filesWiped += 1
+            self.localFiles[table][state].discard(entry.name)
           else:
-            try:
-              os.remove(filePath)
-              if verbose:
-                print(" good delete!")
-              self.localFiles[table][state].remove(fileName)
-            except OSError as e:
-              print("Error: %s : %s" % (filePath, e.strerror))
-    print("  Finished in %d seconds\n" % (time() - timecheck))
+            print("Error: %s : %s" % (entry.path, error))
+    print("  %d files deleted in %d seconds\n" %
+          (filesWiped, (perf_counter_ns() - timecheck) / 1e9))
 
 
   # B05
@@ -653,7 +776,8 @@ Parameters:
 ----------
 
 fileName - string
-  string[15:] must be one of "export.CSV", "gkg.csv", or "mentions.CSV".
+  string[15:] must be one of "export.CSV", "gkg.csv", or "mentions.CSV",
+or their cleaned ".parquet" (or older ".json") equivalents.
 
 output:
 ------
@@ -663,19 +787,25 @@ one of ["events", "gkg", "mentions"]
     '''
 
     extension = fileName[15:]
-    if extension not in ["export.CSV", "gkg.csv", "mentions.CSV"]:
-      print("extensionToTableName error! fileName '%s'" % (fileName), end='')
-      print(" produced extension '%s'" % (extension))
     extToTable = {
       'export.CSV' : 'events',
       'gkg.csv' : 'gkg',
       'mentions.CSV' : 'mentions',
+      'export.parquet' : 'events',
+      'gkg.parquet' : 'gkg',
+      'mentions.parquet' : 'mentions',
+      'export.json' : 'events',
+      'gkg.json' : 'gkg',
+      'mentions.json' : 'mentions',
     }
+    if extension not in extToTable:
+      print("extensionToTableName error! fileName '%s'" % (fileName), end='')
+      print(" produced extension '%s'" % (extension))
     return extToTable[extension]
 
 
   # B06
-  def isFileDownloaded(self, fileName):
+  def isFileDownloaded(self, fileName, table = None):
     '''Helper function, checks for filename presence in appropriate
 local directories.
 
@@ -686,18 +816,24 @@ fileName - string
   format: YYYYMMDDHHMMSS.[flag].[csv/CSV].zip, Used to interpret table
 type and check appropriate file lists.
 
+table - string, default None
+  One of ['events', 'gkg', 'mentions'] when already known by the caller
+(as in downloadGDELTFile), otherwise interpreted from fileName.
+
 output:
 ------
 
-boolean for fileName's presence in local raw or clean files, intended
-for handling in downloadGDELTFile.
+boolean for fileName's presence in local raw files, intended for
+handling in downloadGDELTFile.
     '''
 
-    table = self.extensionToTableName(fileName)
-    return (fileName in self.localFiles[table]['raw']) \
-      or (fileName in self.localFiles[table]['clean']) \
-      or (fileName in self.localFiles[table]['realtimeR']) \
-      or (fileName in self.localFiles[table]['realtimeC'])
+    if table is None:
+      table = self.extensionToTableName(fileName)
+    #   Only raw file sets can hold a raw file name, as cleaned file names
+    # carry a different extension, so two O(1) set lookups suffice.
+    tableFiles = self.localFiles[table]
+    return (fileName in tableFiles['raw']) \
+      or (fileName in tableFiles['realtimeR'])
 
 
   # B07
@@ -735,10 +871,9 @@ Returns boolean handled by GDELTbase.downloadGDELTDay() and/or
 GDELTeda.realtimeEDA(), for tracking results of operations.
     '''
 
-    os.chdir(self.toolData['path'][table]['table'])
     fileName = thisUrl.replace(self.toolData['URLbase'],'')
     fileName = fileName.replace('.zip', '')
-    if self.isFileDownloaded(fileName):
+    if self.isFileDownloaded(fileName, table):
       if verbose:
         print(" ", fileName, "already downloaded, skipping...")
       return False
@@ -752,41 +887,45 @@ GDELTeda.realtimeEDA(), for tracking results of operations.
       elif mode == 'realtime':
         statePath = self.toolData['path'][table]['realtimeR']
 
-      os.chdir(statePath)
-      zipFileName = ''.join([fileName, '.zip'])
-      filePath = os.path.join(statePath, zipFileName)
-      timecheck = time()
+      timecheck = perf_counter_ns()
+      #   The zip archive is held in memory and extracted from there, rather
+      # than being written to disk, read back for extraction, then deleted.
       try:
-        wget.download(thisUrl, filePath)
-      except HTTPError:
-        print("Error 404: File not found! File: %s" % (fileName))
+        response = self.session.get(thisUrl, timeout = 60)
+        response.raise_for_status()
+      except requests.exceptions.HTTPError:
+        print("Error %d: %s! File: %s" % (response.status_code,
+                                          response.reason, fileName))
+        return False
+      #   Run in downloadGDELTDay()'s threads, any other failure is reported
+      # for this file alone, rather than raised when the day's results are
+      # collected, aborting the rest of the day's downloads.
+      except requests.exceptions.RequestException as e:
+        print("Error: %s : %s" % (fileName, e))
         return False
       if verbose:
-        print("done(%0.3fs)" % (float(time())-float(timecheck)), end=', ')
+        print("done(%0.3fs)" %
+              ((perf_counter_ns() - timecheck) / 1e9), end=', ')
         print("extracting...", end=' ')
-      with zf(filePath, 'r') as zipFile:
-        zipFile.extractall()
-      if verbose:
-        print("done, ", end='')
       try:
-        if verbose:
-          print("removing zip file...", end='')
-        os.remove(filePath)
-      except OSError as e:
-        print("Error: %s : %s" % (fileName, e.strerror))
+        with zf(BytesIO(response.content), 'r') as zipFile:
+          zipFile.extractall(statePath)
+      except BadZipFile as e:
+        print("Error: %s : %s" % (fileName, e))
+        return False
       if verbose:
-        print(" done.")
+        print("done.")
       fileName = fileName.replace('.zip','')
       if mode == 'batch':
-        self.localFiles[table]['raw'].append(fileName)
+        self.localFiles[table]['raw'].add(fileName)
       elif mode == 'realtime':
-        self.localFiles[table]['realtimeR'].append(fileName)
+        self.localFiles[table]['realtimeR'].add(fileName)
       return True
 
 
   # B08
-  def downloadGDELTDay(self, date, table, verbose = False):
-    '''Downloads up to 93 15-minute window files for a given day and
+  def downloadGDELTDay(self, date, table, verbose = False, workers = 16):
+    '''Downloads up to 96 15-minute window files for a given day and
 table, calling downloadGDELTFile() for each file.
 
 Parameters:
@@ -806,6 +945,10 @@ state, counts for downloaded files, and time to completion).
 If true, prints fileName and time to download for each individual file,
 as well as a total count.
 
+workers - int, default 16
+  Number of threads used for concurrent file downloads. Use 1 for
+sequential downloading (readable output when 'verbose' is True).
+
 output:
 ------
 
@@ -819,30 +962,33 @@ completion, default, or all URLs/filenames and times to completion.
     if table not in ['events', 'gkg', 'mentions']:
       print("Bad 'table' value, specify one of 'events', 'gkg', 'mentions'.")
     else:
-      timecheck = time()
+      timecheck = perf_counter_ns()
       filesDownloaded = []
       filesSkipped = []
-      filePath = self.toolData['path'][table]['raw']
-      os.chdir(filePath)
       print("Starting downloading and extraction for %s, table '%s'..." % \
             (date, table))
       date = date.replace("/", '')
       urlStart = ''.join([self.toolData['URLbase'], date])
-      for hour in range(0, 23):
-        if hour < 10:
-          hour = '0' + str(hour)
-        for minute in ['00', '15', '30', '45']:
-          thisUrl = ''.join([urlStart, str(hour), str(minute), "00.",
-                             self.toolData['extensions'][table]])
-          downloaded = self.downloadGDELTFile(thisUrl, table, verbose)
-          thisUrl = thisUrl.replace(self.toolData['URLbase'], '')
-          thisUrl = thisUrl.replace('.zip', '')
-          if downloaded:
-            filesDownloaded.append(thisUrl)
-          else:
-            filesSkipped.append(thisUrl)
+      extension = self.toolData['extensions'][table]
+      # all 96 15-minute windows, 00:00 through 23:45
+      dayURLs = [f"{urlStart}{hour:02d}{minute}00.{extension}"
+                 for hour in range(24)
+                 for minute in ('00', '15', '30', '45')]
+      #   Downloads are network-bound, so a thread pool overlaps the waiting
+      # on each request. downloadGDELTFile() works with absolute paths only,
+      # and results are collected here in URL order once all threads finish.
+      with ThreadPoolExecutor(max_workers = workers) as executor:
+        results = list(executor.map(
+          lambda url: self.downloadGDELTFile(url, table, verbose), dayURLs))
+      for thisUrl, downloaded in zip(dayURLs, results):
+        thisUrl = thisUrl.replace(self.toolData['URLbase'], '')
+        thisUrl = thisUrl.replace('.zip', '')
+        if downloaded:
+          filesDownloaded.append(thisUrl)
+        else:
+          filesSkipped.append(thisUrl)
       print("Downloading and extraction complete (%0.3fs)." % \
-            (float(time())-float(timecheck)))
+            ((perf_counter_ns() - timecheck) / 1e9))
       print("%d files acquired, %d files skipped" % \
             (len(filesDownloaded), len(filesSkipped)))
 
@@ -852,7 +998,7 @@ completion, default, or all URLs/filenames and times to completion.
                 mode = 'batch'):
     '''Imports .CSV to Pandas dataframe while dropping unused columns,
 corrects field-type mapping, parses fields when necessary, then exports
-to file as JSON.
+to file as Parquet.
 
 Parameters:
 ----------
@@ -897,9 +1043,15 @@ cleanTable()
                                  rawFileName)
 
     if table == 'gkg':
-      cleanFileName = rawFileName.replace('.csv', '.json')
+      cleanFileName = rawFileName.replace('.csv', '.parquet')
     else:
-      cleanFileName = rawFileName.replace('.CSV', '.json')
+      cleanFileName = rawFileName.replace('.CSV', '.parquet')
+    if mode == 'batch':
+      cleanFilePath = os.path.join(self.toolData['path'][table]['clean'],
+                                   cleanFileName)
+    elif mode == 'realtime':
+      cleanFilePath = os.path.join(self.toolData['path'][table]['realtimeC'],
+                                   cleanFileName)
 
     if verbose:
       print("  %s : " % (rawFileName), end='')
@@ -911,7 +1063,6 @@ cleanTable()
           print("already cleaned, skipping.")
         return False
       else:
-        os.chdir(self.toolData['path'][table]['raw'])
         if not os.path.isfile(rawFilePath):
           if verbose:
             print("not found, skipping.")
@@ -922,7 +1073,6 @@ cleanTable()
           print("already cleaned, skipping.")
         return False
       else:
-        os.chdir(self.toolData['path'][table]['realtimeR'])
         if not os.path.isfile(rawFilePath):
           if verbose:
             print("not found, skipping.")
@@ -931,314 +1081,42 @@ cleanTable()
     if verbose:
       print("found, ", end='')
 
-    if table == 'gkg':
-      # GKG's subfield handling:
-      #     Taking advantage of read_csv param 'converters' to save a
-      # lot of individual *.apply() calls.
-      #     (GKG record fields with subfield mappings require more
-      # in-depth handling, due to varying delineation among the fields.
-      # Just like *apply() routes conversion functions through Numpy's
-      # 'C' backend for improved processing speed, 'converters'-passed
-      # functions also benefit from Numpy's processing help).
-
-      # B09a
-      def themeSplitter(x):
-        '''conversion function for parsing themes subfields
-        '''
-        if not pd.isnull(x):
-          y = x.split(sep = ";")
-          if y[-1] == '':
-            y.remove('')
-        else:
-          y = [' ']
-        return y
-
-      # B09b
-      def locationsSplitter(x):
-        '''conversion function for parsing locations subfields
-        '''
-        if not pd.isnull(x):
-          y = x.split(sep=";")
-          locationDictTemplate = {
-            'Type': None,
-            'FullName': None,
-            'CountryCode': None,
-            'ADM1Code': None,
-            'Latitude': None,
-            'Longitude': None,
-            'FeatureID': None,
-          }
-          locations = []
-          for substring in y:
-            locationDict = locationDictTemplate.copy()
-            subloc = substring.split(sep = "#")
-            if subloc[-1] == '':
-              subloc.remove('')
-            subLength = len(subloc)
-            if subLength > 0:
-              if (subloc[0] != ''):
-                locationDict['Type'] = int(subloc[0])
-            if subLength > 1:
-              if (subloc[1] != ''):
-                locationDict['FullName'] = subloc[1]
-            if subLength > 2:
-              if (subloc[2] != ''):
-                locationDict['CountryCode'] = subloc[2]
-            if subLength > 3:
-              if (subloc[3] != ''):
-                locationDict['ADM1Code'] = subloc[3]
-            if subLength > 4:
-              if (subloc[4] != ''):
-                locationDict['Latitude'] = float(subloc[4])
-            if subLength > 5:
-              if (subloc[5] != ''):
-                locationDict['Longitude'] = float(subloc[5])
-            if subLength > 6:
-              if (subloc[6] != ''):
-                locationDict['FeatureID'] = subloc[6]
-            locations.append(locationDict.copy())
-        else:
-          locations = None
-        return locations
-
-      # B09c
-      def personsSplitter(x):
-        '''conversion function for parsing persons subfields
-        '''
-        if not pd.isnull(x):
-          y = x.split(sep=";")
-          if len(y) > 1 and y[-1] == '':
-            y.remove('')
-        else:
-          y = [' ']
-        return y
-
-      # B09d
-      def organizationsSplitter(x):
-        '''conversion function for parsing organizations subfields
-        '''
-        if not pd.isnull(x):
-          y = x.split(sep=";")
-        else:
-          y = [' ']
-        return y
-
-      # B09e
-      def toneSplitter(x):
-        '''conversion function for parsing tone subfields
-        '''
-        if not pd.isnull(x):
-          x = x.split(sep=",")
-          toneDict = {
-            'Tone': None,
-            'Positive': None,
-            'Negative': None,
-            'Polarity': None,
-            'ARD': None,
-            'SGRD': None,
-            'WordCount': None,
-            }
-          if len(x) > 6:
-            if x[0] != '':
-              toneDict['Tone'] = float(x[0])
-            if x[1] != '':
-              toneDict['Positive'] = float(x[1])
-            if x[2] != '':
-              toneDict['Negative'] = float(x[2])
-            if x[3] != '':
-              toneDict['Polarity'] = float(x[3])
-            if x[4] != '':
-              toneDict['ARD'] = float(x[4])
-            if x[5] != '':
-              toneDict['SGRD'] = float(x[5])
-            if x[6] != '':
-              toneDict['WordCount'] = int(x[6])
-          return toneDict
-
-      # B09f
-      def countSplitter(x):
-        '''conversion function for parsing count subfields
-        '''
-        if not pd.isnull(x):
-          y = x.split(sep=";")
-          if len(y) == 0:
-            return None
-          countDictTemplate = {
-            'CountType' : None,
-            'Count' : None,
-            'ObjectType' : None,
-            'LocationType' : None,
-            'LocationFullName': None,
-            'LocationCountryCode': None,
-            'LocationADM1Code': None,
-            'LocationLatitude': None,
-            'LocationLongitude': None,
-            'LocationFeatureID': None,
-            }
-          counts = []
-          for substring in y:
-            countDict = countDictTemplate.copy()
-            subCount = substring.split(sep = "#")
-            if subCount[-1] == '':
-              subCount.remove('')
-            subLength = len(subCount)
-            # if subLength < 1:
-            #   continue
-            if subLength > 0:
-              if (subCount[0] != ''):
-                countDict['CountType'] = subCount[0]
-            if subLength > 1:
-              if (subCount[1] != ''):
-                countDict['Count'] = int(subCount[1])
-            if subLength > 2:
-              if (subCount[2] != ''):
-                countDict['ObjectType'] = subCount[2]
-            if subLength > 3:
-              if (subCount[3] != ''):
-                countDict['LocationType'] = int(subCount[3])
-            if subLength > 4:
-              if (subCount[4] != ''):
-                countDict['LocationFullName'] = subCount[4]
-            if subLength > 5:
-              if (subCount[5] != ''):
-                countDict['LocationCountryCode'] = subCount[5]
-            if subLength > 6:
-              if (subCount[6] != ''):
-                countDict['LocationADM1Code'] = subCount[6]
-            if subLength > 7:
-              if (subCount[7] != ''):
-                countDict['LocationLatitude'] = float(subCount[7])
-            if subLength > 8:
-              if (subCount[8] != ''):
-                countDict['LocationLongitude'] = float(subCount[8])
-            if subLength > 9:
-              if (subCount[9] != ''):
-                countDict['LocationFeatureID'] = subCount[9]
-            counts.append(countDict.copy())
-        else:
-          counts = None
-        return counts
-
-      # mapping conversion functions for read_csv param 'converters'
-      gkgConverters = {
-        'V1Themes' : themeSplitter,
-        'V1Locations' : locationsSplitter,
-        'V1Persons' : personsSplitter,
-        'V1Organizations' : organizationsSplitter,
-        'V15Tone' : toneSplitter,
-        'V1Counts' : countSplitter,
-        }
-      cleanDF = pd.read_csv(rawFilePath, sep='\t',
-                           names = self.toolData['names'][table]['original'],
-                           usecols = self.toolData['names'][table]['reduced'],
-                           dtype = self.toolData['columnTypes'][table],
-                           converters = gkgConverters)
-      if verbose:
-        print("applying: The Loc Per Org Ton Co ", end='')
-    else:
-      # events and mentions files handled here
-      cleanDF = pd.read_csv(rawFilePath, sep='\t',
-                           names = self.toolData['names'][table]['original'],
-                           usecols = self.toolData['names'][table]['reduced'],
-                           dtype = self.toolData['columnTypes'][table])
-      if verbose:
-        print("applying: ", end='')
-    
-    # B09g - One-liner date conversion function for post-read_csv use
-    dtConverter = lambda x: datetime.strptime(str(x), "%Y%m%d%H%M%S")
-
-    # After catching strange occurrences of '#' in 'events' field values for
-    #  'Actor1/2Geo_Lat/Long', 'ActionGeo_Lat', 'ActionGeo_Long', now I've got
-    #  to catch and handle those cases, rare as they may be.
-    # B09h
-    def llConverter(x):
-      '''Catches and removes '#' values which happen to be messing up
-conversion to float for 'events' Latitude/Longitude field values.
-      '''
-      if not pd.isnull(x):
-        if '#' in x:
-          x = x.replace('#', '')
-        return float(x)
-      else:
-        return None
-
-    # per-table post-read column conversions
-    if table == 'events':
-      if verbose:
-        print("Lat/Lon ", end = '')
-      # See description
-      cleanDF['Actor1Geo_Lat'] = cleanDF['ActionGeo_Lat'].apply(llConverter)
-      cleanDF['Actor1Geo_Long'] = cleanDF['ActionGeo_Long'].apply(llConverter)
-      cleanDF['Actor2Geo_Lat'] = cleanDF['ActionGeo_Lat'].apply(llConverter)
-      cleanDF['Actor2Geo_Long'] = cleanDF['ActionGeo_Long'].apply(llConverter)
-      cleanDF['ActionGeo_Lat'] = cleanDF['ActionGeo_Lat'].apply(llConverter)
-      cleanDF['ActionGeo_Long'] = cleanDF['ActionGeo_Long'].apply(llConverter)
-      if verbose:
-        print("D.")
-      cleanDF["DATEADDED"] = cleanDF["DATEADDED"].apply(dtConverter)
-      #   Events also requires parsing of various fields' coded values, though
-      # the increase in disk space and RAM required for expansion of those
-      # values into legible strings may be too much prior to EDA
-
-    elif table == 'gkg':
-      if verbose:
-        print("D.")
-      try:
-        #   This dropna is unfortunately necessary due to GKG's V2EXTRASXML
-        # field values occasionally mixing newline characters into the
-        # PAGE_LINKS subfield, albeit only rarely, resulting in junk rows that
-        # Pandas is apparently failing to discard...
-        cleanDF = cleanDF.dropna(axis = 0, thresh = 5)
-        #   Even this dropna() has no apparent effect, as this line's raised
-        # exception reveals junk rows in almost 20 files across the 31 day test
-        # batch. 20 out of 2758 GKG giles (8274 across all tables) isn't that
-        # bad, so I've corrected the junk rows by hand.
-        cleanDF["V21DATE"] = cleanDF["V21DATE"].apply(dtConverter)
-        #   My apologies for not properly handling this rare bug-case on the
-        # part of that specific portion of GKG record formatting. The field
-        # isn't even providing any tangible value, given its description...
-      except ValueError as e:
-        print("Error: %s" % (e))
-        return False
-
-    elif table == 'mentions':
-      if verbose:
-        print("ETD/MTD.")
-      cleanDF["EventTimeDate"] = cleanDF["EventTimeDate"].apply(dtConverter)
-      cleanDF["MentionTimeDate"] =cleanDF["MentionTimeDate"].apply(dtConverter)
+    cleanDF = self.readRawFile(rawFilePath, table, verbose)
+    if cleanDF is None:
+      return False
 
-    # branching for GDELTeda.realtimeEDA() use
-    if mode == 'batch':
-      os.chdir(self.toolData['path'][table]['clean'])
-    elif mode == 'realtime':
-      os.chdir(self.toolData['path'][table]['realtimeC'])
-    cleanDF.to_json(cleanFileName, orient = 'records', date_format = 'iso',
-                   date_unit = 'us')
+    #   Cleaned records are kept as typed, compressed, columnar Parquet.
+    # Dictionary encoding stores each repeated code/name value only once per
+    # column chunk, and GKG's parsed subfields are kept as nested list/struct
+    # columns. Conversion to MongoDB documents happens in loadCleanFile().
+    pq.write_table(pa.Table.from_pandas(cleanDF, preserve_index = False),
+                   cleanFilePath,
+                   compression = self.toolData['compression'][table],
+                   use_dictionary = True, coerce_timestamps = 'us')
 
     # optional raw file deletion for space saving, default false
     if deleteRaw:
       try:
         if mode == 'batch':
-          os.chdir(self.toolData['path'][table]['raw'])
           os.remove(rawFilePath)
-          self.localFiles[table]['raw'].remove(rawFileName)
+          self.localFiles[table]['raw'].discard(rawFileName)
         elif mode == 'realtime':
-          os.chdir(self.toolData['path'][table]['realtimeR'])
           os.remove(rawFilePath)
-          self.localFiles[table]['realtimeR'].remove(rawFileName)
+          self.localFiles[table]['realtimeR'].discard(rawFileName)
       except OSError as e:
         print("Error: %s : %s" % (rawFilePath, e.strerror))
         return False
 
     if mode == 'batch':
-      self.localFiles[table]['clean'].append(cleanFileName)
+      self.localFiles[table]['clean'].add(cleanFileName)
     elif mode == 'realtime':
-      self.localFiles[table]['realtimeC'].append(cleanFileName)
+      self.localFiles[table]['realtimeC'].add(cleanFileName)
     return True
 
 
   # B10
-  def cleanTable(self, table, deleteRaw = False, verbose = False):
+  def cleanTable(self, table, deleteRaw = False, verbose = False,
+                 workers = None):
     '''Iterates over all local 'raw' files present for a table, parsing
  and cleaning each.
 
@@ -1256,7 +1134,11 @@ verbose - boolean, default False
   Controls printed output, default prints counts for files cleaned or
  skipped). If true, prints fileName and conversions applied for each
  file cleaned, or else that a file is already cleaned and therefore
- skipped.
+ skipped. Output from concurrently cleaned files may be interleaved.
+
+workers - int, default None
+  Maximum number of worker processes cleaning files concurrently, default
+ None uses one per CPU.
 
 output:
 ------
@@ -1271,35 +1153,39 @@ See parameter description for 'verbose' for printed output.
       print("Bad 'table' value, specify one of 'events', 'gkg', 'mentions'.")
       return
     else:
-      timecheck = time()
+      timecheck = perf_counter_ns()
       filesCleaned = 0
       filesSkipped = 0
 
-      tablePath = self.toolData['path'][table]['raw']
-      os.chdir(tablePath)
-
       print("Starting to clean any raw", table, "files...")
-      localSnapShot = self.localFiles[table]['raw'][:]
+      localSnapShot = sorted(self.localFiles[table]['raw'])
 
       if len(localSnapShot) == 0:
         print("No raw files present for table '%s'." % (table))
         return
       else:
-        for fileName in localSnapShot:
-          cleaned = self.cleanFile(fileName, deleteRaw, verbose)
+        #   Files are cleaned independently in worker processes, each working
+        # from a copy of this instance. Their localFiles changes stay in the
+        # workers, so the index is refreshed from disk once they finish.
+        with ProcessPoolExecutor(max_workers = workers) as executor:
+          results = list(executor.map(self.cleanFile, localSnapShot,
+                                      repeat(deleteRaw), repeat(verbose)))
+        self.updateLocalFilesIndex()
+        for cleaned in results:
           if cleaned:
             filesCleaned += 1
           else:
             filesSkipped += 1
         print("Finished, took %0.3f seconds." % \
-              (float(time())-float(timecheck)))
+              ((perf_counter_ns() - timecheck) / 1e9))
         print("%d files cleaned, %d files skipped." % \
               (filesCleaned, filesSkipped))
 
 
   # B11
-  def mongoFile(self, fileName, table, verbose = False, mode = 'batch'):
-    '''Loads cleaned GDELT .json files/records, then inserts the records
+  def mongoFile(self, fileName, table, verbose = False, mode = 'batch',
+                safe = False):
+    '''Loads cleaned GDELT .parquet files/records, then inserts the records
 into a table and mode-appropriate MongoDB collection.
 
 Parameters:
@@ -1325,6 +1211,11 @@ mode - string, default 'batch'
  individual files are downloaded and cleaned in separate directories and
  exported and profiled individually.
 
+safe - boolean, default False
+  Passed to bulkInsert() for 'batch' mode exports, default False sends
+unacknowledged writes. 'realtime' mode exports are always acknowledged,
+as GDELTeda.realtimeEDA() queries their records right away.
+
 output:
 ------
 
@@ -1345,14 +1236,14 @@ failure, intended for handling in mongoTable() to track export results.
           print("  Trying %s..." % (fileName), end='')
         filePath = os.path.join(self.toolData['path'][table]['clean'],
                                 fileName)
-        with open(filePath) as f:
-          exportData = json.load(f)
+        exportData = self.loadCleanFile(filePath)
         recordsCount = len(exportData)
         if not recordsCount < 1:
           if verbose:
             print("loaded. Exporting...", end='')
           try:
-            self.localDb['collections'][table].insert_many(exportData)
+            recordsCount = self.bulkInsert(
+              self.localDb['collections'][table], exportData, safe = safe)
             if verbose:
               print("success!")
             return recordsCount
@@ -1361,7 +1252,7 @@ failure, intended for handling in mongoTable() to track export results.
             return False
         else:
           if verbose:
-            print("json.load() failure! Skipping...")
+            print("no records loaded! Skipping...")
           return False
     # this feels like a sloppy implementation, but I'm pretty short on time.
     elif mode == 'realtime':
@@ -1374,15 +1265,14 @@ failure, intended for handling in mongoTable() to track export results.
           print("  Trying %s..." % (fileName), end='')
         filePath = os.path.join(self.toolData['path'][table]['realtimeC'],
                                 fileName)
-        with open(filePath) as f:
-          exportData = json.load(f)
+        exportData = self.loadCleanFile(filePath)
         recordsCount = len(exportData)
         if not recordsCount < 1:
           if verbose:
             print("loaded. Exporting...", end='')
           try:
-            self.localDb['collections']['realtime'][table].insert_many(
-              exportData)
+            recordsCount = self.bulkInsert(
+              self.localDb['collections']['realtime'][table], exportData)
             if verbose:
               print("success!")
             return recordsCount
@@ -1391,11 +1281,12 @@ failure, intended for handling in mongoTable() to track export results.
             return False
         else:
           if verbose:
-            print("json.load() failure! Skipping...")
+            print("no records loaded! Skipping...")
           return False
 
   # B12
-  def mongoTable(self, table, reindex = False, verbose = False):
+  def mongoTable(self, table, reindex = False, verbose = False, workers = 4,
+                 safe = False):
     '''Iterates over all local 'clean' files present for a table,
 calling mongoFile() on each.
 
@@ -1416,7 +1307,14 @@ verbose - boolean, default False
   Controls printed output, default 'terse' (prints counts for files and
 records exported to MongoDB).
 If true, prints each fileName and number of records exported, or else
-skipped due to lack of cleaning or 'file not found'.
+skipped due to lack of cleaning or 'file not found'. Output from
+concurrently exported files may be interleaved.
+
+workers - int, default 4
+  Number of files loaded and exported concurrently.
+
+safe - boolean, default False
+  Passed to internal calls on self.mongoFile(), see bulkInsert().
 
 output:
 ------
@@ -1426,7 +1324,7 @@ Records added to mongoDB instance.
 See parameter description for 'verbose' for printed output.
     '''
 
-    timecheck = time()
+    timecheck = perf_counter_ns()
     totalFiles = 0
     totalRecords = 0
     if table not in ['events', 'gkg', 'mentions']:
@@ -1436,12 +1334,17 @@ See parameter description for 'verbose' for printed output.
       print("No clean files found for '%s' table, aborting..." % table)
       return
     else:
-      tablePath = self.toolData['path'][table]['clean']
-      os.chdir(tablePath)
       print("Exporting %d '%s' files to MongoDB..." % \
             (len(self.localFiles[table]['clean']), table))
-      for fileName in self.localFiles[table]['clean']:
-        success = self.mongoFile(fileName, table, verbose)
+      #   Several files are exported at once, so that one file's loading
+      # from disk overlaps with another's inserts waiting on MongoDB.
+      # pymongo's client is thread-safe and pools its connections.
+      with ThreadPoolExecutor(max_workers = workers) as executor:
+        results = list(executor.map(
+          lambda fileName: self.mongoFile(fileName, table, verbose,
+                                          safe = safe),
+          sorted(self.localFiles[table]['clean'])))
+      for success in results:
         if success:
           totalFiles += 1
           totalRecords += success
@@ -1449,13 +1352,487 @@ See parameter description for 'verbose' for printed output.
           continue
       print("MongoDB import complete,",
             "%d files with %d records added to table '%s' (%0.3f seconds)" % \
-            (totalFiles,totalRecords,table,(float(time())-float(timecheck))))
+            (totalFiles, totalRecords, table,
+             (perf_counter_ns() - timecheck) / 1e9))
       if reindex:
-        timecheck = time()
+        timecheck = perf_counter_ns()
         print("Rebuilding '%s' table indexes (may take a while)..." % (table),
               end='')
         self.localDb['collections'][table].reindex()
-        print("done. (%0.3fs)" % (float(time())-float(timecheck)))
+        print("done. (%0.3fs)" % ((perf_counter_ns() - timecheck) / 1e9))
+
+  # B13
+  def bulkInsert(self, collection, records, batchSize = 1000, safe = True):
+    '''Inserts records into a MongoDB collection in unordered batches,
+used by mongoFile().
+
+Parameters:
+----------
+
+collection - pymongo.collection.Collection
+  Typically one of the collections in localDb['collections'].
+
+records - list of dicts
+  Records to be inserted, such as the contents of a cleaned file.
+
+batchSize - int, default 1000
+  Number of records sent with each insert_many() call.
+
+safe - boolean, default True
+  When False, batches are sent with an unacknowledged (w=0) write
+concern, without waiting on the server between batches. Intended for
+batch imports that can simply be re-run on failure.
+
+output:
+------
+
+Records added to mongoDB instance.
+
+Returns count of records inserted. With unordered inserts, a failed
+record (e.g. a duplicate _id) does not stop the rest of its batch, and
+is simply left out of the returned count. Unacknowledged inserts can't
+report failures, so all records sent are counted.
+    '''
+
+    self.ensureIndexes(collection)
+    #   MongoDB doesn't permit bypassing document validation for
+    # unacknowledged writes, so that option is only used when safe.
+    insertOptions = {'ordered' : False}
+    if safe:
+      insertOptions['bypass_document_validation'] = True
+    else:
+      collection = collection.with_options(
+        write_concern = WriteConcern(w = 0))
+    inserted = 0
+    for start in range(0, len(records), batchSize):
+      batch = records[start:start + batchSize]
+      try:
+        collection.insert_many(batch, **insertOptions)
+        inserted += len(batch)
+      except pymongo.errors.BulkWriteError as bwe:
+        inserted += bwe.details['nInserted']
+    return inserted
+
+  # B14
+  def loadCleanFile(self, filePath):
+    '''Reads a cleaned GDELT file's records as MongoDB-ready dicts, used
+by mongoFile().
+
+Parameters:
+----------
+
+filePath - string
+  Full path to a cleaned file, in Parquet as written by cleanFile(), or
+in JSON (older cleaned files, newline-delimited or a single array).
+
+output:
+------
+
+Returns list of dicts, one per record. Datetimes are formatted as the
+ISO strings ('YYYY-MM-DDTHH:MM:SS.ffffffZ') GDELTeda expects in stored
+records.
+    '''
+
+    if filePath.endswith('.parquet'):
+      return self.arrowToRecords(
+        pq.read_table(filePath),
+        self.extensionToTableName(os.path.basename(filePath)))
+
+    with open(filePath, 'rb') as f:
+      data = f.read()
+    if data[:1] == b'[':
+      return orjson.loads(data)
+    return [orjson.loads(line) for line in data.splitlines() if line]
+
+  # B15
+  def ensureIndexes(self, collection):
+    '''Creates a collection's localDb['indexes'] index if not present,
+used by bulkInsert(). create_index() is a no-op for existing indexes, and
+realtime collections (dropped by GDELTeda.realtimeEDA()) are re-indexed
+on their next insert.
+
+Parameters:
+----------
+
+collection - pymongo.collection.Collection
+  One of the collections in localDb['collections'], its table name is
+taken from the last part of its name (e.g. 'GDELT.realtime.gkg').
+
+output:
+------
+
+Index created in mongoDB instance, or error printed if an existing
+index conflicts or existing records violate uniqueness.
+    '''
+
+    table = collection.name.split('.')[-1]
+    if table not in self.localDb['indexes']:
+      return
+    indexSpec = self.localDb['indexes'][table]
+    try:
+      collection.create_index(indexSpec['keys'], unique = indexSpec['unique'])
+    except pymongo.errors.OperationFailure as of:
+      print("Index creation failed for '%s': %s" % (collection.name, of))
+
+  # B16
+  def readRawFile(self, rawFilePath, table, verbose = False):
+    '''Reads a raw GDELT file to a Pandas dataframe while dropping unused
+columns, corrects field-type mapping, and parses fields when necessary.
+Used by cleanFile() and cleanMongoTable().
+
+Parameters:
+----------
+
+rawFilePath - string
+  Full path to a raw GDELT datafile.
+
+table - string
+  Must be one of ['events', 'gkg', 'mentions'], controls how the file
+will be parsed.
+
+verbose - boolean, default False
+  If true, prints conversions applied.
+
+output:
+------
+
+Returns the cleaned dataframe, or None if the file could not be parsed
+(see the GKG junk row notes below).
+    '''
+
+    #   Raw files are read with pyarrow's multithreaded CSV reader, which only
+    # materializes the reduced set of columns. GDELT files are unquoted and
+    # tab-delimited, and empty fields are read as nulls, as with read_csv.
+    #   The raw file is memory-mapped, so Arrow's reader tokenizes the OS page
+    # cache's copy of the file directly instead of first reading it into an
+    # intermediate buffer.
+    #   The Arrow table is converted one column block at a time, releasing
+    # each column's Arrow buffers as it goes, so the file's records aren't
+    # held in both Arrow and Pandas form at once.
+    try:
+      with pa.memory_map(rawFilePath, 'r') as rawSource:
+        cleanDF = pacsv.read_csv(
+          rawSource,
+          read_options = pacsv.ReadOptions(
+            column_names = self.toolData['names'][table]['original']),
+          parse_options = pacsv.ParseOptions(delimiter = '\t',
+                                             quote_char = False),
+          convert_options = pacsv.ConvertOptions(
+            include_columns = self.toolData['names'][table]['reduced'],
+            column_types = self.toolData['arrowTypes'][table],
+            strings_can_be_null = True),
+          ).to_pandas(split_blocks = True, self_destruct = True).astype(
+            self.toolData['columnTypes'][table])
+    except pa.ArrowInvalid:
+      #   Arrow rejects files with junk rows outright (see the dropna() note
+      # for GKG below), so those fall back to pandas' more forgiving reader.
+      cleanDF = pd.read_csv(rawFilePath, sep='\t',
+                           names = self.toolData['names'][table]['original'],
+                           usecols = self.toolData['names'][table]['reduced'],
+                           dtype = self.toolData['columnTypes'][table])
+
+    if table == 'gkg':
+      # GKG's subfield handling:
+      #     GKG record fields with subfield mappings require more in-depth
+      # handling, due to varying delineation among the fields, so each is
+      # parsed by its own conversion function after the file is read.
+      #     Location and count values are ';'-delimited lists of
+      # '#'-delimited segments, which repeat heavily across a file's records.
+      # Each distinct segment is split and type-converted column-wise, once,
+      # and the resulting dicts are shared between records.
+
+      # B16a
+      def subfieldSplitter(column):
+        '''conversion function for parsing location and count subfields,
+per toolData['subfields'][column]
+        '''
+        segmentLists = cleanDF[column].str.split(';').to_numpy()
+        segments = pd.Series(pd.Series(segmentLists).explode().dropna().unique(),
+                             dtype = object)
+        segmentDicts = {}
+        if len(segments) > 0:
+          parts = segments.str.split('#', expand = True)
+          fieldNames = []
+          fieldValues = []
+          for position, (fieldName, fieldType) in enumerate(
+            self.toolData['subfields'][column]):
+            fieldNames.append(fieldName)
+            if position not in parts.columns:
+              fieldValues.append([None] * len(segments))
+              continue
+            values = parts[position].to_numpy(dtype = object)
+            missing = pd.isnull(values) | (values == '')
+            if fieldType is int:
+              values = pd.to_numeric(np.where(missing, 0, values))
+              values = values.astype(np.int64).astype(object)
+            elif fieldType is float:
+              values = pd.to_numeric(np.where(missing, np.nan, values))
+              values = values.astype(object)
+            else:
+              #   String subfields (CountType, ObjectType, CountryCode, ...)
+              # have few distinct values, so they're factorized to share one
+              # string object per distinct value between segment dicts.
+              # Missing values' -1 codes pick the trailing None.
+              codes, uniques = pd.factorize(values)
+              values = np.append(np.asarray(uniques, dtype = object),
+                                 None)[codes]
+            values[missing] = None
+            fieldValues.append(values)
+          for segment, row in zip(segments, zip(*fieldValues)):
+            segmentDicts[segment] = dict(zip(fieldNames, row))
+        return [[segmentDicts[segment] for segment in segmentList]
+                if isinstance(segmentList, list) else None
+                for segmentList in segmentLists]
+
+      # B16b
+      def toneSplitter(column):
+        '''conversion function for parsing tone subfields, column-wise
+        '''
+        #   All records' ','-delimited values are split at once, and each
+        # value position is type-converted as a whole column, leaving only
+        # the assembly of each record's dict to Python. Records with fewer
+        # than 7 values get a dict of None values, as they always have.
+        toneKeys = ['Tone', 'Positive', 'Negative', 'Polarity', 'ARD',
+                    'SGRD', 'WordCount']
+        recordMissing = cleanDF[column].isna().to_numpy()
+        parts = cleanDF[column].str.split(',', expand = True)
+        if len(toneKeys) - 1 in parts.columns:
+          recordShort = parts[len(toneKeys) - 1].isna().to_numpy()
+        else:
+          recordShort = np.ones(len(parts), dtype = bool)
+        fieldValues = []
+        for position, toneKey in enumerate(toneKeys):
+          if position not in parts.columns:
+            fieldValues.append([None] * len(parts))
+            continue
+          values = parts[position].to_numpy(dtype = object)
+          missing = pd.isnull(values) | (values == '') | recordShort
+          if toneKey == 'WordCount':
+            values = pd.to_numeric(np.where(missing, 0, values))
+            values = values.astype(np.int64).astype(object)
+          else:
+            values = pd.to_numeric(np.where(missing, np.nan, values))
+            values = values.astype(object)
+          values[missing] = None
+          fieldValues.append(values)
+        del parts
+        return [None if isMissing else dict(zip(toneKeys, row))
+                for isMissing, row in zip(recordMissing, zip(*fieldValues))]
+
+      #   Themes, persons, and organizations are plain ';'-delimited lists,
+      # split column-wise with pandas' string methods. Nulls are filled with
+      # ' ' beforehand, which splits to the [' '] placeholder these fields
+      # have always been given, and only themes and persons drop a trailing
+      # empty entry.
+      for column in ['V1Themes', 'V1Persons']:
+        listColumn = cleanDF[column].fillna(' ').str.rstrip(';')
+        cleanDF[column] = listColumn.str.split(';')
+      listColumn = cleanDF['V1Organizations'].fillna(' ')
+      cleanDF['V1Organizations'] = listColumn.str.split(';')
+
+      for column in ['V1Locations', 'V1Counts']:
+        cleanDF[column] = subfieldSplitter(column)
+      cleanDF['V15Tone'] = toneSplitter('V15Tone')
+      if verbose:
+        print("applying: The Loc Per Org Ton Co ", end='')
+    else:
+      # events and mentions files handled here
+      if verbose:
+        print("applying: ", end='')
+    
+    # B16c - One-liner date conversion function for post-read_csv use
+    #   Converts a whole column at once; with an explicit format and caching,
+    # pandas parses each distinct timestamp string only once (15-minute files
+    # share very few distinct values) without per-row format inference.
+    dtConverter = lambda x: pd.to_datetime(x, format = "%Y%m%d%H%M%S",
+                                           cache = True)
+
+    # After catching strange occurrences of '#' in 'events' field values for
+    #  'Actor1/2Geo_Lat/Long', 'ActionGeo_Lat', 'ActionGeo_Long', now I've got
+    #  to catch and handle those cases, rare as they may be.
+    # B16d
+    def llConverter(x):
+      '''Catches and removes '#' values which happen to be messing up
+conversion to float for 'events' Latitude/Longitude field values.
+Converts an entire string column at once, nulls remaining NaN.
+      '''
+      x = x.str.replace('#', '', regex = False)
+      return pd.to_numeric(x.to_numpy(dtype = object, na_value = np.nan),
+                           errors = 'coerce')
+
+    # per-table post-read column conversions
+    if table == 'events':
+      if verbose:
+        print("Lat/Lon D.")
+      #   See description. All three Lat/Long pairs are taken from the
+      # ActionGeo columns, so each is converted only once and then shared.
+      # The converted columns are set with a single assign() call, rather
+      # than seven separate column replacements.
+      geoLat = llConverter(cleanDF['ActionGeo_Lat'])
+      geoLong = llConverter(cleanDF['ActionGeo_Long'])
+      cleanDF = cleanDF.assign(Actor1Geo_Lat = geoLat, Actor1Geo_Long = geoLong,
+                               Actor2Geo_Lat = geoLat, Actor2Geo_Long = geoLong,
+                               ActionGeo_Lat = geoLat, ActionGeo_Long = geoLong,
+                               DATEADDED = dtConverter(cleanDF["DATEADDED"]))
+      #   Events also requires parsing of various fields' coded values, though
+      # the increase in disk space and RAM required for expansion of those
+      # values into legible strings may be too much prior to EDA
+
+    elif table == 'gkg':
+      if verbose:
+        print("D.")
+      try:
+        #   This dropna is unfortunately necessary due to GKG's V2EXTRASXML
+        # field values occasionally mixing newline characters into the
+        # PAGE_LINKS subfield, albeit only rarely, resulting in junk rows that
+        # Pandas is apparently failing to discard...
+        cleanDF = cleanDF.dropna(axis = 0, thresh = 5)
+        #   Even this dropna() has no apparent effect, as this line's raised
+        # exception reveals junk rows in almost 20 files across the 31 day test
+        # batch. 20 out of 2758 GKG giles (8274 across all tables) isn't that
+        # bad, so I've corrected the junk rows by hand.
+        cleanDF["V21DATE"] = dtConverter(cleanDF["V21DATE"])
+        #   My apologies for not properly handling this rare bug-case on the
+        # part of that specific portion of GKG record formatting. The field
+        # isn't even providing any tangible value, given its description...
+      except ValueError as e:
+        print("Error: %s" % (e))
+        return None
+
+    elif table == 'mentions':
+      if verbose:
+        print("ETD/MTD.")
+      cleanDF = cleanDF.assign(
+        EventTimeDate = dtConverter(cleanDF["EventTimeDate"]),
+        MentionTimeDate = dtConverter(cleanDF["MentionTimeDate"]))
+
+    return cleanDF
+
+  # B17
+  def arrowToRecords(self, arrowTable, table):
+    '''Converts a cleaned table's Arrow records to MongoDB-ready dicts,
+used by loadCleanFile() and cleanMongoTable().
+
+Parameters:
+----------
+
+arrowTable - pyarrow.Table
+  Cleaned records, as read from a cleaned Parquet file or converted from
+a cleaned dataframe.
+
+table - string
+  Must be one of ['events', 'gkg', 'mentions'], selects the record
+builder used when the columns match the table's reduced columns.
+
+output:
+------
+
+Returns list of dicts, one per record. Datetimes are formatted as the
+ISO strings ('YYYY-MM-DDTHH:MM:SS.ffffffZ') GDELTeda expects in stored
+records.
+    '''
+
+    columns = {}
+    for name, column in zip(arrowTable.column_names, arrowTable.columns):
+      #   Repeated values are converted once and shared between records:
+      # dictionary-encoded (categorical) columns map their indices onto a
+      # once-decoded dictionary, and each distinct timestamp is formatted
+      # to its ISO string only once.
+      if pa.types.is_dictionary(column.type):
+        values = []
+        for chunk in column.chunks:
+          dictionary = chunk.dictionary.to_pylist()
+          values.extend(None if index is None else dictionary[index]
+                        for index in chunk.indices.to_pylist())
+      elif pa.types.is_timestamp(column.type):
+        values = column.to_pylist()
+        isoStrings = {None : None}
+        for value in set(values):
+          if value is not None:
+            isoStrings[value] = value.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        values = [isoStrings[value] for value in values]
+      else:
+        values = column.to_pylist()
+      columns[name] = values
+    names = list(columns)
+    rows = zip(*columns.values())
+    if names == self.toolData['names'][table]['reduced']:
+      return list(map(self.toolData['rowBuilder'][table], rows))
+    return [dict(zip(names, row)) for row in rows]
+
+  # B18
+  def cleanMongoTable(self, table, verbose = False, safe = False):
+    '''Iterates over all local 'raw' files present for a table, parsing
+and cleaning each, then inserts its records directly into MongoDB without
+writing a cleaned file. For use when files are exported right after they
+are downloaded, cleanTable() and mongoTable() remain for cleaning now and
+exporting later.
+
+Parameters:
+----------
+
+table - string
+  Must be one of ['events', 'gkg', 'mentions'], controls how files will
+be parsed and what collection records are exported to.
+
+verbose - boolean, default False
+  Controls printed output, default prints counts for files and records
+exported. If true, prints each fileName, conversions applied, and count
+of records exported.
+
+safe - boolean, default False
+  Passed to bulkInsert(), default False sends unacknowledged writes.
+
+output:
+------
+
+Records added to mongoDB instance.
+
+See parameter description for 'verbose' for printed output.
+    '''
+
+    if table not in ['events', 'gkg', 'mentions']:
+      print("Bad 'table' value, specify one of 'events', 'gkg', 'mentions'.")
+      return
+    timecheck = perf_counter_ns()
+    totalFiles = 0
+    totalRecords = 0
+    print("Cleaning and exporting %d raw '%s' files to MongoDB..." % \
+          (len(self.localFiles[table]['raw']), table))
+    for fileName in sorted(self.localFiles[table]['raw']):
+      if verbose:
+        print("  %s : " % (fileName), end='')
+      cleanDF = self.readRawFile(
+        os.path.join(self.toolData['path'][table]['raw'], fileName), table,
+        verbose)
+      if cleanDF is None:
+        continue
+      #   The same Arrow conversion as writing and re-reading a cleaned
+      # Parquet file, so records match those exported by mongoTable().
+      exportData = self.arrowToRecords(
+        pa.Table.from_pandas(cleanDF, preserve_index = False), table)
+      #   Each file's dataframe and records are released as soon as they're
+      # done with, rather than held until the next file's replace them, and
+      # any reference cycles left by pandas are collected between files.
+      del cleanDF
+      if len(exportData) < 1:
+        continue
+      try:
+        recordsCount = self.bulkInsert(self.localDb['collections'][table],
+                                       exportData, safe = safe)
+      except pymongo.errors.ServerSelectionTimeoutError as sste:
+        print(sste)
+        return
+      del exportData
+      gc.collect()
+      if verbose:
+        print("  %d records exported." % (recordsCount))
+      totalFiles += 1
+      totalRecords += recordsCount
+    print("MongoDB import complete,",
+          "%d files with %d records added to table '%s' (%0.3f seconds)" % \
+          (totalFiles, totalRecords, table,
+           (perf_counter_ns() - timecheck) / 1e9))
 
 # C00
 # in-design iterative testing with direct execution
@@ -1478,7 +1855,7 @@ if __name__ == "__main__":
 
   # Use case: you need to download, preprocess, and store a lot of GDELT data.
 
-  # Downloading up to 93 datafiles per-table, per-day:
+  # Downloading up to 96 datafiles per-table, per-day:
 
   print("\nTesting downloadGDELTDay()...")
 
@@ -1486,7 +1863,7 @@ if __name__ == "__main__":
   Gbase.downloadGDELTDay('2021/06/25', 'gkg')
   Gbase.downloadGDELTDay('2021/06/25', 'mentions')
 
-  # Automatically cleaning raw GDELT records to JSON files for export:
+  # Automatically cleaning raw GDELT records to Parquet files for export:
 
   print("\nTesting cleanTable()...")
 
@@ -1524,26 +1901,19 @@ if __name__ == "__main__":
   # found in the appropriate project directory.
   eFN = '20210513220000.export.CSV'
 
-  os.chdir(Gbase.toolData['path']['events']['raw'])
-
   print("Testing file cleaning for events...")
 
   Gbase.cleanFile(eFN)
 
-  os.chdir(Gbase.toolData['path']['events']['clean'])
-
   print("Reading cleaned file...\n")
 
-  eDf = pd.read_csv(
-    eFN, sep = '\t', dtype = Gbase.toolData['columnTypes']['events'],
-    converters = {'DATEADDED': (lambda x: pd.to_datetime(str(x),
-                                                         format="%Y%m%d%H%M%S",
-                                                         errors='ignore'))}
-    )
+  eDf = pd.read_parquet(os.path.join(
+    Gbase.toolData['path']['events']['clean'],
+    eFN.replace('.CSV', '.parquet')))
 
   print("Checking re-read cleaned file column datatypes...\n")
 
-  pp(eDf.dtypes)
+  print(eDf.dtypes)
 
   print("")
 
@@ -1551,11 +1921,11 @@ if __name__ == "__main__":
 
   print("Record 0:")
 
-  pp(eDict[0])
+  print(eDict[0])
 
   print("Record 1:")
 
-  pp(eDict[1])
+  print(eDict[1])
 
   
   print("\n------------------------------------------------------------------")
@@ -1566,26 +1936,19 @@ if __name__ == "__main__":
   # found in the appropriate project directory.
   gFN = '20210513220000.gkg.csv'
 
-  os.chdir(Gbase.toolData['path']['gkg']['raw'])
-
   print("Testing file cleaning for gkg...")
 
   Gbase.cleanFile(gFN)
 
-  os.chdir(Gbase.toolData['path']['gkg']['clean'])
-
   print("Reading cleaned file...\n")
 
-  gDf = pd.read_csv(
-    gFN, sep = '\t', dtype = Gbase.toolData['columnTypes']['gkg'],
-    converters = {'V21DATE': (lambda x: pd.to_datetime(str(x),
-                                                         format="%Y%m%d%H%M%S",
-                                                         errors='ignore'))}
-    )
+  gDf = pd.read_parquet(os.path.join(
+    Gbase.toolData['path']['gkg']['clean'],
+    gFN.replace('.csv', '.parquet')))
 
   print("Checking re-read cleaned file column datatypes...\n")
 
-  pp(gDf.dtypes)
+  print(gDf.dtypes)
 
   print("")
 
@@ -1593,11 +1956,11 @@ if __name__ == "__main__":
 
   print("Record 0:")
 
-  pp(gDict[0])
+  print(gDict[0])
 
   print("Record 1:")
 
-  pp(gDict[1])
+  print(gDict[1])
 
 
   print("\n------------------------------------------------------------------")
@@ -1608,29 +1971,19 @@ if __name__ == "__main__":
   # found in the appropriate project directory.
   mFN = '20210513220000.mentions.CSV'
 
-  os.chdir(Gbase.toolData['path']['mentions']['raw'])
-  
   print("Testing file cleaning for mentions...")
   
   Gbase.cleanFile(mFN)
   
-  os.chdir(Gbase.toolData['path']['mentions']['clean'])
-  
   print("Reading cleaned file...\n")
   
-  mDf = pd.read_csv(
-    mFN, sep = '\t', dtype = Gbase.toolData['columnTypes']['mentions'],
-    converters = {'EventTimeDate': (lambda x: pd.to_datetime(str(x),
-                                                         format="%Y%m%d%H%M%S",
-                                                         errors='ignore')),
-                  'MentionTimeDate': (lambda x: pd.to_datetime(str(x),
-                                                         format="%Y%m%d%H%M%S",
-                                                         errors='ignore'))}
-    )
+  mDf = pd.read_parquet(os.path.join(
+    Gbase.toolData['path']['mentions']['clean'],
+    mFN.replace('.CSV', '.parquet')))
   
   print("Checking re-read cleaned file column datatypes...\n")
   
-  pp(mDf.dtypes)
+  print(mDf.dtypes)
   
   print("")
   
@@ -1638,11 +1991,11 @@ if __name__ == "__main__":
   
   print("Record 0:")
   
-  pp(mDict[0])
+  print(mDict[0])
   
   print("Record 1:")
   
-  pp(mDict[1])
+  print(mDict[1])
 
   print("\n------------------------------------------------------------------")
 
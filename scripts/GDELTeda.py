@@ -12,25 +12,17 @@ section # C00 and running this script directly.
   Primary member functions include descriptive docstrings for their intent and
 use.
 
-  WARNING: project file operations are based on relative pathing from the
+  WARNING: project file operations are based on pathing relative to the
 'scripts' directory this Python script is located in, given the creation of
 directories 'GDELTdata' and 'EDAlogs' parallel to 'scripts' upon first
-GDELTbase and GDELTeda class initializations. If those directories are not
-already present, a fallback method for string-literal directory reorientation
-may be found in '__init__()' at this tag: # A02b - Project directory path.
-Specification for any given user's main project directory should be made for
-that os.chdir() call.
-See also GDELTbase.py, tag # A01a - backup path specification, as any given
-user's project directory must be specified there, also.
+GDELTbase and GDELTeda class initializations. All paths are absolute, so
+neither class changes the working directory.
 
 Contents:
   A00 - GDELTeda
     A01 - shared class data
     A02 - __init__ with instanced data
       A02a - Project directory maintenance
-      A02b - Project directory path specification
-      Note: Specification at A02b should be changed to suit a user's desired
-              directory structure, given their local filesystem.
   B00 - class methods
     B01 - batchEDA()
     B02 - eventsBatchEDA()
@@ -39,6 +31,13 @@ Contents:
       Note: see GDELTedaGKGhelpers.py for helper function code & docs
     B05 - realtimeEDA()
     B06 - loopEDA()
+    B07 - cursorToDataFrame()
+    B08 - pinWorker()
+    B09 - batchCachePath()
+    B10 - writeArrowFile()
+    B11 - parseDatetimes()
+    B12 - ingestRealtimeFile()
+    B13 - waitUntil()
   C00 - main w/ testing
     C01 - previously-run GDELT realtime EDA testing
 '''
@@ -48,17 +47,16 @@ import multiprocessing
 import numpy as np
 import os
 import pandas as pd
-import pymongo
+import pyarrow as pa
 import shutil
-import wget
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from GDELTbase import GDELTbase
 from GDELTedaGKGhelpers import GDELTedaGKGhelpers
 from pandas_profiling import ProfileReport
 from pprint import pprint as pp
-from time import time, sleep
-from urllib.error import HTTPError
-from zipfile import ZipFile as zf
+from time import perf_counter_ns, sleep
 
 # A00
 class GDELTeda:
@@ -68,13 +66,23 @@ subsets and performing semi-automated EDA.
 Shared class data:
 -----------------
 
+scriptPath - string
+  Absolute path of the directory holding this script.
+
 logPath - dict
   Various os.path objects for EDA log storage.
 
 configFilePaths - dict
   Various os.path objects for pandas_profiling.ProfileReport
- configuration files, copied to EDA log storage directories upon
- __init__, for use in report generation.
+ configuration files, hardlinked (or copied, failing that) to EDA log
+ storage directories upon __init__, for use in report generation.
+
+columnTypes - dict
+  Per-table dtypes applied by eventsBatchEDA() and mentionsBatchEDA().
+
+realtimeSchedule - dict
+  (hour, minute) UTC slots mapped to the wait until the next datafile
+ and whether that wait spans the 22:45 to 00:00 gap, for realtimeEDA().
    
 Instanced class data:
 --------------------
@@ -92,12 +100,17 @@ mentionsBatchEDA()
 gkgBatchEDA()
 realtimeEDA()
 loopEDA()
+cursorToDataFrame()
+pinWorker()
+batchCachePath()
+writeArrowFile()
+parseDatetimes()
+ingestRealtimeFile()
+waitUntil()
 
 Helper functions from GDELTedaGKGhelpers.py used in gkgBatchEDA():
   pullMainGKGcolumns()
-  applyDtypes()
-  convertDatetimes()
-  convertGKGV15Tone()
+  prepareGKG()
   mainReport()
   locationsReport()
   countsReport()
@@ -110,11 +123,11 @@ Helper functions from GDELTedaGKGhelpers.py used in gkgBatchEDA():
 
   #  These paths are set relative to the location of this script, one directory
   # up and in 'EDAlogs' parallel to the script directory, which can be named
-  # arbitrarily.
+  # arbitrarily. As in GDELTbase, they're resolved once from __file__, so they
+  # don't depend on the current working directory.
+  scriptPath = str(Path(__file__).resolve().parent)
   logPath = {}
-  logPath['base'] = os.path.join(os.path.abspath(__file__),
-                                 os.path.realpath('..'),
-                                 'EDAlogs')
+  logPath['base'] = str(Path(scriptPath).parent / 'EDAlogs')
   logPath['events'] = {}
   logPath['events'] = {
     'table' : os.path.join(logPath['base'], 'events'),
@@ -134,9 +147,8 @@ Helper functions from GDELTedaGKGhelpers.py used in gkgBatchEDA():
 
   #   Turns out, the following isn't the greatest way of keeping track
   # of each configuration file. It's easiest to just leave them in the
-  # exact directories where ProfileReport.to_html() is aimed (via
-  # os.chdir()), since it's pesky maneuvering outside parameters into
-  # multiprocessing Pool.map() calls.
+  # exact directories where ProfileReport.to_file() is aimed, since it's
+  # pesky maneuvering outside parameters into multiprocessing Pool calls.
   #   Still, these can and are used in realtimeEDA(), since the size of
   # just the most recent datafiles should permit handling them without
   # regard for Pandas DataFrame RAM impact (it's greedy, easiest method
@@ -146,82 +158,94 @@ Helper functions from GDELTedaGKGhelpers.py used in gkgBatchEDA():
   # files to their appropriate directories for use, given base-copies
   # present in the 'scripts' directory. Those base copies may be edited
   # in 'scripts', since each file will be copied from there.
+  #   File names follow 'GDELT<table>EDAconfig_<mode>.yaml', with GKG's
+  # report name in place of its table name, e.g.
+  # 'GDELTgkgLocationsEDAconfig_batch.yaml'.
   configFilePaths = {}
-  configFilePaths['events'] = {
-    'batch'    : os.path.join(logPath['base'],
-                              os.path.realpath('..'),
-                              'scripts',
-                              "GDELTeventsEDAconfig_batch.yaml"),
-    'realtime' : os.path.join(logPath['base'],
-                              os.path.realpath('..'),
-                              'scripts',
-                              "GDELTeventsEDAconfig_realtime.yaml"),
-    }
-
-  configFilePaths['mentions'] = {
-    'batch'    : os.path.join(logPath['base'],
-                              os.path.realpath('..'),
-                              'scripts',
-                              "GDELTmentionsEDAconfig_batch.yaml"),
-    'realtime' : os.path.join(logPath['base'],
-                              os.path.realpath('..'),
-                              'scripts',
-                              "GDELTmentionsEDAconfig_realtime.yaml"),
-    }
+  for configTable in ['events', 'mentions']:
+    configFilePaths[configTable] = {}
+    for configMode in ['batch', 'realtime']:
+      configFilePaths[configTable][configMode] = os.path.join(scriptPath,
+        "GDELT%sEDAconfig_%s.yaml" % (configTable, configMode))
   configFilePaths['gkg'] = {}
-  configFilePaths['gkg']['batch'] = {
-    'main'          : os.path.join(logPath['base'],
-                                  os.path.realpath('..'),
-                                  'scripts',
-                                  "GDELTgkgMainEDAconfig_batch.yaml"),
-    'locations'     : os.path.join(logPath['base'],
-                                  os.path.realpath('..'),
-                                  'scripts',
-                               "GDELTgkgLocationsEDAconfig_batch.yaml"),
-    'counts'        : os.path.join(logPath['base'],
-                                   os.path.realpath('..'),
-                                   'scripts',
-                                  "GDELTgkgCountsEDAconfig_batch.yaml"),
-    'themes'        : os.path.join(logPath['base'],
-                                   os.path.realpath('..'),
-                                   'scripts',
-                                  "GDELTgkgThemesEDAconfig_batch.yaml"),
-    'persons'       : os.path.join(logPath['base'],
-                                   os.path.realpath('..'),
-                                   'scripts',
-                                 "GDELTgkgPersonsEDAconfig_batch.yaml"),
-    'organizations' : os.path.join(logPath['base'],
-                                   os.path.realpath('..'),
-                                   'scripts',
-                           "GDELTgkgOrganizationsEDAconfig_batch.yaml"),
+  for configMode in ['batch', 'realtime']:
+    configFilePaths['gkg'][configMode] = {}
+    for configReport in ['main', 'locations', 'counts', 'themes', 'persons',
+                         'organizations']:
+      configFilePaths['gkg'][configMode][configReport] = os.path.join(
+        scriptPath, "GDELTgkg%sEDAconfig_%s.yaml" % (configReport.capitalize(),
+                                                     configMode))
+  del configTable, configMode, configReport
+
+  #   dtypes for eventsBatchEDA() and mentionsBatchEDA(), applied to records
+  # pulled from MongoDB. Built once here, rather than on each call. Narrow
+  # numeric types, and categories for low-cardinality codes, as in GDELTbase
+  # columnTypes. Every column is walked several times by ProfileReport(), so
+  # smaller columns make for faster reports. Lat/Long values are stored as
+  # floats in MongoDB after cleaning.
+  #   Datetime fields are left out, since they're converted directly from
+  # their ISO strings with pd.to_datetime().
+  columnTypes = {}
+  columnTypes['events'] = {
+    'GLOBALEVENTID' : np.int64,
+    'Actor1Code': pd.StringDtype(),
+    'Actor1Name': pd.StringDtype(),
+    'Actor1CountryCode': 'category',
+    'Actor1Type1Code' : 'category',
+    'Actor1Type2Code' : 'category',
+    'Actor1Type3Code' : 'category',
+    'Actor2Code': pd.StringDtype(),
+    'Actor2Name': pd.StringDtype(),
+    'Actor2CountryCode': 'category',
+    'Actor2Type1Code' : 'category',
+    'Actor2Type2Code' : 'category',
+    'Actor2Type3Code' : 'category',
+    'IsRootEvent': np.bool_,
+    'EventCode': 'category',
+    'EventBaseCode': 'category',
+    'EventRootCode': 'category',
+    'QuadClass': np.int8,
+    'AvgTone': np.float32,
+    'Actor1Geo_Type': np.int8,
+    'Actor1Geo_FullName': pd.StringDtype(),
+    'Actor1Geo_Lat': np.float32,
+    'Actor1Geo_Long': np.float32,
+    'Actor2Geo_Type': np.int8,
+    'Actor2Geo_FullName': pd.StringDtype(),
+    'Actor2Geo_Lat': np.float32,
+    'Actor2Geo_Long': np.float32,
+    'ActionGeo_Type': np.int8,
+    'ActionGeo_FullName': pd.StringDtype(),
+    'ActionGeo_Lat': np.float32,
+    'ActionGeo_Long': np.float32,
+    'SOURCEURL': pd.StringDtype(),
     }
-  configFilePaths['gkg']['realtime'] = {
-    'main'          : os.path.join(logPath['base'],
-                                   os.path.realpath('..'),
-                                   'scripts',
-                                   "GDELTgkgMainEDAconfig_realtime.yaml"),
-    'locations'     : os.path.join(logPath['base'],
-                                   os.path.realpath('..'),
-                                   'scripts',
-                                   "GDELTgkgLocationsEDAconfig_realtime.yaml"),
-    'counts'        : os.path.join(logPath['base'],
-                                   os.path.realpath('..'),
-                                   'scripts',
-                                   "GDELTgkgCountsEDAconfig_realtime.yaml"),
-    'themes'        : os.path.join(logPath['base'],
-                                   os.path.realpath('..'),
-                                   'scripts',
-                                   "GDELTgkgThemesEDAconfig_realtime.yaml"),
-    'persons'       : os.path.join(logPath['base'],
-                                   os.path.realpath('..'),
-                                   'scripts',
-                                   "GDELTgkgPersonsEDAconfig_realtime.yaml"),
-    'organizations' : os.path.join(logPath['base'],
-                                   os.path.realpath('..'),
-                                   'scripts',
-                               "GDELTgkgOrganizationsEDAconfig_realtime.yaml"),
+  columnTypes['mentions'] = {
+    'GLOBALEVENTID' : np.int64,
+    'MentionType' : 'category',
+    'MentionSourceName' : pd.StringDtype(),
+    'MentionIdentifier' : pd.StringDtype(),
+    'InRawText' : np.bool_,
+    'Confidence' : np.int8,
+    'MentionDocTone' : np.float32,
     }
 
+  #   Realtime datafile schedule for realtimeEDA(), keyed by (hour, minute)
+  # of each of the day's 96 quarter-hour UTC slots. Values are the timedelta
+  # to the next datafile and whether that wait spans the gap in datafiles
+  # past 10:45pm UTC, until 12:00am UTC (1 hour 15 minutes). Built once
+  # here, so the next update time is a lookup, rather than a branch on the
+  # hour of each iteration's next datetime.
+  realtimeSchedule = {}
+  for slotMinutes in range(0, 1440, 15):
+    if slotMinutes < 1365:
+      realtimeSchedule[divmod(slotMinutes, 60)] = (timedelta(minutes = 15),
+                                                   False)
+    else:
+      realtimeSchedule[divmod(slotMinutes, 60)] = (
+        timedelta(minutes = 1440 - slotMinutes), True)
+  del slotMinutes
+
   # A02
   def __init__(self, tableList = ['events', 'mentions', 'gkg']):
     '''GDELTeda class initialization, takes a list of GDELT tables to
@@ -275,85 +299,68 @@ output:
     print("  Checking log directory...")
     if not os.path.isdir(self.logPath['base']):
       print("    Doesn't exist! Making...")
-      # A02b - Project directory path
-      #   For obvious reasons, any user of this script should change this
-      # string to suit their needs. The directory described with this string
-      # should be one directory above the location of the 'scripts' directory
-      # this file should be in. If this file is not in 'scripts', unpredictable
-      # behavior may occur, and no guarantees of functionality are intended for
-      # such a state.
-      os.chdir('C:\\Users\\urf\\Projects\\WGU capstone')
       os.mkdir(self.logPath['base'])
     for table in tableList:
-      # switch to EDAlogs directory
-      os.chdir(self.logPath['base'])
       # Branch: table subdirectories not found, create all
       if not os.path.isdir(self.logPath[table]['table']):
         print("Did not find .../EDAlogs/", table, "...")
         print("  Creating .../EDAlogs/", table, "...")
         os.mkdir(self.logPath[table]['table'])
-        os.chdir(self.logPath[table]['table'])
         print("  Creating .../EDAlogs/", table, "/batch")
         os.mkdir(self.logPath[table]['batch'])
         print("  Creating .../EDAlogs/", table, "/realtime")
         os.mkdir(self.logPath[table]['realtime'])
-        os.chdir(self.logPath[table]['realtime'])
       #   Branch: table subdirectories found, create batch/realtime directories
       # if not present.
       else:
         print("  Found .../EDAlogs/", table,"...")
-        os.chdir(self.logPath[table]['table'])
         if not os.path.isdir(self.logPath[table]['batch']):
           print("    Did not find .../EDAlogs/", table, "/batch , creating...")
           os.mkdir(self.logPath[table]['batch'])
         if not os.path.isdir(self.logPath[table]['realtime']):
           print("    Did not find .../EDAlogs/", table, "/realtime , creating...")
           os.mkdir(self.logPath[table]['realtime'])
-          os.chdir(self.logPath[table]['realtime'])
-      # Copying pandas_profiling.ProfileReport configuration files
-      print("  Copying configuration files...\n")
-      if table == 'gkg':
-        #   There's a lot of these, but full normalization of GKG is
-        # prohibitively RAM-expensive, so reports need to be generated for
-        # both the main columns and the main columns normalized for each
-        # variable-length subfield.
-        shutil.copy(self.configFilePaths[table]['realtime']['main'],
-                    self.logPath[table]['realtime'])
-        shutil.copy(self.configFilePaths[table]['realtime']['locations'],
-                    self.logPath[table]['realtime'])
-        shutil.copy(self.configFilePaths[table]['realtime']['counts'],
-                    self.logPath[table]['realtime'])
-        shutil.copy(self.configFilePaths[table]['realtime']['themes'],
-                    self.logPath[table]['realtime'])
-        shutil.copy(self.configFilePaths[table]['realtime']['persons'],
-                    self.logPath[table]['realtime'])
-        shutil.copy(self.configFilePaths[table]['realtime']['organizations'],
-                    self.logPath[table]['realtime'])
-        os.chdir(self.logPath[table]['batch'])
-        shutil.copy(self.configFilePaths[table]['batch']['main'],
-                    self.logPath[table]['batch'])
-        shutil.copy(self.configFilePaths[table]['batch']['locations'],
-                    self.logPath[table]['batch'])
-        shutil.copy(self.configFilePaths[table]['batch']['counts'],
-                    self.logPath[table]['batch'])
-        shutil.copy(self.configFilePaths[table]['batch']['themes'],
-                    self.logPath[table]['batch'])
-        shutil.copy(self.configFilePaths[table]['batch']['persons'],
-                    self.logPath[table]['batch'])
-        shutil.copy(self.configFilePaths[table]['batch']['organizations'],
-                    self.logPath[table]['batch'])
-      else:
-        shutil.copy(self.configFilePaths[table]['realtime'],
-                    self.logPath[table]['realtime'])
-        os.chdir(self.logPath[table]['batch'])
-        shutil.copy(self.configFilePaths[table]['batch'],
-                    self.logPath[table]['batch'])
+      # Linking pandas_profiling.ProfileReport configuration files
+      print("  Linking configuration files...\n")
+      #   There's a lot of these for GKG, but full normalization of GKG is
+      # prohibitively RAM-expensive, so reports need to be generated for
+      # both the main columns and the main columns normalized for each
+      # variable-length subfield.
+      configCopies = []
+      for mode in ['batch', 'realtime']:
+        if table == 'gkg':
+          for report in self.configFilePaths[table][mode]:
+            configCopies.append((self.configFilePaths[table][mode][report],
+                                 self.logPath[table][mode]))
+        else:
+          configCopies.append((self.configFilePaths[table][mode],
+                               self.logPath[table][mode]))
+      #   Hardlinks share the base copy's blocks rather than re-writing
+      # every file on each instantiation. A link already in place is left
+      # alone, but a stale copy (or a link broken by an editor saving a new
+      # file over the base copy) is replaced. shutil.copy() remains as the
+      # fallback for filesystems or devices that won't take a hardlink.
+      for source, destination in configCopies:
+        destination = os.path.join(destination, os.path.basename(source))
+        if os.path.exists(destination):
+          if os.path.samefile(source, destination):
+            continue
+          os.remove(destination)
+        try:
+          os.link(source, destination)
+        except OSError:
+          shutil.copy(source, destination)
+      #   Collections stored before GDELTbase began indexing them won't have
+      # the datetime-led indexes batch EDA hints on for 'dateRange' queries.
+      # ensureIndexes() is a no-op where the index already exists.
+      self.gBase.ensureIndexes(self.gBase.localDb['collections'][table])
 
 
   # B00 - class methods
 
   # B01
-  def batchEDA(self, tableList = ['events','mentions','gkg']):
+  def batchEDA(self, tableList = ['events','mentions','gkg'],
+               dateRange = None, renderHTML = False, useCache = True):
     '''Reshapes and re-types GDELT records for generating Pandas
 Profiling ProfileReport()-automated, simple EDA reports from Pandas
 DataFrames, from MongoDB-query-cursors.
@@ -361,9 +368,9 @@ DataFrames, from MongoDB-query-cursors.
 WARNING: extremely RAM, disk I/O, and processing intensive. Be aware of
 what resources are available for these operations at runtime.
 
-  Relies on Python multiprocessing.Pool.map() calls against class member
+  Relies on Python multiprocessing.Pool.apply() calls against class member
 functions eventsBatchEDA() and mentionsBatchEDA(), and a regular call on
-gkgBatchEDA(), which uses multiprocessing.Pool.map() calls within it.
+gkgBatchEDA(), which uses multiprocessing.Pool calls within it.
 
 Parameters:
 ----------
@@ -371,12 +378,26 @@ Parameters:
 tableList - list of strings, default ['events','mentions','gkg']
   Permits limiting analysis to one or more tables.
 
+dateRange - tuple of two strings, default None
+  Passed to eventsBatchEDA() and mentionsBatchEDA(), see those functions.
+
+useCache - Boolean, default True
+  Passed to eventsBatchEDA(), mentionsBatchEDA(), and gkgBatchEDA(), see
+ those functions.
+
+renderHTML - Boolean, default False
+  Batch reports are saved as JSON and as ProfileReport dumps ('.pp'),
+ see GDELTedaGKGhelpers.saveReport(). If True, each table's dumps without
+ an html document are rendered to html after its EDA, each in its own
+ worker process.
+
 Output:
 ------
 
   Displays progress through the function's operations via console output
- while producing Pandas Profiling ProfileReport.to_file() html documents
- for 
+ while producing Pandas Profiling ProfileReport JSON documents and dumps,
+ and html documents if 'renderHTML' is True, for each table in
+ 'tableList', in that table's batch EDAlogs directory.
     '''
     if tableList != self.tableList:
       print("\n  Error: this GDELTeda object may have been initialized\n",
@@ -384,6 +405,17 @@ Output:
             "        required for this function's operations.\n",
             "        Please check GDELTeda parameters and try again.")
 
+    #   Events and Mentions EDA, and html rendering, each run in the one
+    # worker of a single pool kept for the whole batch, rather than a new
+    # pool per call. 'maxtasksperchild = 1' still gives each call a fresh
+    # worker, with all memory it held released when it finishes, which is
+    # the point of running them outside this process. The function itself
+    # is passed, not its result, so that it runs in the worker process.
+    # 'spawn' gives each worker a fresh interpreter rather than a fork of
+    # this one.
+    isolationPool = multiprocessing.get_context('spawn').Pool(
+      1, maxtasksperchild = 1)
+
     for table in tableList:
       
       print("\n------------------------------------------------------------\n")
@@ -393,19 +425,17 @@ Output:
       #  WARNING: RAM, PROCESSING, and DISK I/O INTENSIVE
       #  Events and Mentions are both much easier to handle than GKG, so
       # they're called in their own collective function threads with
-      # multiprocessing.Pool(1).map().
+      # isolationPool.apply(), see above.
       if table == 'events':
-        os.chdir(self.logPath['events']['batch'])
-        pool = multiprocessing.Pool(1)
-        eventsReported = pool.map(self.eventsBatchEDA(), ['batch'])
-        pool.close()
-        pool.join()
+        eventsReported = isolationPool.apply(GDELTeda.eventsBatchEDA,
+                                             ('batch',),
+                                             {'dateRange' : dateRange,
+                                              'useCache'  : useCache})
       if table == 'mentions':
-        os.chdir(self.logPath['mentions']['batch'])
-        pool = multiprocessing.Pool(1)
-        mentionsReported = pool.map(self.mentionsBatchEDA(), ['batch'])
-        pool.close()
-        pool.join()
+        mentionsReported = isolationPool.apply(GDELTeda.mentionsBatchEDA,
+                                               ('batch',),
+                                               {'dateRange' : dateRange,
+                                                'useCache'  : useCache})
       if table == 'gkg':
         #   Here's the GKG bottleneck! Future investigation of parallelization
         # improvements may yield gains here, as normalization of all subfield
@@ -416,11 +446,25 @@ Output:
         # gkgBatchEDA() execution, forcing deallocation of those resources upon
         # each Pool.close(), as with Events and Mentions table operations above
         # which themselves do not require any additional subfield handling.
-        os.chdir(self.logPath['gkg']['batch'])
-        self.gkgBatchEDA()
+        self.gkgBatchEDA(useCache = useCache)
+
+      #   html rendering holds a copy of the full report in memory, so each
+      # report is rendered in its own process, after all others are done.
+      if renderHTML:
+        for fileName in sorted(os.listdir(self.logPath[table]['batch'])):
+          dumpPath = os.path.join(self.logPath[table]['batch'], fileName)
+          if not fileName.endswith('.pp') or \
+             os.path.isfile(dumpPath.replace('.pp', '.html')):
+            continue
+          print("  Rendering", fileName, "to html...")
+          isolationPool.apply(GDELTedaGKGhelpers.renderReport, (dumpPath,))
+
+    isolationPool.close()
+    isolationPool.join()
 
   # B02
-  def eventsBatchEDA(mode):
+  def eventsBatchEDA(mode, sampleRows = 500000, dateRange = None,
+                     useCache = True):
     '''Performs automatic EDA on GDELT Events record subsets. See
  function batchEDA() for "if table == 'events':" case handling and how
  this function is invoked as a multiprocessing.Pool.map() call, intended
@@ -440,6 +484,21 @@ mode - arbitrary
  parameter determined by map(), e.g. one iteration of the function will
  execute.
 
+sampleRows - int or None, default 500000
+  Maximum records passed to ProfileReport(). Larger subsets are sampled,
+ with full-subset summary statistics written alongside the report. See
+ GDELTedaGKGhelpers.sampleForReport().
+
+dateRange - tuple of two strings, default None
+  Start (inclusive) and end (exclusive) of 'DATEADDED' values for records
+ to be pulled, in ISO format, e.g. ('2020-05-24', '2020-06-23'). If None,
+ all records in the collection are pulled.
+
+useCache - Boolean, default True
+  If True, records are read from this 'dateRange''s Parquet cache in the
+ batch log directory when present, rather than from MongoDB. The cache
+ is (re)written after every MongoDB pull. See batchCachePath().
+
 Output:
 ------
 
@@ -447,137 +506,121 @@ Output:
 and function generates EDA profile html documents in appropriate project
 directories.
     '''
-    columnNames = [
-      'GLOBALEVENTID',
-      'Actor1Code',
-      'Actor1Name',
-      'Actor1CountryCode',
-      'Actor1Type1Code',
-      'Actor1Type2Code',
-      'Actor1Type3Code',
-      'Actor2Code',
-      'Actor2Name',
-      'Actor2CountryCode',
-      'Actor2Type1Code',
-      'Actor2Type2Code',
-      'Actor2Type3Code',
-      'IsRootEvent',
-      'EventCode',
-      'EventBaseCode',
-      'EventRootCode',
-      'QuadClass',
-      'AvgTone',
-      'Actor1Geo_Type',
-      'Actor1Geo_FullName',
-      'Actor1Geo_Lat',
-      'Actor1Geo_Long',
-      'Actor2Geo_Type',
-      'Actor2Geo_FullName',
-      'Actor2Geo_Lat',
-      'Actor2Geo_Long',
-      'ActionGeo_Type',
-      'ActionGeo_FullName',
-      'ActionGeo_Lat',
-      'ActionGeo_Long',
-      'DATEADDED',
-      'SOURCEURL',
-      ]
-    columnTypes = {
-      'GLOBALEVENTID' : type(1),
-      'Actor1Code': pd.StringDtype(),
-      'Actor1Name': pd.StringDtype(),
-      'Actor1CountryCode': pd.StringDtype(),
-      'Actor1Type1Code' : pd.StringDtype(),
-      'Actor1Type2Code' : pd.StringDtype(),
-      'Actor1Type3Code' : pd.StringDtype(),
-      'Actor2Code': pd.StringDtype(),
-      'Actor2Name': pd.StringDtype(),
-      'Actor2CountryCode': pd.StringDtype(),
-      'Actor2Type1Code' : pd.StringDtype(),
-      'Actor2Type2Code' : pd.StringDtype(),
-      'Actor2Type3Code' : pd.StringDtype(),
-      'IsRootEvent': type(True),
-      'EventCode': pd.StringDtype(),
-      'EventBaseCode': pd.StringDtype(),
-      'EventRootCode': pd.StringDtype(),
-      'QuadClass': type(1),
-      'AvgTone': type(1.1),
-      'Actor1Geo_Type': type(1),
-      'Actor1Geo_FullName': pd.StringDtype(),
-      'Actor1Geo_Lat': pd.StringDtype(),
-      'Actor1Geo_Long': pd.StringDtype(),
-      'Actor2Geo_Type': type(1),
-      'Actor2Geo_FullName': pd.StringDtype(),
-      'Actor2Geo_Lat': pd.StringDtype(),
-      'Actor2Geo_Long': pd.StringDtype(),
-      'ActionGeo_Type': type(1),
-      'ActionGeo_FullName': pd.StringDtype(),
-      'ActionGeo_Lat': pd.StringDtype(),
-      'ActionGeo_Long': pd.StringDtype(),
-      'DATEADDED' : pd.StringDtype(),
-      'SOURCEURL': pd.StringDtype(),
-      }
-    timecheckG = time()
-    print("  Creating another thread-safe connection to MongoDB...")
+    #   Column names are GDELTbase's reduced names, and dtypes are shared
+    # class data, see A01.
+    columnNames = GDELTbase.toolData['names']['events']['reduced']
+    columnTypes = GDELTeda.columnTypes['events']
+    timecheckG = perf_counter_ns()
+    #   GDELTbase's class-level MongoClient is shared, rather than opening a
+    # new client (with its own monitor threads and connections) per call.
+    # Each worker process gets its own once, on import of GDELTbase.
+    print("  Using shared GDELTbase connection to MongoDB...")
     localDb = {}
-    localDb['client'] = pymongo.MongoClient()
-    localDb['database'] = localDb['client'].capstone
-    localDb['collection'] = localDb['database'].GDELT.events
+    localDb['collection'] = GDELTbase.localDb['collections']['events']
   
-    configFilePath = os.path.join(os.path.abspath(__file__),
-                                  "GDELTeventsEDAconfig_batch.yaml"),
+    #   Reports and their configuration file copies are both in the batch
+    # log directory, given by absolute path.
+    logDirectory = GDELTeda.logPath['events']['batch']
+    configFilePath = os.path.join(logDirectory,
+                                  "GDELTeventsEDAconfig_batch.yaml")
       
     datetimeField = "DATEADDED"
     datetimeFormat = "%Y-%m-%dT%H:%M:%S.000000Z"
-    strftimeFormat = "%Y-%m-%dh%Hm%M"
-
-    print("  Pulling events records (long wait)... ", end = '')
-    eventsDF = pd.DataFrame.from_records(
-                list(localDb['collection'].find(projection = {"_id" : False},
-                                                allow_disk_use=True,
-                                                no_cursor_timeout = True)),
-                columns = columnNames,
-                )
-    print("    Complete!( %0.3f s )" % (float(time())-float(timecheckG)))
-
-    timecheckG = time()
-    print("  Setting dtypes... ", end='')
-    eventsDF = eventsDF.astype(dtype = columnTypes, copy = False)
-    print("    Complete!( %0.3f s )" % (float(time())-float(timecheckG)))
-
-    print("  Converting datetimes...", end = '')
-    eventsDF[datetimeField] = pd.to_datetime(eventsDF[datetimeField],
-                                            format = datetimeFormat)
-    print("    Complete!( %0.3f s )" % (float(time())-float(timecheckG)))
+
+    #   The pulled, typed, and parsed DataFrame is cached as Parquet in the
+    # batch log directory, one file per 'dateRange', so later runs over the
+    # same records skip MongoDB and dtype/datetime conversion entirely.
+    # Pass 'useCache = False' to re-pull after adding records to MongoDB.
+    cachePath = GDELTeda.batchCachePath('events', dateRange)
+    if useCache and os.path.isfile(cachePath):
+      print("  Reading cached events records...", end = '')
+      eventsDF = pd.read_parquet(cachePath)
+      print("    Complete!( %0.3f s )" %
+            ((perf_counter_ns() - timecheckG) / 1e9))
+    else:
+      #   Only fields kept in the DataFrame are sent by MongoDB, and only for
+      # records within 'dateRange', if given. Dates are stored as ISO strings,
+      # so string comparison matches datetime order.
+      #   A 'dateRange' match is hinted onto GDELTbase's (DATEADDED,
+      # GLOBALEVENTID) index, so MongoDB walks that range of the index rather
+      # than scanning the whole collection. Without a range, a plain
+      # collection scan is already the cheapest way through every record.
+      pipeline = []
+      aggregateOptions = {'allowDiskUse' : True, 'batchSize' : 50000}
+      if dateRange is not None:
+        pipeline.append({'$match' : {datetimeField : {
+          '$gte' : dateRange[0],
+          '$lt'  : dateRange[1],
+          }}})
+        aggregateOptions['hint'] = \
+          GDELTbase.localDb['indexes']['events']['keys']
+      projection = {'_id' : 0}
+      for name in columnNames:
+        projection[name] = 1
+      pipeline.append({'$project' : projection})
+
+      #   Record counts for progress output come from the date index for a
+      # 'dateRange', or from collection metadata otherwise, so neither
+      # needs a second pass over the records themselves.
+      if dateRange is not None:
+        recordCount = localDb['collection'].count_documents(
+          pipeline[0]['$match'], hint = aggregateOptions['hint'])
+      else:
+        recordCount = localDb['collection'].estimated_document_count()
+
+      print("  Pulling %d events records (long wait)... " % (recordCount))
+      #   Records are pulled in batches into Arrow columns, rather than into a
+      # full list of dicts, see cursorToDataFrame().
+      eventsDF = GDELTeda.cursorToDataFrame(
+        localDb['collection'].aggregate(pipeline, **aggregateOptions),
+        columnNames, recordCount = recordCount,
+        )
+      print("    Complete!( %0.3f s )" %
+            ((perf_counter_ns() - timecheckG) / 1e9))
+
+      timecheckG = perf_counter_ns()
+      print("  Setting dtypes... ", end='')
+      eventsDF = eventsDF.astype(dtype = columnTypes, copy = False)
+      print("    Complete!( %0.3f s )" %
+            ((perf_counter_ns() - timecheckG) / 1e9))
+
+      timecheckG = perf_counter_ns()
+      print("  Converting datetimes...", end = '')
+      #   Each distinct DATEADDED string (one per 15-minute update) is parsed
+      # once, see parseDatetimes().
+      eventsDF = GDELTeda.parseDatetimes(eventsDF, [datetimeField],
+                                         datetimeFormat)
+      print("    Complete!( %0.3f s )" %
+            ((perf_counter_ns() - timecheckG) / 1e9))
+      eventsDF.to_parquet(cachePath, compression = 'zstd')
 
     print("\n  Events records DataFrame .info():\n")
     print(eventsDF.info())
 
-    edaDates = "".join([
-      eventsDF[datetimeField].min().strftime(strftimeFormat),"_to_",
-      eventsDF[datetimeField].max().strftime(strftimeFormat),
-      ])
+    edaDates = GDELTedaGKGhelpers.edaDateRange(eventsDF[datetimeField])
     edaLogName = "".join(["GDELT_events_EDA_", edaDates,".html"])
-    timecheckG = time()
-
-    print("    Complete!( %0.3f s )" % (float(time())-float(timecheckG)))
-    timecheckG = time()
+    timecheckG = perf_counter_ns()
     print("  File output:", edaLogName, "\n")
 
     print("  Generating events 'batch' EDA report...")
 
-    eventsProfile = ProfileReport(eventsDF, config_file = configFilePath)
-    eventsProfile.to_file(edaLogName)
+    eventsDF = GDELTedaGKGhelpers.sampleForReport(eventsDF, sampleRows,
+                          os.path.join(logDirectory, edaLogName))
+    eventsProfile = ProfileReport(
+      eventsDF, config = GDELTedaGKGhelpers.profileConfig(configFilePath))
+    GDELTedaGKGhelpers.saveReport(eventsProfile,
+                                  os.path.join(logDirectory, edaLogName))
     del eventsDF
     del eventsProfile
-    print("    Complete!( %0.fd s )" % (float(time())-float(timecheckG)))
+    print("    Complete!( %0.3f s )" % ((perf_counter_ns() - timecheckG) / 1e9))
     print("All Events EDA operations complete. Please check EDAlogs",
           "directories for any resulting Events EDA profile reports.")
     return True
 
 
   # B03
-  def mentionsBatchEDA(mode):
+  def mentionsBatchEDA(mode, sampleRows = 500000, dateRange = None,
+                       useCache = True):
     '''Performs automatic EDA on GDELT Mentions record subsets. See
  function batchEDA() for "if table == 'mentions':" case handling and how
  this function is invoked as a multiprocessing.Pool.map() call, intended
@@ -596,6 +639,19 @@ mode - arbitrary
  function requirements. As such, it it present only to receive a
  parameter determined by imap(chunksize = 1), e.g. one iteration of the
  function will execute.
+
+sampleRows - int or None, default 500000
+  Maximum records passed to ProfileReport(). Larger subsets are sampled,
+ with full-subset summary statistics written alongside the report. See
+ GDELTedaGKGhelpers.sampleForReport().
+
+dateRange - tuple of two strings, default None
+  Start (inclusive) and end (exclusive) of 'MentionTimeDate' values for
+ records to be pulled, in ISO format, e.g. ('2020-05-24', '2020-06-23').
+ If None, all records in the collection are pulled.
+
+useCache - Boolean, default True
+  See eventsBatchEDA().
   
 Output:
 ------
@@ -604,80 +660,89 @@ Output:
 and function generates EDA profile html documents in appropriate project
 directories.
     '''
-    print("  Creating new thread-safe connection to MongoDB...")
-    columnNames = [
-      'GLOBALEVENTID',
-      'EventTimeDate',
-      'MentionTimeDate',
-      'MentionType',
-      'MentionSourceName',
-      'MentionIdentifier',
-      'InRawText',
-      'Confidence',
-      'MentionDocTone',
-      ]
-    columnTypes = {
-      'GLOBALEVENTID' : type(1),
-      'EventTimeDate' : pd.StringDtype(),
-      'MentionTimeDate' : pd.StringDtype(),
-      'MentionType' : pd.StringDtype(),
-      'MentionSourceName' : pd.StringDtype(),
-      'MentionIdentifier' : pd.StringDtype(),
-      'InRawText' : type(True),
-      'Confidence' : type(1),
-      'MentionDocTone' : type(1.1),
-      }
+    print("  Using shared GDELTbase connection to MongoDB...")
+    columnNames = GDELTbase.toolData['names']['mentions']['reduced']
+    columnTypes = GDELTeda.columnTypes['mentions']
 
     localDb = {}
-    localDb['client'] = pymongo.MongoClient()
-    localDb['database'] = localDb['client'].capstone
-    localDb['collection'] = localDb['database'].GDELT.mentions
+    localDb['collection'] = GDELTbase.localDb['collections']['mentions']
 
+    logDirectory = GDELTeda.logPath['mentions']['batch']
     configFileName = "GDELTmentionsEDAconfig_batch.yaml"
       
     datetimeField01 = "MentionTimeDate"
     datetimeField02 = "EventTimeDate"
     datetimeFormat = "%Y-%m-%dT%H:%M:%S.000000Z"
-    strftimeFormat = "%Y-%m-%dh%Hm%M"
-
-    print("\n  Pulling mentions records (long wait)...")
-    tableDF = pd.DataFrame.from_records(
-                list(localDb['collection'].find(projection = {"_id" : False},
-                                                allow_disk_use=True,
-                                                no_cursor_timeout = True)),
-                columns = columnNames,
-                )
-    print("    Complete!")
-
-    print("  Setting dtypes...")
-    tableDF = tableDF.astype(dtype = columnTypes, copy = False)
-    print("    Complete!")
-
-    print("  Converting datetimes...")
-    tableDF[datetimeField01] = pd.to_datetime(tableDF[datetimeField01],
-                                            format = datetimeFormat)
-    tableDF[datetimeField02] = pd.to_datetime(tableDF[datetimeField02],
-                                            format = datetimeFormat)
-    print("    Complete!")
+
+    # see eventsBatchEDA() for the Parquet cache
+    cachePath = GDELTeda.batchCachePath('mentions', dateRange)
+    if useCache and os.path.isfile(cachePath):
+      print("  Reading cached mentions records...")
+      tableDF = pd.read_parquet(cachePath)
+      print("    Complete!")
+    else:
+      # see eventsBatchEDA() for the 'dateRange' match and index hint
+      pipeline = []
+      aggregateOptions = {'allowDiskUse' : True, 'batchSize' : 50000}
+      if dateRange is not None:
+        pipeline.append({'$match' : {datetimeField01 : {
+          '$gte' : dateRange[0],
+          '$lt'  : dateRange[1],
+          }}})
+        aggregateOptions['hint'] = \
+          GDELTbase.localDb['indexes']['mentions']['keys']
+      projection = {'_id' : 0}
+      for name in columnNames:
+        projection[name] = 1
+      pipeline.append({'$project' : projection})
+
+      # see eventsBatchEDA() for record counts
+      if dateRange is not None:
+        recordCount = localDb['collection'].count_documents(
+          pipeline[0]['$match'], hint = aggregateOptions['hint'])
+      else:
+        recordCount = localDb['collection'].estimated_document_count()
+
+      print("\n  Pulling %d mentions records (long wait)..." % (recordCount))
+      tableDF = GDELTeda.cursorToDataFrame(
+        localDb['collection'].aggregate(pipeline, **aggregateOptions),
+        columnNames, recordCount = recordCount,
+        )
+      print("    Complete!")
+
+      print("  Setting dtypes...")
+      tableDF = tableDF.astype(dtype = columnTypes, copy = False)
+      print("    Complete!")
+
+      print("  Converting datetimes...")
+      #   Mention and Event datetimes share most of their distinct values, so
+      # both columns are parsed in one call, see parseDatetimes().
+      tableDF = GDELTeda.parseDatetimes(tableDF,
+                                        [datetimeField01, datetimeField02],
+                                        datetimeFormat)
+      print("    Complete!")
+      tableDF.to_parquet(cachePath, compression = 'zstd')
 
     print("  Mentions records DataFrame .info():")
     print(tableDF.info())
-    edaDates = "".join([
-      tableDF[datetimeField01].min().strftime(strftimeFormat),"_to_",
-      tableDF[datetimeField01].max().strftime(strftimeFormat),
-      ])
+    edaDates = GDELTedaGKGhelpers.edaDateRange(tableDF[datetimeField01])
     edaLogName = "".join(["GDELT_mentions_EDA_", edaDates,".html"])
     print("  File output:", edaLogName, "\n")
 
     print("\n  Generating mentions 'batch' EDA report...")
-    profile = ProfileReport(tableDF, config_file= configFileName)
-    profile.to_file(edaLogName)
+    tableDF = GDELTedaGKGhelpers.sampleForReport(tableDF, sampleRows,
+                          os.path.join(logDirectory, edaLogName))
+    profile = ProfileReport(tableDF,
+                            config = GDELTedaGKGhelpers.profileConfig(
+                              os.path.join(logDirectory, configFileName)))
+    GDELTedaGKGhelpers.saveReport(profile,
+                                  os.path.join(logDirectory, edaLogName))
     print("\n    Complete!")
     return True
 
 
   # B04
-  def gkgBatchEDA(self):
+  def gkgBatchEDA(self, sampleRows = 500000, useCache = True):
     '''Performs automatic EDA on GDELT Global Knowledge Graph (GKG)
 record subsets.
 
@@ -687,9 +752,7 @@ record subsets.
  tags are for 'find' use in GDELTedaGKGhelpers.py):
 
   A02 - pullMainGKGcolumns
-  A03 - applyDtypes
-  A04 - convertDatetimes
-  A05 - convertGKGV15Tone
+  A03 - prepareMainChunk (applies prepareGKG)
   A06 - mainReport
   A07 - locationsReport
   A08 - countsReport
@@ -720,6 +783,19 @@ GKG columns, but not for the majority of variable-length and subfielded
 columns. V1Locations batch EDA has been produced from at least one
 attempt, but no guarantee of its error-free operation on similarly-sized
 subsets of GDELT GKG records is intended or encouraged.
+
+Parameters:
+----------
+
+sampleRows - int or None, default 500000
+  Maximum records passed to ProfileReport() by each report helper
+ function. See GDELTedaGKGhelpers.sampleForReport().
+
+useCache - Boolean, default True
+  If True, prepared main columns are read from their Parquet cache in the
+ batch log directory when present, as in eventsBatchEDA(), and subfield
+ reports read their own caches, see GDELTedaGKGhelpers.subfieldReport().
+ If False, all GKG caches are removed, and rewritten from MongoDB.
   
 Output:
 ------
@@ -728,97 +804,170 @@ Output:
 and function generates EDA profile html documents in appropriate project
 directories.
     '''
-    timecheck = time()
-    print("  Pulling non-variable-length GKG columns...")
-    pool = multiprocessing.Pool(1)
-    #   For pullMainGKGcolumns documentation, See GDELTedaGKGhelpers.py,
-    # 'find' tag '# A02'
-    tableDF = pool.map(GDELTedaGKGhelpers.pullMainGKGcolumns, ['batch'])
-    pool.close()
-    pool.join()
-    print("    Records acquired. ( %0.3f s )" % (float(time())-float(timecheck)))
-    print("\n  GKG records DataFrame .info():")
-    tableDF = tableDF.pop()
-    pp(tableDF.info())
-
-    timecheck = time()
-    print("\n  Setting dtypes...")
-    #   This only sets 'GKGRECORDID', 'V21DATE', 'V2SourceCommonName',
-    # and 'V2DocumentIdentifier' dtypes to pd.StringDtype()
-    pool = multiprocessing.Pool(1)
-    #   For applyDtypes documentation, See GDELTedaGKGhelpers.py, 'find'
-    # tag '# A03'
-    tableDF = pool.map(GDELTedaGKGhelpers.applyDtypes, [tableDF])
-    pool.close()
-    pool.join()
-    print("    Complete! ( %0.3f s )" % (float(time())-float(timecheck)))
-    tableDF = tableDF.pop()
-
-    timecheck = time()
-    print("\n  Converting datetimes...")
-    pool = multiprocessing.Pool(1)
-    #   For convertDatetimes documentation, See GDELTedaGKGhelpers.py,
-    # 'find' tag '# A04'
-    tableDF = pool.map(GDELTedaGKGhelpers.convertDatetimes, [tableDF])
-    pool.close()
-    pool.join()
-    print("    Complete! ( %0.3f s )" % (float(time())-float(timecheck)))
-    tableDF = tableDF.pop()
-    
-    timecheck = time()
-    print("\n  Splitting V15Tone dicts to columns...")
-    pool = multiprocessing.Pool(1)
-    #   For convertGKGV15Tone code/documentation, See GDELTedaGKGhelpers.py,
-    # 'find' tag '# A05'
-    tableDF = pool.map(GDELTedaGKGhelpers.convertGKGV15Tone, [tableDF])
-    pool.close()
-    pool.join()
-    print("    Complete! ( %0.3f s )" % (float(time())-float(timecheck)))
-    
-    tableDF = tableDF.pop()
-    print("\n  Main GKG records (non-variable-length columns) DataFrame",
-          ".info():\n")
-    pp(tableDF.info())
-
-    #   Generating report excluding fields that require substantially more
-    # records (normalization), and so more resources for reporting.
-    timecheck = time()
-    print("\n  Generating non-variable-length subfield report...")
-    pool = multiprocessing.Pool(1)
-    #   For mainReport code/documentation, See GDELTedaGKGhelpers.py,
-    # 'find' tag '# A06'
-    booleanSuccess = pool.map(GDELTedaGKGhelpers.mainReport, [tableDF])
-    pool.close()
-    pool.join()
-    print("\n    Complete! ( %0.3f s )" % (float(time())-float(timecheck)))
-
-    # #   These columns may be dropped from this point on in order to
-    # # accomodate the increased RAM, CPU, and disk I/O requirements for
-    # # normalizing variable length columns, but this is commented out in order
-    # # to further check RAM requirements for full normalization.
-    # timecheck = time()
-    # print("\n  Dropping excess columns before normalizing for variable-length",
-    #       "columns...")
-    # tableDF.drop(columns = ['V2SourceCommonName',
-    #                         'V2DocumentIdentifier',
-    #                         'V15Tone_Positive',
-    #                         'V15Tone_Negative',
-    #                         'V15Tone_Polarity',
-    #                         'V15Tone_ARD',
-    #                         'V15Tone_SGRD',
-    #                         'V15Tone_WordCount'], inplace = True)
-    # print("    Complete! ( %0.3f s )" % (float(time())-float(timecheck)))
-
-    # Working implementation with locationsReport
-    timecheck = time()
-    print("\n  Splitting V1Locations dicts and generating report...")
-    pool = multiprocessing.Pool(1)
-    #   For locationsReport code/documentation, See GDELTedaGKGhelpers.py,
-    # 'find' tag '# A07'
-    booleanSuccess = pool.map(GDELTedaGKGhelpers.locationsReport, [tableDF])
-    pool.close()
-    pool.join()
-    print("    Complete! ( %0.3f s )" % (float(time())-float(timecheck)))
+    #   Setting dtypes, converting datetimes, and splitting V15Tone dicts
+    # are all per-record, so they're run over row chunks of the main columns
+    # in parallel, rather than over the full DataFrame in one worker. There
+    # are several chunks per worker, so a slow chunk doesn't hold up the
+    # rest, and each chunk stays well under multiprocessing's pickling
+    # limits. Chunks return in whatever order they finish, tagged with their
+    # position, and are concatenated back in order.
+    #   For prepareMainChunk code/documentation, See GDELTedaGKGhelpers.py,
+    # 'find' tag '# B16'
+    #   One worker pool, one worker per CPU core less one, serves both this
+    # stage and report generation below, rather than starting a fresh set of
+    # interpreters for each.
+    #   Each worker is pinned to its own core by pinWorker(). BLAS/OpenMP
+    # thread pools are limited to one thread per worker, so they don't
+    # compete with the other workers for cores. These variables are read when
+    # those libraries load, in each spawned worker, so they're set here for
+    # workers to inherit, then restored once the pool is started.
+    poolWorkers = max(1, (os.cpu_count() or 2) - 1)
+    threadLimits = {}
+    for name in ['OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS']:
+      threadLimits[name] = os.environ.get(name)
+      os.environ[name] = '1'
+    pool = multiprocessing.get_context('spawn').Pool(
+      poolWorkers, initializer = GDELTeda.pinWorker)
+    for name in threadLimits:
+      if threadLimits[name] is None:
+        del os.environ[name]
+      else:
+        os.environ[name] = threadLimits[name]
+
+    arrowPath = os.path.join(self.logPath['gkg']['batch'],
+                             'GDELT_gkg_main.arrow')
+    #   The pool's workers, and the Arrow file they memory-map, are released
+    # however the reports end. If a stage raises, workers are terminated
+    # rather than left running, and the file is removed, rather than being
+    # left for the next run.
+    try:
+      #   Prepared main columns are cached as Parquet in the batch log
+      # directory, as in eventsBatchEDA(), so later runs skip both the MongoDB
+      # pull and prepareMainChunk(). Subfield reports keep their own caches in
+      # the same directory, all named 'GDELT_gkg_cache_...', and all removed
+      # here with 'useCache = False', to be rewritten from MongoDB.
+      cachePath = GDELTeda.batchCachePath('gkg')
+      #   Variable-length columns reported on below are pulled in the same
+      # pass over the collection as the main columns, and kept with them
+      # through the cache and Arrow file, rather than each subfield report
+      # scanning the whole collection again for its own column.
+      reportSubfields = ['V1Locations']
+      if not useCache:
+        for fileName in os.listdir(self.logPath['gkg']['batch']):
+          if fileName.startswith('GDELT_gkg_cache_'):
+            os.remove(os.path.join(self.logPath['gkg']['batch'], fileName))
+      if os.path.isfile(cachePath):
+        timecheck = perf_counter_ns()
+        print("  Reading cached main GKG columns...")
+        tableDF = pd.read_parquet(cachePath)
+        print("    Complete! ( %0.3f s )" %
+              ((perf_counter_ns() - timecheck) / 1e9))
+      else:
+        timecheck = perf_counter_ns()
+        print("  Pulling non-variable-length GKG columns...")
+        #   Called directly, rather than in a Pool(1) worker, which only added
+        # a process start and a pickled round trip of the full DataFrame.
+        #   For pullMainGKGcolumns documentation, See GDELTedaGKGhelpers.py,
+        # 'find' tag '# A02'
+        tableDF = GDELTedaGKGhelpers.pullMainGKGcolumns(
+          'batch', subfields = reportSubfields)
+        print("    Records acquired. ( %0.3f s )" %
+              ((perf_counter_ns() - timecheck) / 1e9))
+        print("\n  GKG records DataFrame .info():")
+        pp(tableDF.info())
+
+        timecheck = perf_counter_ns()
+        print("\n  Setting dtypes, converting datetimes, and splitting",
+              "V15Tone dicts to columns...")
+        #   Subfield columns aren't touched by prepareMainChunk(), so they're
+        # set aside rather than pickled to and from workers with each chunk.
+        subfieldDF = tableDF[reportSubfields]
+        tableDF = tableDF.drop(columns = reportSubfields)
+        chunkRows = max(1, -(-len(tableDF) // (poolWorkers * 4)))
+        mainChunks = []
+        for chunkStart in range(0, max(len(tableDF), 1), chunkRows):
+          mainChunks.append((len(mainChunks),
+                             tableDF.iloc[chunkStart:chunkStart + chunkRows]))
+        del tableDF
+        preparedChunks = {}
+        for chunkIndex, chunkDF in pool.imap_unordered(
+          GDELTedaGKGhelpers.prepareMainChunk, mainChunks, chunksize = 1):
+          preparedChunks[chunkIndex] = chunkDF
+        del mainChunks
+        tableDF = pd.concat([preparedChunks[chunkIndex] for chunkIndex in
+                             sorted(preparedChunks)], copy = False)
+        del preparedChunks
+        for subfield in reportSubfields:
+          tableDF[subfield] = subfieldDF[subfield]
+        del subfieldDF
+        print("    Complete! ( %0.3f s )" %
+              ((perf_counter_ns() - timecheck) / 1e9))
+        tableDF.to_parquet(cachePath, compression = 'zstd')
+
+      print("\n  Main GKG records (non-variable-length columns) DataFrame",
+            ".info():\n")
+      pp(tableDF.info())
+
+      # #   These columns may be dropped from this point on in order to
+      # # accomodate the increased RAM, CPU, and disk I/O requirements for
+      # # normalizing variable length columns, but this is commented out in
+      # # order to further check RAM requirements for full normalization.
+      # timecheck = perf_counter_ns()
+      # print("\n  Dropping excess columns before normalizing for",
+      #       "variable-length columns...")
+      # tableDF.drop(columns = ['V2SourceCommonName',
+      #                         'V2DocumentIdentifier',
+      #                         'V15Tone_Positive',
+      #                         'V15Tone_Negative',
+      #                         'V15Tone_Polarity',
+      #                         'V15Tone_ARD',
+      #                         'V15Tone_SGRD',
+      #                         'V15Tone_WordCount'], inplace = True)
+      # print("    Complete! ( %0.3f s )" %
+      #       ((perf_counter_ns() - timecheck) / 1e9))
+
+      #   Generating the main report, excluding fields that require
+      # substantially more records (normalization), alongside the working
+      # V1Locations report. Each report runs in its own worker process, from
+      # the pool started above.
+      #   For mainReport and locationsReport code/documentation, See
+      # GDELTedaGKGhelpers.py, 'find' tags '# A06' and '# A07'
+      #   Each report function is paired with the variable-length column it
+      # takes from the Arrow file, if any, see reportFromArrow().
+      reportFunctions = [
+        (GDELTedaGKGhelpers.mainReport, None),
+        (GDELTedaGKGhelpers.locationsReport, 'V1Locations'),
+        ]
+      timecheck = perf_counter_ns()
+      print("\n  Generating main and V1Locations reports...")
+      #   Rather than pickling the full main columns DataFrame to every report
+      # worker, it's written once as an Arrow IPC file, which each worker
+      # memory-maps, see GDELTedaGKGhelpers.reportFromArrow(). This avoids
+      # both the per-worker pickling and pickle's 2 GiB limit on large frames.
+      # Its path is set above, so it's removed however the reports end.
+      GDELTeda.writeArrowFile(tableDF, arrowPath)
+      #   Report file names share one date range, computed here once rather
+      # than by each report from its own copy of 'V21DATE'.
+      edaDates = GDELTedaGKGhelpers.edaDateRange(tableDF['V21DATE'])
+      #   Workers have everything they need from the file, so the parent's
+      # copy is released before reports begin, rather than held alongside
+      # each worker's frames and ProfileReport temporaries. Work re-enabled
+      # from the section below would read it back with
+      # GDELTedaGKGhelpers.readArrowFile() before removing the file.
+      del tableDF
+      reportResults = []
+      for reportFunction, subfield in reportFunctions:
+        reportResults.append(pool.apply_async(
+          GDELTedaGKGhelpers.reportFromArrow,
+          (reportFunction, arrowPath, sampleRows, subfield, edaDates)))
+      booleanSuccess = [result.get() for result in reportResults]
+      pool.close()
+      pool.join()
+    finally:
+      pool.terminate()
+      if os.path.isfile(arrowPath):
+        os.remove(arrowPath)
+    print("    Complete! ( %0.3f s )" % ((perf_counter_ns() - timecheck) / 1e9))
     
     '''
     #   This section of calls are commented out due to their current inability
@@ -830,15 +979,13 @@ directories.
     # to Pandas limitations for long-running jobs, but it's also just a huge
     # DataFrame I'm attempting to normalize, thanks to the variable quantities
     # of 'V1Counts' values with subfielded values per record.
-    # timecheck = time()
+    # timecheck = perf_counter_ns()
     # print("\n  Splitting V1Counts lists and generating report...")
-    # pool = multiprocessing.Pool(1)
     # #   For countsReport code/documentation, See GDELTedaGKGhelpers.py,
     # # 'find' tag '# A08'
-    # booleanSuccess = pool.map(GDELTedaGKGhelpers.countsReport, [tableDF])
-    # pool.close()
-    # pool.join()
-    # print("    Complete! (%0.3f seconds)" % (float(time())-float(timecheck)))
+    # booleanSuccess = GDELTedaGKGhelpers.countsReport(tableDF, sampleRows)
+    # print("    Complete! (%0.3f seconds)" %
+    #       ((perf_counter_ns() - timecheck) / 1e9))
 
     #   Ditto the rest of the normalization helper functions, because the
     # normalization necessary for EDA on this large a subset of GKG records is
@@ -854,35 +1001,19 @@ directories.
     # least demand them until the system can't help but except the process.
 
 
-    timecheck = time()
-    print("\n  Splitting V1Themes lists and generating report...")
-    pool = multiprocessing.Pool(1)
-    #   For themesReport code/documentation, See GDELTedaGKGhelpers.py,
-    # 'find' tag '# A09'
-    booleanSuccess = pool.map(GDELTedaGKGhelpers.themesReport, [tableDF])
-    pool.close()
-    pool.join()
-    print("    Complete! ( %0.3f s )" % (float(time())-float(timecheck)))
-
-    timecheck = time()
-    print("\n  Generating Persons report...")
-    pool = multiprocessing.Pool(1)
-    #   For personsReport code/documentation, See GDELTedaGKGhelpers.py,
-    # 'find' tag '# A10'
-    booleanSuccess = pool.map(GDELTedaGKGhelpers.personsReport, [tableDF])
-    pool.close()
-    pool.join()
-    print("    Complete! ( %0.3f s )" % (float(time())-float(timecheck)))
-
-    timecheck = time()
-    print("\n  Generating Organizations report...")
-    pool = multiprocessing.Pool(1)
-    #   For organizationsReport code/documentation, See GDELTedaGKGhelpers.py,
-    # 'find' tag '# A11'
-    booleanSuccess = pool.map(GDELTedaGKGhelpers.organizationsReport,[tableDF])
-    pool.close()
-    pool.join()
-    print("    Complete! ( %0.3f s )" % (float(time())-float(timecheck)))
+    #   V1Themes, V1Persons, and V1Organizations reports share one pull from
+    # MongoDB with the main columns, rather than a query each: add these
+    # columns to 'reportSubfields' above, and these pairs to
+    # 'reportFunctions', so each runs from the Arrow file with the others.
+    #   For themesReport, personsReport, and organizationsReport
+    # code/documentation, See GDELTedaGKGhelpers.py, 'find' tags '# A09',
+    # '# A10', and '# A11'
+    reportSubfields += ['V1Themes', 'V1Persons', 'V1Organizations']
+    reportFunctions += [
+      (GDELTedaGKGhelpers.themesReport, 'V1Themes'),
+      (GDELTedaGKGhelpers.personsReport, 'V1Persons'),
+      (GDELTedaGKGhelpers.organizationsReport, 'V1Organizations'),
+      ]
     
     '''
 
@@ -893,7 +1024,8 @@ directories.
 
 
   # B05
-  def realtimeEDA(self, tableList = ['events','mentions','gkg']):
+  def realtimeEDA(self, tableList = ['events','mentions','gkg'],
+                  compressHTML = False):
     '''Performs automatic EDA on the latest GDELT datafiles for records
  from Events/Mentions and GKG. This function is enabled by loopEDA() to
  download a specified window of datafiles, or else just most-recent
@@ -909,6 +1041,10 @@ Parameters:
 tableList - list of strings, default ['events','mentions','gkg']
   Permits limiting of operations to one or more tables.
 
+compressHTML - boolean, default False
+  If True, ProfileReport html documents are written gzip-compressed, as
+ '.html.gz' files, see GDELTedaGKGhelpers.writeReportHTML().
+
 Output:
 ------
 
@@ -932,7 +1068,7 @@ directories.
     # delay report generation until desired window is collected.
     if self.realtimeWindow > 1:
       self.realtimeWindow -= 1
-      self.realtimeLooping == True
+      self.realtimeLooping = True
     elif self.realtimeWindow == 1:
       self.realtimeWindow -= 1
 
@@ -957,12 +1093,12 @@ directories.
       }
 
     # Tracking function runtime
-    timecheckF = time()
+    timecheckF = perf_counter_ns()
 
     # applicable for all tables
     datetimeFormat = "%Y-%m-%dT%H:%M:%S.000000Z"
     strptimeFormat = "%Y%m%d%H%M%S"
-    strftimeFormat = "%Y-%m-%dh%Hm%M"
+    strftimeFormat = GDELTedaGKGhelpers.strftimeFormat
 
     #   Downloading and parsing lastupdate.txt
     # That text file consists of three lines, one for each main GDELT
@@ -975,12 +1111,13 @@ directories.
     # described in GDELT docs. Exact update times likely vary with volume of
     # current world news coverage, but should be at least every fifteen
     # minutes, with all dates and times reported by UTC zone.
-    os.chdir(self.gBase.toolData['path']['base'])
+    #   The file is read straight from the response through GDELTbase's
+    # pooled requests session, rather than saved to disk and read back.
     print("  Checking http://data.gdeltproject.org/gdeltv2/lastupdate.txt...")
     lastFilesURL = 'http://data.gdeltproject.org/gdeltv2/lastupdate.txt'
-    lastFiles = wget.download(lastFilesURL, 'lastupdate.txt')
-    with open(lastFiles) as lastupdate:
-      lines = lastupdate.readlines()
+    lastFiles = self.gBase.session.get(lastFilesURL, timeout = 60)
+    lastFiles.raise_for_status()
+    lines = lastFiles.text.splitlines(keepends = True)
 
     #   Table order is reversed from most other loops in this project, here,
     # because list.pop() pulls in reverse and I'm too short on time to bother
@@ -1033,6 +1170,24 @@ directories.
     print("prior:")
     pp(priorURLs)
 
+    #   Each table's download, cleaning, and MongoDB export is its own file
+    # pipeline, independent of the others (different URLs, files, and
+    # collections) and mostly network- and disk-bound, so all three run
+    # together, each in its own thread, and are collected in table order
+    # below. Per-table output may interleave. See ingestRealtimeFile().
+    print("Downloading, cleaning, and storing most recent files for all",
+          "tables...")
+    timecheckT = perf_counter_ns()
+    with ThreadPoolExecutor(max_workers = len(tableList)) as ingester:
+      ingests = {}
+      for table in tableList:
+        ingests[table] = ingester.submit(self.ingestRealtimeFile, table,
+                                         fileURLs[table])
+      for table in tableList:
+        ingests[table].result()
+    print("  All tables stored ( %0.3f s )" %
+          ((perf_counter_ns() - timecheckT) / 1e9))
+
     print("Beginning per-table operations...\n")
 
     for table in tableList:
@@ -1040,47 +1195,8 @@ directories.
       #   Note that order of execution for all tables will be project-typical.
 
       # Tracking per-table loop times
-      timecheckT = time()
-      print("Trying downloading and cleaning for most recent", table,
-            "file...")
-      # making use of alternate-mode functionality for GDELTbase methods.
-      thisDL = self.gBase.downloadGDELTFile(fileURLs[table], table,
-                                            verbose = True, mode = 'realtime')
-
-      #   Matching the same input formatting requirements, typically performed
-      # in the 'table' versions of GDELTbase methods
-      fileName = fileURLs[table].replace(self.gBase.toolData['URLbase'], '')
-      fileName = fileName.replace('.zip', '')
-      # cleaning the file (exported to realtimeClean as .json)
-      thisClean = self.gBase.cleanFile(fileName, verbose = True,
-                                       mode = 'realtime')
-
-      # tracking prior URLs, still, might delete this section
-      lastFileName = priorURLs[table].replace(self.gBase.toolData['URLbase'], '')
-      lastFileName = lastFileName.replace('.zip', '')
-
-
-      # GKG still has different extensions...
-      if table == 'gkg':
-        cleanFileName = fileName.replace('.csv', '.json')
-        cleanLastFileName = lastFileName.replace('.csv', '.json')
-      else:
-        cleanFileName = fileName.replace('.CSV', '.json')
-        cleanLastFileName = lastFileName.replace('.CSV', '.json')
-      
-      
-      #   Each iterative run of this function will add another most-recent
-      # datafile, so long as it hasn't already been collected and cleaned, but
-      # the first run should wipe per-table collections before populating 'em
-      # with records.
-      if not self.realtimeStarted:
-        print("  Dropping any old realtime GDELT MongoDB collection...")
-        self.gBase.localDb['collections']['realtime'][table].drop()
-      print("Starting MongoDB export for acquired file...")
-      thisMongo = self.gBase.mongoFile(cleanFileName, table, verbose = True,
-                                  mode = 'realtime')
-      print('')
-      
+      timecheckT = perf_counter_ns()
+
       # Permitting delay of report generation for N iterations
       if lastRun:
         pass
@@ -1093,23 +1209,32 @@ directories.
 
       print("Beginning EDA processing...")
 
-      # switching to table-appropriate logPath directory...
-      os.chdir(self.logPath[table]['realtime'])
+      # table-appropriate logPath directory, for reports and their configs
+      logDirectory = self.logPath[table]['realtime']
+
+      #   A table with no realtime records (e.g. if each of its file ingests
+      # failed) is skipped, rather than building empty DataFrames and
+      # reports for it.
+      recordCount = self.gBase.localDb['collections']['realtime'][
+        table].estimated_document_count()
+      if recordCount == 0:
+        print("  No", table, "realtime records held, skipping EDA...")
+        continue
 
       # B05b - Events/Mentions handling
       #   Per-table records querying, DataFrame shaping, and Pandas Profiling
       # EDA ProfileReport() generation.
       if table == 'events' or table == 'mentions':
-        timecheckG = time()
+        timecheckG = perf_counter_ns()
         print("\n  Loading", table, "realtimeEDA files held locally...",
               end = '')
-        thisDF = pd.DataFrame.from_records(list(
+        thisDF = GDELTeda.cursorToDataFrame(
           self.gBase.localDb['collections']['realtime'][table].find(
             projection = {"_id" : 0},
             allow_disk_use = True,
             no_cursor_timeout = True,
-            ),
-          ), columns = self.gBase.toolData['names'][table]['reduced'])
+            ), self.gBase.toolData['names'][table]['reduced'],
+          recordCount = recordCount)
         print("  ")
         print("  Setting dtypes...")
         thisDF = thisDF.astype(
@@ -1119,13 +1244,14 @@ directories.
         print("  Converting datetimes...")
         if table == 'events':
           datetimeField = 'DATEADDED'
-        # mentions has an extra datetime field, 'EventTimeDate', converted here
+          datetimeFields = [datetimeField]
+        #   mentions has an extra datetime field, 'EventTimeDate', parsed in
+        # the same call
         if table == 'mentions':
           datetimeField = 'MentionTimeDate'
-          thisDF['EventTimeDate'] = pd.to_datetime(thisDF['EventTimeDate'],
-                                                   format = datetimeFormat)
-        thisDF[datetimeField] = pd.to_datetime(thisDF[datetimeField],
-                                               format = datetimeFormat)
+          datetimeFields = [datetimeField, 'EventTimeDate']
+        thisDF = GDELTeda.parseDatetimes(thisDF, datetimeFields,
+                                         datetimeFormat)
 
         print("\n ", table, "DataFrame .info():\n")
         print(thisDF.info(),'\n')
@@ -1141,12 +1267,18 @@ directories.
                                 ".html"])
 
         print("    File to output:", edaLogName)
-        profile = ProfileReport(thisDF, config_file = configName)
+        #   Settings are parsed once and reused across realtimeEDA()
+        # iterations, see GDELTedaGKGhelpers.profileConfig().
+        profile = ProfileReport(thisDF,
+                                config = GDELTedaGKGhelpers.profileConfig(
+                                  os.path.join(logDirectory, configName)))
         print("    Generating html from report...")
-        profile.to_file(edaLogName)
-        EDAFiles[table].append(edaLogName)
+        edaLogPath = GDELTedaGKGhelpers.writeReportHTML(
+          profile, os.path.join(logDirectory, edaLogName), compressHTML)
+        EDAFiles[table].append(os.path.basename(edaLogPath))
         del profile
         del thisDF
+        GDELTedaGKGhelpers.releaseMemory()
         print('')
         print('------------------------------------------------------------\n')
 
@@ -1154,285 +1286,69 @@ directories.
       if table == 'gkg':
 
         print("\n  Pulling any", table, "realtime EDA files...", end = '')
-        timecheckG = time()
-        thisDF = pd.DataFrame.from_records(list(
+        timecheckG = perf_counter_ns()
+        #   Subfield lists and V15Tone dicts are kept as Python objects for
+        # explodeSubfield() and splitV15Tone(), see GDELTedaGKGhelpers.py.
+        thisDF = GDELTedaGKGhelpers.cursorToColumnsDF(
           self.gBase.localDb['collections']['realtime'][table].find(
             projection = {"_id" : 0},
             allow_disk_use = True,
             no_cursor_timeout = True,
-            ),
-          ), columns = self.gBase.toolData['names']['gkg']['reduced'])
-        print(" ( %0.3f s )" % (float(time()) - float(timecheckG)))
+            ), self.gBase.toolData['names']['gkg']['reduced'])
+        print(" ( %0.3f s )" % ((perf_counter_ns() - timecheckG) / 1e9))
 
         #   Reusing GDELTedaGKGhelpers.py functions, since they'll work
         # in this context. See that file for code and documentation.
 
-        timecheckG = time()
-        print("  Applying initial dtypes...", end = '')
-        thisDF = GDELTedaGKGhelpers.applyDtypes(thisDF)
-        print(" ( %0.3f s )" % (float(time()) - float(timecheckG)))
-        
-        timecheckG = time()
-        print("  Converting datetimes...", end = '')
-        thisDF = GDELTedaGKGhelpers.convertDatetimes(thisDF)
-        print(" ( %0.3f s )" % (float(time()) - float(timecheckG)))
-        
-        edaDateString = thisDF['V21DATE'].min().strftime(strftimeFormat)
-        
-        timecheckG = time()
-        print("  Splitting and forming columns from V15Tone...")
-        thisDF = GDELTedaGKGhelpers.convertGKGV15Tone(thisDF)
-        print(" ( took %0.3f s )" % (float(time()) - float(timecheckG)))
-
-        # B05d - GKG non-variable-length EDA generation
-        #   Isolating main columns for their own EDA, dropping variable-length
-        # columns for copy (not inplace).
-        timecheckG = time()
-        print("  Starting EDA generation for main GKG columns only...", end='')
-        mainDF = thisDF.drop(columns = ['V1Locations',
-                                        'V1Counts',
-                                        'V1Themes',
-                                        'V1Persons',
-                                        'V1Organizations'])
-        print(" ( drop/copy: %0.3f s )" % (float(time()) - float(timecheckG)))
-
-        print("\n  GKG main columns DataFrame .info():\n")
-        print(mainDF.info())
-        print('')
-
-        # constructing EDA output filename
-        configName = "GDELTgkgMainEDAconfig_realtime.yaml"
-        edaLogName = ''.join(["GDELT_GKG_realtime_main_EDA_", edaDateString,
-                             ".html"])
-
-        # Generating non-variable-length-subfield column EDA
-        print("\n  File to output:", edaLogName)
-        profile = ProfileReport(mainDF, config_file = configName)        
-        print("    Generating html from report...")
-        profile.to_file(edaLogName)
-        EDAFiles[table].append(edaLogName)
-        print("\n ( ProfileReport() + .to_file() : %0.3f s )" %
-              (float(time()) - float(timecheckG)))
-        del profile
-        del mainDF
-
-        print("  Continuing processing with separate normalization of each",
-              "variable-length subfield...\n")
-
-        # B05e - V1Locations EDA generation
-        timecheckG = time()
-        print("  Exploding V1Locations...", end = '')
-        locationDF = thisDF.drop(columns = ['V1Counts',
-                                            'V1Themes',
-                                            'V1Persons',
-                                            'V1Organizations'])
-        locationDF = locationDF.explode('V1Locations')
-        print(" ( drop/explode: %0.3f s )" % \
-              (float(time()) - float(timecheckG)))
-        timecheckG = time()
-        print("  Normalizing V1Locations...", end = '')
-        subcols = pd.json_normalize(locationDF['V1Locations'])
-        print(" ( %0.3f s )" % (float(time()) - float(timecheckG)))
-        timecheckG = time()
-        print("  Renaming columns, dropping old, rejoining, astyping...",
-              end = '')
-        subcols.columns = [f"V1Locations_{c}" for c in subcols.columns]
-        locationDF = locationDF.drop(columns = ['V1Locations']).join(
-          subcols).astype({'V1Locations_FullName'    : pd.StringDtype(),
-                           'V1Locations_CountryCode' : pd.StringDtype(),
-                           'V1Locations_ADM1Code'    : pd.StringDtype(),
-                           'V1Locations_FeatureID'   : pd.StringDtype(),},
-                          copy = False)
-        print(" ( %0.3f s )" % (float(time()) - float(timecheckG)))
-
-        print("\n  GKG Locations-normalized DataFrame .info():\n")
-        print(locationDF.info())
-        
-        print("  Setting index to 'GKGRECORDID'...")
-        locationDF.set_index(keys='GKGRECORDID', drop = True, append = False,
-                           inplace = True, verify_integrity = False)
-
-        configName = "GDELTgkgLocationsEDAconfig_realtime.yaml"
-        edaLogName = ''.join(["GDELT_GKG_realtime_locations_EDA_",
-                              edaDateString,
-                              ".html"])
-
-        timecheckG = time()
-        print("\n  File to output:", edaLogName)
-        profile = ProfileReport(locationDF, config_file = configName)
-        print("    Generating html from report...")
-        profile.to_file(edaLogName)
-        EDAFiles[table].append(edaLogName)
-        print("\n ( ProfileReport() + .to_file() : %0.3f s )" %
-              (float(time()) - float(timecheckG)))
-
-        del locationDF
-        del profile
-
-        # B05f - V1Counts EDA generation
-        timecheckG = time()
-        print("  Exploding V1Counts...", end = '')
-        countsDF = thisDF.drop(columns = ['V1Locations',
-                                          'V1Themes',
-                                          'V1Persons',
-                                          'V1Organizations'])
-        print(" ( drop/explode: %0.3f s )" % \
-              (float(time()) - float(timecheckG)))
-        countsDF = countsDF.explode('V1Counts')
-        print("  Normalizing V1Counts...", end = '')
-        subcols = pd.json_normalize(countsDF['V1Counts'])
-        print(" ( %0.3f s )" % (float(time()) - float(timecheckG)))
-        timecheckG = time()
-        print("  Renaming columns, dropping old, rejoining,",
-              "astyping... ", end = '')
-        subcols.columns = [f"V1Counts_{c}" for c in subcols.columns]
-        countsDF = countsDF.drop(columns = ['V1Counts']).join(
-          subcols).astype({
-            'V1Counts_CountType'           : pd.StringDtype(),
-            'V1Counts_ObjectType'          : pd.StringDtype(),
-            'V1Counts_LocationFullName'    : pd.StringDtype(),
-            'V1Counts_LocationCountryCode' : pd.StringDtype(),
-            'V1Counts_LocationADM1Code'    : pd.StringDtype(),
-            'V1Counts_LocationFeatureID'   : pd.StringDtype(),
-            }, copy = False)
-
-        print("\n  GKG Counts-normalized DataFrame .info():\n")
-        print(countsDF.info())
-
-        print("  Setting index to 'GKGRECORDID'...")
-        countsDF.set_index(keys='GKGRECORDID', drop = True, append = False,
-                           inplace = True, verify_integrity = False)
-
-        configName = "GDELTgkgCountsEDAconfig_realtime.yaml"
-        edaLogName = ''.join(["GDELT_GKG_realtime_counts_EDA_", edaDateString,
-                             ".html"])
-        timecheckG = time()
-        print("\n  File to output:", edaLogName)
-        profile = ProfileReport(countsDF, config_file = configName)
-        print("\n    Generating html from report...")
-        profile.to_file(edaLogName)
-        EDAFiles[table].append(edaLogName)
-        print("\n ( ProfileReport() + .to_file() : %0.3f s )" %
-              (float(time()) - float(timecheckG)))
-        del countsDF
-        del profile
-
-        # B05g - V1Themes EDA generation
-        timecheckG = time()
-        print("  Exploding V1Themes...", end = '')
-        themesDF = thisDF.drop(columns = ['V1Locations',
-                                          'V1Counts',
-                                          'V1Persons',
-                                          'V1Organizations'])
-        themesDF = themesDF.explode('V1Themes')
-        print(" ( drop/explode: %0.3f s )" %
-              (float(time()) - float(timecheckG)))
-        print("  Setting types...", end = '')
-        themesDF = themesDF.astype({'V1Themes' : pd.StringDtype()},
-                                   copy = False)
-
-        print("\n  GKG Themes-normalized DataFrame .info():\n")
-        print(themesDF.info())
-
-        print("  Setting index to 'GKGRECORDID'...")
-        themesDF.set_index(keys='GKGRECORDID', drop = True, append = False,
-                           inplace = True, verify_integrity = False)
-
-        configName = "GDELTgkgThemesEDAconfig_realtime.yaml"
-        edaLogName = ''.join(["GDELT_GKG_realtime_themes_EDA_", edaDateString,
-                             ".html"])
-
-        print("\n  File to output:", edaLogName)
-        profile = ProfileReport(themesDF, config_file = configName)
-        print("\n    Generating html from report...")
-        profile.to_file(edaLogName)
-        EDAFiles[table].append(edaLogName)
-        print("\n ( ProfileReport() + .to_file() : %0.3f s )" %
-              (float(time()) - float(timecheckG)))
-        del themesDF
-        del profile
+        #   Dtypes, datetimes, and V15Tone columns are converted in one
+        # pass, see GDELTedaGKGhelpers.prepareGKG().
+        timecheckG = perf_counter_ns()
+        print("  Applying dtypes, datetimes, and V15Tone columns...", end = '')
+        thisDF = GDELTedaGKGhelpers.prepareGKG(thisDF)
+        print(" ( %0.3f s )" % ((perf_counter_ns() - timecheckG) / 1e9))
 
-        # B05h - V1Persons EDA generation
-        timecheckG = time()
-        print("  Exploding V1Persons...", end = '')
-        personsDF = thisDF.drop(columns = ['V1Locations',
-                                           'V1Themes',
-                                           'V1Counts',
-                                           'V1Organizations'])
-        personsDF = personsDF.explode('V1Persons')
-        print(" ( drop/explode: %0.3f s )" %
-              (float(time()) - float(timecheckG)))
-        print("  Setting types...", end = '')
-        personsDF = personsDF.astype({'V1Persons' : pd.StringDtype()},
-                                     copy = False)
-
-        print("\n  GKG Persons-normalized DataFrame .info():\n")
-        print(personsDF.info())
-
-        print("  Setting index to 'GKGRECORDID'...")
-        personsDF.set_index(keys='GKGRECORDID', drop = True, append = False,
-                            inplace = True, verify_integrity = False)
-
-        configName = "GDELTgkgPersonsEDAconfig_realtime.yaml"
-        edaLogName = ''.join(["GDELT_GKG_realtime_persons_EDA_", edaDateString,
-                             ".html"])
-
-        timecheckG = time()
-        print("\n  File to output:", edaLogName)
-        profile = ProfileReport(personsDF, config_file = configName)
-        print("\n    Generating html from report...")
-        profile.to_file(edaLogName)
-        EDAFiles[table].append(edaLogName)
-        print("\n ( ProfileReport() + .to_file() : %0.3f s )" %
-              (float(time()) - float(timecheckG)))
-        del personsDF
-        del profile
+        edaDateString = thisDF['V21DATE'].min().strftime(strftimeFormat)
 
-        # B05i - V1Organizations EDA generation
-        timecheckG = time()
-        print("  Exploding V1Organizations...", end = '')
-        orgDF = thisDF.drop(columns = ['V1Locations',
-                                       'V1Themes',
-                                       'V1Persons',
-                                       'V1Counts'])
-        orgDF = orgDF.explode('V1Organizations')
-        print(" ( drop/explode: %0.3f s )" %
-              (float(time()) - float(timecheckG)))
-        timecheckG = time()
-        print("  Setting types...", end = '')
-        orgDF = orgDF.astype({'V1Organizations' : pd.StringDtype()},
-                             copy = False)
-
-        print("\n  GKG Organizations-normalized DataFrame .info():\n")
-        print(orgDF.info())
-
-        print("  Setting index to 'GKGRECORDID'...")
-        orgDF.set_index(keys='GKGRECORDID', drop = True, append = False,
-                        inplace = True, verify_integrity = False)
-
-        configName = "GDELTgkgOrganizationsEDAconfig_realtime.yaml"
-        edaLogName = ''.join(["GDELT_GKG_realtime_organizations_EDA_",
-                              edaDateString,
-                              ".html"])
-
-        timecheckG = time()
-        print("\n  File to output:", edaLogName)
-        profile = ProfileReport(orgDF, config_file = configName)
-        print("\n    Generating html from report...")
-        profile.to_file(edaLogName)
-        EDAFiles[table].append(edaLogName)
-        print("\n ( ProfileReport() + .to_file() : %0.3f s )" %
-              (float(time()) - float(timecheckG)))
-        del orgDF
-        del profile
+        # B05d - GKG report generation
+        #   The main columns report and each variable-length subfield report
+        # are built from their own copy of thisDF, independent of the others,
+        # so they're generated concurrently, one worker process per report
+        # up to one per CPU core less one. See
+        # GDELTedaGKGhelpers.realtimeReport() for each report's shaping.
+        timecheckG = perf_counter_ns()
+        reports = ['main', 'locations', 'counts', 'themes', 'persons',
+                   'organizations']
+        print("  Generating", len(reports), "GKG reports concurrently...")
+        reportWorkers = max(1, min(len(reports), (os.cpu_count() or 2) - 1))
+        #   thisDF is written once as an Arrow IPC file, which each worker
+        # memory-maps, rather than being pickled to each worker in turn. Only
+        # the file's path is sent with each report.
+        arrowPath = os.path.join(logDirectory, 'GDELT_gkg_realtime.arrow')
+        GDELTeda.writeArrowFile(thisDF, arrowPath)
         del thisDF
+        GDELTedaGKGhelpers.releaseMemory()
+        reportArgs = []
+        for report in reports:
+          reportArgs.append((report, arrowPath, logDirectory, edaDateString,
+                             compressHTML))
+        with multiprocessing.get_context('spawn').Pool(reportWorkers) as pool:
+          for edaLogName in pool.starmap(GDELTedaGKGhelpers.realtimeReport,
+                                         reportArgs, chunksize = 1):
+            # subfield reports with no values return None, see
+            # GDELTedaGKGhelpers.realtimeReport()
+            if edaLogName is not None:
+              EDAFiles[table].append(edaLogName)
+        del reportArgs
+        os.remove(arrowPath)
+        print("\n ( all GKG reports: %0.3f s )" %
+              ((perf_counter_ns() - timecheckG) / 1e9))
 
       print(" Realtime", table,"EDA complete! ( total time taken: %0.3f s )"%
-            (float(time())-float(timecheckT)))
+            ((perf_counter_ns() - timecheckT) / 1e9))
       print("\n------------------------------------------------------------")
       # end of per-table loop
     
-    # B05j - End-of-function/iteration calls
+    # B05e - End-of-function/iteration calls
 
     # Continuing logic for delaying EDA generation
     if not lastRun:
@@ -1443,14 +1359,13 @@ directories.
       # maintaining cross-iteration tracking for comparison w/ lastupdate.txt and
       # maintaining datafile continuity.
       self.lastRealDatetime = thisDatetime
-      self.nextRealDatetime = thisDatetime + timedelta(minutes = 15)
-      inGap = False
-      # gap in datafiles past 10:45pm UTC, until 12:00am UTC (1 hour 15 minutes)
-      if self.nextRealDatetime.hour > 22:
-        self.nextRealDatetime = thisDatetime + timedelta(hours = 1)
-        inGap = True
+      # gap in datafiles past 10:45pm UTC, until 12:00am UTC (1 hour 15
+      # minutes), looked up from the precomputed realtimeSchedule
+      nextDelta, inGap = self.realtimeSchedule[
+        (thisDatetime.hour, thisDatetime.minute - thisDatetime.minute % 15)]
+      self.nextRealDatetime = thisDatetime + nextDelta
       # check for 22:45 to 00:00 gap, controls 'wait' time in loopEDA()
-      if inGap == True:
+      if inGap:
         return (True, 'inGap')
       else:
         return (True, 'continue')
@@ -1461,13 +1376,13 @@ directories.
       print("\n************************************************************\n")
 
       print("All table EDA reports generated! ( %0.2f s )\n" % \
-            (float(time())-float(timecheckF)))
+            ((perf_counter_ns() - timecheckF) / 1e9))
       print("EDA ProfileReport HTML files created:")
       pp(EDAFiles)
       print('')
       self.gBase.showLocalFiles(full = True, mode = 'realtime')
-      self.realtimeLooping == False
-      self.realtimeStarted == False
+      self.realtimeLooping = False
+      self.realtimeStarted = False
       self.realtimeWindow = 0
       self.lastRealDatetime = ''
       self.nextRealDatetime = ''
@@ -1476,7 +1391,7 @@ directories.
 
   # B06
   def loopEDA(self, window = 1, windowUnit = 'file',
-              tableList = ['events','mentions','gkg']):
+              tableList = ['events','mentions','gkg'], compressHTML = False):
     '''Loops calls of realtimeEDA() N iterations, where N is equal to
  'window' multiplied appropriately for windowUnit. Handles various
  potential failure states and delays execution of iterations until each
@@ -1510,6 +1425,9 @@ windowUnit - string, default 'file'
 tableList - list of strings, default ['events','mentions','gkg']
   Permits limiting of operations to one or more tables.
 
+compressHTML - boolean, default False
+  Passed to realtimeEDA(), see that function's description.
+
 Output:
 ------
 
@@ -1517,8 +1435,9 @@ Output:
 and function generates EDA profile html documents in appropriate project
 directories.
   Each 'wait' period will display the time remaining before the next update
-once every 60 seconds. In the case of UTC 22:45 to UTC 00:00, the function will
-wait at most 1 hour and 15 minutes before checking for another set of updates.
+once, as a single sleep, see waitUntil(). In the case of UTC 22:45 to UTC
+00:00, the function will wait at most 1 hour and 15 minutes before checking
+for another set of updates.
     '''
     if windowUnit not in ['day', 'hour', 'file']:
       print("\n  Error: bad windowUnit value. Please specify one of 'day',\n",
@@ -1557,9 +1476,9 @@ wait at most 1 hour and 15 minutes before checking for another set of updates.
       oneRun = True
 
     # 'oneRun' iteration prior to loop, looping or not.
-    timecheckG = time()
-    self.realtimeEDA(tableList)
-    timeTaken = float(time()) - float(timecheckG)
+    timecheckG = perf_counter_ns()
+    self.realtimeEDA(tableList, compressHTML)
+    timeTaken = (perf_counter_ns() - timecheckG) / 1e9
 
     # normal looping behavior mandates a pause, here
     if oneRun:
@@ -1571,43 +1490,21 @@ wait at most 1 hour and 15 minutes before checking for another set of updates.
     # First wait period prior to loop, if looping.
     #   Check the current datetime against self.nextRealDatetime, then wait the
     # difference before running another realtimeEDA() iteration.
-    timeNow = datetime.now(timezone.utc)
-    timeLeft = (self.nextRealDatetime - timeNow).seconds
-    if timeLeft > 0:
-      print("Time remaining before next update at", self.nextRealDatetime,
-            "\n  %d seconds (%0.2f minutes)" %
-            (timeLeft, float(timeLeft)/float(60)))
-      print("Current UTC time:", timeNow)
-      print("Waiting", timeLeft, "seconds before attempting next iteration...")
-      while(timeLeft > 60):
-        sleep(60)
-        timeLeft -= 60
-        print("Waiting",timeLeft,"seconds before attempting next iteration...")
-      sleep(timeLeft)
-    else:
-      print("  Warning: unexpected datetime issue.")
-      print("  Waiting 15 minutes minus the time taken for first iteration",
-            "before attempting next iteration.")
-      timeLeft = 900 - timeTaken
-      while(timeLeft > 60):
-        timeLeft -= 60
-        sleep(60)
-        print("Waiting",timeLeft,"seconds before attempting next iteration...")
-      sleep(timeLeft)
-
-    timecheckG = time()
+    GDELTeda.waitUntil(self.nextRealDatetime, 900 - timeTaken)
+
+    timecheckG = perf_counter_ns()
     # loops until failure or realtimeWindow iterations
     # 'firstRun' call above sets realtimeLooping to True
     # failure states or completion of all iterations sets it to false
     while self.realtimeLooping:
       #  tracking each iteration's runtime to completion as a failsafe
-      timecheckL = time()
+      timecheckL = perf_counter_ns()
       #   realtimeEDA() call returns tuple of Boolean success/failure and
       # a string for that iteration's result.
       print("  Wait complete! Trying next iteration...")
       print("\n------------------------------------------------------------\n")
-      thisEDA = self.realtimeEDA(tableList)
-      lastTimeTaken = (float(time()) - float(timecheckL))
+      thisEDA = self.realtimeEDA(tableList, compressHTML)
+      lastTimeTaken = (perf_counter_ns() - timecheckL) / 1e9
 
       # state handling for iteration results
       if thisEDA[0] == False:
@@ -1649,71 +1546,285 @@ wait at most 1 hour and 15 minutes before checking for another set of updates.
           break
         else:
           #   When loop isn't finished but running successfully, each iteration
-          # needs to be delayed according to when the next update will be.
-          timeNow = datetime.now(timezone.utc)
-          timeLeft = (self.nextRealDatetime - timeNow).seconds
-          # 'inGap' case, greater wait time required before next update
+          # needs to be delayed according to when the next update will be,
+          # self.nextRealDatetime, set by realtimeEDA() for both the 'inGap'
+          # and 'continue' cases.
           if thisEDA[1] == 'inGap':
             #   After any call for 22:45 UTC files, will need to wait until
             # 00:00 for next files.
-            if timeLeft > 0:
-              print("\nExtra wait necessary due to gap before next",
-                    "datafiles at", self.nextRealDatetime)
-              print("Waiting", timeLeft, "seconds before attempting next",
-                    "iteration... (e.g., %0.2f minutes, or %0.2f hours)" %
-                    (float(timeLeft)/float(60),
-                     float(timeLeft)/float(60)/float(60)))
-              print("Current UTC time:", timeNow)
-              print("Waiting", timeLeft, "seconds before attempting next",
-                    "iteration...")
-              while(timeLeft > 60):
-                sleep(60)
-                timeLeft -= 60
-                print("Waiting",timeLeft,"seconds before attempting next",
-                      "iteration...")
-              sleep(timeLeft)
-            else:
-              print("  Warning: unexpected datetime issue.")
-              print("  Waiting 15 minutes minus the time taken for first",
-                    "iteration before attempting next iteration.")
-              timeLeft = 900 - timeTaken
-              while(timeLeft > 60):
-                timeLeft -= 60
-                sleep(60)
-                print("Waiting",timeLeft,"seconds before attempting next",
-                      "iteration...")
-              sleep(timeLeft)
-          #  'continue' case, wait the normal 15 minutes minus however long the
-          # last iteration required
-          if thisEDA[1] == 'continue':
-            if timeLeft > 0:
-              print("Time remaining before next update at",
-                    self.nextRealDatetime, "\n  %d seconds (%0.2f minutes)" %
-                    (timeLeft, float(timeLeft)/float(60)))
-              print("Current UTC time:", timeNow)
-              print("Waiting", timeLeft, "seconds before attempting next",
-                    "iteration...")
-              while(timeLeft > 60):
-                sleep(60)
-                timeLeft -= 60
-                print("Waiting",timeLeft,"seconds before attempting next",
-                      "iteration...")
-              sleep(timeLeft)
-            else:
-              print("  Warning: unexpected datetime issue.")
-              print("  Waiting 15 minutes minus the time taken for first",
-                    "iteration",
-                    "before attempting next iteration.")
-              timeLeft = 900 - timeTaken
-              while(timeLeft > 60):
-                timeLeft -= 60
-                sleep(60)
-                print("Waiting",timeLeft,"seconds before attempting next",
-                      "iteration...")
-              sleep(timeLeft)
+            print("\nExtra wait necessary due to gap before next",
+                  "datafiles at", self.nextRealDatetime)
+          #   If that time has somehow passed, the wait is the normal 15
+          # minutes minus however long the last iteration required.
+          GDELTeda.waitUntil(self.nextRealDatetime, 900 - lastTimeTaken)
       # loop ends, function ends
 
 
+  # B07
+  def cursorToDataFrame(cursor, columnNames, batchSize = 50000,
+                        recordCount = None):
+    '''Builds a Pandas DataFrame from a pymongo cursor, one batch of
+records at a time, by way of pyarrow Tables.
+
+  Used in place of pd.DataFrame.from_records(list(cursor)), which holds
+every record as a Python dict alongside the DataFrame built from them.
+Here, only 'batchSize' records are held as Python objects at any time,
+with each batch converted to Arrow columns before the next is pulled.
+  As with eventsBatchEDA() and mentionsBatchEDA(), this function does not
+take 'self', so it may be called as GDELTeda.cursorToDataFrame() within
+multiprocessing.Pool() worker processes.
+
+Parameters:
+----------
+
+cursor - pymongo.cursor.Cursor or pymongo.command_cursor.CommandCursor
+  Result of a collection.find() or collection.aggregate() call for the
+ records to be pulled.
+
+columnNames - list of strings
+  Column names for the resulting DataFrame, in order. Fields missing from
+ a record are filled with None.
+
+batchSize - int, default 50000
+  Number of records converted to Arrow columns at a time, also passed to
+ cursor.batch_size().
+
+recordCount - int, default None
+  Expected number of records, e.g. from count_documents() or
+ estimated_document_count(). If given, progress is printed after each
+ batch.
+
+output:
+------
+
+  Returns a Pandas DataFrame with columns 'columnNames'. dtypes are as
+ inferred by pyarrow, and should be set by the caller with .astype().
+    '''
+    cursor.batch_size(batchSize)
+    arrowTables = []
+    columns = {}
+    for name in columnNames:
+      columns[name] = []
+    batchCount = 0
+    #   Cursors are opened with 'no_cursor_timeout', so the server won't
+    # close them while a long pull is between batches. The with block closes
+    # the cursor on the server as soon as iteration ends, or fails, rather
+    # than leaving it open until garbage collection.
+    with cursor:
+      for record in cursor:
+        for name in columnNames:
+          columns[name].append(record.get(name))
+        batchCount += 1
+        if batchCount == batchSize:
+          arrowTables.append(pa.Table.from_pydict(columns))
+          for name in columnNames:
+            columns[name] = []
+          batchCount = 0
+          if recordCount:
+            print("    %d of %d records..." % (len(arrowTables) * batchSize,
+                                              recordCount))
+    if batchCount > 0 or len(arrowTables) == 0:
+      arrowTables.append(pa.Table.from_pydict(columns))
+    del columns
+
+    #   A batch with only missing values for a column is typed as null, so
+    # 'promote' is needed for concatenating with batches that have values.
+    arrowTable = pa.concat_tables(arrowTables, promote = True)
+    del arrowTables
+    return arrowTable.to_pandas(split_blocks = True, self_destruct = True)
+
+
+  # B08
+  def pinWorker():
+    '''multiprocessing.Pool() initializer, pinning each worker process to
+its own CPU core, so long column scans in report generation keep their
+caches rather than moving between cores.
+
+  Workers are numbered from 1 by multiprocessing, and take cores in order
+from those available to this process. Pinning is skipped on platforms
+without os.sched_setaffinity() (Windows, macOS).
+    '''
+    if not hasattr(os, 'sched_setaffinity'):
+      return
+    availableCores = sorted(os.sched_getaffinity(0))
+    workerNumber = multiprocessing.current_process()._identity[0]
+    os.sched_setaffinity(0, {availableCores[(workerNumber - 1) %
+                                            len(availableCores)]})
+
+
+
+  # B09
+  def batchCachePath(table, dateRange = None):
+    '''Returns the path of the Parquet cache of a table's pulled, typed,
+and parsed batch EDA records for 'dateRange', in that table's batch log
+directory. Used by eventsBatchEDA(), mentionsBatchEDA(), and
+gkgBatchEDA().
+
+Parameters:
+----------
+
+table - string
+  One of 'events', 'mentions', or 'gkg'.
+
+dateRange - tuple of two strings, default None
+  As passed to eventsBatchEDA() or mentionsBatchEDA(). Caches for all
+ records in a collection are named for 'all'.
+    '''
+    if dateRange is None:
+      cacheDates = 'all'
+    else:
+      cacheDates = "_to_".join(dateRange).replace(':', '')
+    return os.path.join(GDELTeda.logPath[table]['batch'],
+                        "GDELT_%s_cache_%s.parquet" % (table, cacheDates))
+
+
+  # B10
+  def writeArrowFile(tableDF, arrowPath):
+    '''Writes a DataFrame to an Arrow IPC file, for worker processes to
+memory-map with GDELTedaGKGhelpers.readArrowFile(), in place of pickling
+the DataFrame to each of them. Used by gkgBatchEDA() and realtimeEDA().
+
+Parameters:
+----------
+
+tableDF - Pandas DataFrame
+  DataFrame to be written. Its index is not kept.
+
+arrowPath - string
+  Path of the file to be written, removed by the caller once workers are
+ done with it.
+    '''
+    arrowTable = pa.Table.from_pandas(tableDF, preserve_index = False)
+    with pa.OSFile(arrowPath, 'wb') as sink:
+      with pa.ipc.new_file(sink, arrowTable.schema) as writer:
+        writer.write_table(arrowTable)
+    del arrowTable
+
+
+  # B11
+  def parseDatetimes(tableDF, datetimeFields,
+                     datetimeFormat = "%Y-%m-%dT%H:%M:%S.000000Z"):
+    '''Parses one or more datetime string columns of a DataFrame in a
+single pd.to_datetime() call, returning the DataFrame with those columns
+converted. Used by eventsBatchEDA(), mentionsBatchEDA(), and
+realtimeEDA().
+
+  GDELT datetimes repeat heavily, one value per 15-minute update, so
+parsing all fields' strings together with 'cache' parses each distinct
+value once across every field. Strings are passed as a plain object
+array, skipping Series and string-extension-array handling in
+pd.to_datetime().
+
+Parameters:
+----------
+
+tableDF - Pandas DataFrame
+  DataFrame holding the datetime string columns.
+
+datetimeFields - list of strings
+  Names of the columns to be parsed.
+
+datetimeFormat - string, default "%Y-%m-%dT%H:%M:%S.000000Z"
+  strptime() format of the stored strings, GDELTbase's MongoDB format.
+    '''
+    recordCount = len(tableDF)
+    datetimeStrings = []
+    for field in datetimeFields:
+      datetimeStrings.append(tableDF[field].to_numpy(dtype = object))
+    parsedDatetimes = pd.to_datetime(np.concatenate(datetimeStrings),
+                                     format = datetimeFormat,
+                                     cache = True).values
+    del datetimeStrings
+    for position, field in enumerate(datetimeFields):
+      tableDF[field] = parsedDatetimes[position * recordCount:
+                                       (position + 1) * recordCount]
+    del parsedDatetimes
+    return tableDF
+
+
+  # B12
+  def ingestRealtimeFile(self, table, fileURL):
+    '''Downloads, cleans, and exports to MongoDB the most recent GDELT
+datafile for one table, as a single independent pipeline. Used by
+realtimeEDA(), which runs one per table concurrently, each in its own
+thread.
+
+  On the first realtimeEDA() iteration (self.realtimeStarted == False),
+the table's 'realtime' MongoDB collection is dropped before export.
+
+Parameters:
+----------
+
+table - string
+  One of 'events', 'mentions', or 'gkg'.
+
+fileURL - string
+  URL of the datafile, from lastupdate.txt.
+    '''
+    self.gBase.downloadGDELTFile(fileURL, table, verbose = False,
+                                 mode = 'realtime')
+
+    #   Matching the same input formatting requirements, typically performed
+    # in the 'table' versions of GDELTbase methods
+    fileName = fileURL.replace(self.gBase.toolData['URLbase'], '')
+    fileName = fileName.replace('.zip', '')
+    # cleaning the file (exported to realtimeClean as .parquet)
+    print("Trying cleaning for most recent", table, "file...")
+    self.gBase.cleanFile(fileName, verbose = True, mode = 'realtime')
+
+    # GKG still has different extensions...
+    if table == 'gkg':
+      cleanFileName = fileName.replace('.csv', '.parquet')
+    else:
+      cleanFileName = fileName.replace('.CSV', '.parquet')
+
+    #   Each iterative run of realtimeEDA() will add another most-recent
+    # datafile, so long as it hasn't already been collected and cleaned, but
+    # the first run should wipe per-table collections before populating 'em
+    # with records.
+    if not self.realtimeStarted:
+      print("  Dropping any old realtime", table, "MongoDB collection...")
+      self.gBase.localDb['collections']['realtime'][table].drop()
+    print("Starting MongoDB export for acquired", table, "file...")
+    self.gBase.mongoFile(cleanFileName, table, verbose = True,
+                         mode = 'realtime')
+    return True
+
+
+  # B13
+  def waitUntil(deadline, fallbackSeconds):
+    '''Sleeps until a UTC datetime, in one sleep() call, for loopEDA()'s
+waits between realtimeEDA() iterations. The wait and the expected wake
+time are printed once beforehand, in place of a countdown every 60
+seconds.
+
+Parameters:
+----------
+
+deadline - datetime.datetime
+  Timezone-aware UTC datetime to wait for, e.g. self.nextRealDatetime.
+
+fallbackSeconds - float
+  Seconds to wait instead, if 'deadline' has already passed.
+    '''
+    timeNow = datetime.now(timezone.utc)
+    #   total_seconds(), since timedelta.seconds is never negative, wrapping
+    # a passed deadline to most of a day instead.
+    timeLeft = (deadline - timeNow).total_seconds()
+    if timeLeft > 0:
+      print("Time remaining before next update at", deadline,
+            "\n  %d seconds (%0.2f minutes)" %
+            (timeLeft, float(timeLeft)/float(60)))
+      print("Current UTC time:", timeNow)
+    else:
+      print("  Warning: unexpected datetime issue.")
+      print("  Waiting 15 minutes minus the time taken for the last",
+            "iteration before attempting next iteration.")
+      timeLeft = max(0, fallbackSeconds)
+    print("Waiting %d seconds before attempting next iteration, until %s..."
+          % (timeLeft, timeNow + timedelta(seconds = timeLeft)))
+    sleep(timeLeft)
+
 # C00
 # in-design iterative testing with direct execution
 if __name__ == "__main__":
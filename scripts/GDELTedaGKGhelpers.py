@@ -9,6 +9,7 @@ subset dataframes.
 
 Contents:
   A - GDELTedaGKGhelpers
+    A00 - shared class data
     A01 - __init__ -- empty, unused
   B00 - class methods
     B01 - pullMainGKGcolumns()
@@ -21,11 +22,44 @@ Contents:
     B08 - themesReport()
     B09 - personsReport()
     B10 - organizationsReport()
+    B11 - sampleForReport()
+    B12 - explodeSubfield()
+    B13 - saveReport()
+    B14 - renderReport()
+    B15 - cursorToColumnsDF()
+    B16 - prepareMainChunk()
+    B17 - reportFromArrow()
+    B18 - realtimeReport()
+    B19 - readArrowFile()
+    B20 - astypeStrings()
+    B21 - valueCountsReport()
+    B22 - prepareGKG()
+    B23 - profileConfig()
+    B24 - subfieldReport()
+    B25 - releaseMemory()
+    B26 - writeReportHTML()
+    B27 - pullSubfieldValues()
+    B28 - splitV15Tone()
+    B29 - summarizeColumns()
+    B30 - edaDateRange()
+    B31 - subfieldProjection()
 '''
-import pymongo
+import ctypes
+import gc
+import gzip
+import html
+import os
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+import yaml
+from GDELTbase import GDELTbase
 from pandas_profiling import ProfileReport
+from pandas_profiling.config import Settings
+from pathlib import Path
 from pprint import pprint as pp
+from time import perf_counter_ns
 
 
 # A
@@ -34,6 +68,104 @@ class GDELTedaGKGhelpers:
  functions for performing RAM-isolated operations on GDELT GKG record
  subset dataframes.
   '''
+  # A00 - shared class data
+
+  #   Batch GKG EDA log directory, matching GDELTeda.logPath['gkg']['batch'],
+  # where reports are written and their configuration file copies are kept.
+  # Resolved from __file__, so reports don't depend on the current working
+  # directory.
+  logPath = str(Path(__file__).resolve().parent.parent / 'EDAlogs' / 'gkg' /
+                'batch')
+
+  #   V15Tone_X column dtypes, narrowed from float64 at creation. Tone
+  # scores and percentages are bounded and need no more than float32
+  # precision, and word counts are whole, non-negative numbers. The
+  # nullable 'UInt32' dtype keeps missing word counts as <NA>.
+  v15ToneDtypes = {
+    'V15Tone_Tone'      : 'float32',
+    'V15Tone_Positive'  : 'float32',
+    'V15Tone_Negative'  : 'float32',
+    'V15Tone_Polarity'  : 'float32',
+    'V15Tone_ARD'       : 'float32',
+    'V15Tone_SGRD'      : 'float32',
+    'V15Tone_WordCount' : pd.UInt32Dtype(),
+    }
+
+  #   Arrow types of V15Tone dicts and of dict subfields' values, given to
+  # pa.array() by splitV15Tone() and explodeSubfield(), so pyarrow converts
+  # values straight to these types rather than first scanning every value
+  # to infer them, once per call. Subfield keys and types follow
+  # GDELTbase.toolData['subfields'], with floats built as float32.
+  v15ToneType = pa.struct([
+    ('Tone', pa.float32()),
+    ('Positive', pa.float32()),
+    ('Negative', pa.float32()),
+    ('Polarity', pa.float32()),
+    ('ARD', pa.float32()),
+    ('SGRD', pa.float32()),
+    ('WordCount', pa.int64()),
+    ])
+  subfieldArrowTypes = {
+    subfield : pa.struct([
+      (key, {int : pa.int64(), str : pa.string(),
+             float : pa.float32()}[keyType])
+      for key, keyType in keyTypes])
+    for subfield, keyTypes in GDELTbase.toolData['subfields'].items()
+    }
+
+  #   Variable-length GKG columns, each reported on separately from the main
+  # columns, see reportFromArrow() and realtimeReport().
+  subfields = ['V1Locations', 'V1Counts', 'V1Themes', 'V1Persons',
+               'V1Organizations']
+
+  #   V1Locations and V1Counts values are dicts, split into a column per
+  # key by explodeSubfield(), with these column types, and reported on
+  # with ProfileReport(). Other subfields' values are plain strings,
+  # reported on with valueCountsReport(). See subfieldReport() and
+  # realtimeReport().
+  #   Names and codes repeat heavily across exploded rows (a few hundred
+  # country codes over millions of locations), so they're categories,
+  # dictionary-encoded by explodeSubfield(), stored once per distinct
+  # value. Free-text object types and feature IDs stay strings.
+  subfieldTypes = {
+    'V1Locations' : {
+      'V1Locations_FullName'    : 'category',
+      'V1Locations_CountryCode' : 'category',
+      'V1Locations_ADM1Code'    : 'category',
+      'V1Locations_FeatureID'   : pd.StringDtype(),
+      },
+    'V1Counts' : {
+      'V1Counts_CountType'           : 'category',
+      'V1Counts_ObjectType'          : pd.StringDtype(),
+      'V1Counts_LocationFullName'    : 'category',
+      'V1Counts_LocationCountryCode' : 'category',
+      'V1Counts_LocationADM1Code'    : 'category',
+      'V1Counts_LocationFeatureID'   : pd.StringDtype(),
+      },
+    }
+
+  #   Dict keys left out of batch subfield reports, never pulled from
+  # MongoDB or built as columns, see subfieldProjection() and
+  # subfieldReport().
+  batchSkipKeys = {
+    'V1Counts' : ['LocationLatitude', 'LocationLongitude'],
+    }
+
+  #   Datetime format of report file names' date ranges, see
+  # edaDateRange(), shared with GDELTeda's report file names.
+  strftimeFormat = "%Y-%m-%dh%Hm%M"
+
+  #   glibc, whose malloc_trim() returns freed heap pages to the OS in
+  # releaseMemory(). None where glibc isn't available.
+  try:
+    libc = ctypes.CDLL("libc.so.6")
+  except OSError:
+    libc = None
+
+  #   Parsed ProfileReport configuration files, keyed by path, with each
+  # file's modification time, see profileConfig(). Filled per process.
+  profileSettings = {}
+
   # A01
   def __init__(self):
     '''This class collects functions called w/o instance.
@@ -43,7 +175,7 @@ class GDELTedaGKGhelpers:
   # B00 - class methods
 
   # B01
-  def pullMainGKGcolumns(mode = 'batch'):
+  def pullMainGKGcolumns(mode = 'batch', subfields = ()):
     '''Extracts all non-variable-length columns for GKG records present
  in local MongoDB instance and converts them into a returned Pandas
  DataFrame. Intended for use in GDELTeda method gkgBatchEDA()
@@ -57,6 +189,11 @@ mode - arbitrary
  function requirements. As such, it it present only to receive a
  parameter determined by map(chunksize = 1), e.g. one iteration of the
  function will execute.
+
+subfields - list of strings, default ()
+  Variable-length columns (e.g. 'V1Locations') pulled in the same query,
+ kept as Python lists, so their values are aligned with the main columns
+ without another pass over the collection.
     '''
     columnNames = [
       'GKGRECORDID',
@@ -64,48 +201,38 @@ mode - arbitrary
       'V2SourceCommonName',
       'V2DocumentIdentifier',
       'V15Tone',
-      ]
+      ] + list(subfields)
+    projection = {'_id' : False}
+    for name in columnNames:
+      projection.update(GDELTedaGKGhelpers.subfieldProjection(name))
 
+    #   GDELTbase's class-level MongoClient is shared by all functions here,
+    # one per worker process, rather than opening a new client per call.
     localDb = {}
-    localDb['client'] = pymongo.MongoClient()
-    localDb['database'] = localDb['client'].capstone
     if mode == 'batch':
-      localDb['collection'] = localDb['database'].GDELT.gkg
+      localDb['collection'] = GDELTbase.localDb['collections']['gkg']
     elif mode == 'realtime':
-      localDb['collection'] = localDb['database'].GDELT.realtime.gkg
-
-    print("    Converting Pymongo result cursor to Python list of dicts...")
-    tableList = list(localDb['collection'].find(
-      projection = {'GKGRECORDID'          : True,
-                    'V21DATE'              : True,
-                    'V2SourceCommonName'   : True,
-                    'V2DocumentIdentifier' : True,
-                    'V15Tone'              : True,
-                    '_id'                  : False},
+      localDb['collection'] = \
+        GDELTbase.localDb['collections']['realtime']['gkg']
+
+    print("    Converting Pymongo result cursor to DataFrame columns...")
+    return GDELTedaGKGhelpers.cursorToColumnsDF(localDb['collection'].find(
+      projection = projection,
       allow_disk_use = True,
       no_cursor_timeout = True,
-      ))
-
-    print("    Converting list of dicts to Pandas DataFrame...")
-    tableDF = pd.DataFrame.from_records(tableList.copy(),
-                                        columns = columnNames)
-    del tableList
-    return tableDF
+      ), columnNames)
 
 
   # B02
   def applyDtypes(mainDF):
-    '''Calls mainDF.astype(dtype = columnTypes, copy = False), returns
- resulting typed DataFrame. Intended for use in GDELTeda method
+    '''Sets string columns to pd.StringDtype() with astypeStrings(),
+ returns resulting typed DataFrame. Intended for use in GDELTeda method
  gkgBatchEDA() multiprocessing Pool.map() calls.
     '''
-    columnTypes = {
-      'GKGRECORDID'          : pd.StringDtype(),
-      'V21DATE'              : pd.StringDtype(),
-      'V2SourceCommonName'   : pd.StringDtype(),
-      'V2DocumentIdentifier' : pd.StringDtype(),
-      }
-    return mainDF.astype(dtype = columnTypes, copy = False)
+    return GDELTedaGKGhelpers.astypeStrings(mainDF, ['GKGRECORDID',
+                                                     'V21DATE',
+                                                     'V2SourceCommonName',
+                                                     'V2DocumentIdentifier'])
 
 
   # B03
@@ -116,9 +243,9 @@ mode - arbitrary
     '''
     datetimeField = "V21DATE"
     datetimeFormat = "%Y-%m-%dT%H:%M:%S.000000Z"
-    strftimeFormat = "%Y-%m-%dh%Hm%M"
     mainDF[datetimeField] = pd.to_datetime(mainDF[datetimeField],
-                                           format = datetimeFormat)
+                                           format = datetimeFormat,
+                                           cache = True)
     return mainDF
 
 
@@ -128,45 +255,52 @@ mode - arbitrary
  returns resulting modified DataFrame. Intended for use in GDELTeda
  method gkgBatchEDA() multiprocessing Pool.map() calls.
     '''
-    print("    Normalizing...")
-    subcols = pd.json_normalize(mainDF['V15Tone'])
-
-    print("    Renaming subfield columns...")
-    subcols.columns = [f"V15Tone_{c}" for c in subcols.columns]
+    print("    Splitting V15Tone dicts to columns...")
+    subcols = GDELTedaGKGhelpers.splitV15Tone(mainDF['V15Tone'],
+                                              mainDF.index)
 
     print("    Dropping old 'V15Tone', joining subfield columns...")
     return mainDF.drop(columns = ['V15Tone']).join(subcols)
 
   # B05
-  def mainReport(mainDF):
+  def mainReport(mainDF, sampleRows = 500000, edaDates = None):
     '''Generates simple EDA on GKG columns not subject to variable-
  length values. Intended for use in GDELTeda method gkgBatchEDA()
  multiprocessing Pool.map() calls.
+
+   As with all report functions here, 'sampleRows' limits the records
+ passed to ProfileReport(), see sampleForReport(), and 'edaDates', if
+ given, is the report's date range string, see edaDateRange(), computed
+ once by the caller for all reports rather than by each of them.
     '''
     configFileName = "GDELTgkgMainEDAconfig_batch.yaml"
-    strftimeFormat = "%Y-%m-%dh%Hm%M"
+    if edaDates is None:
+      edaDates = GDELTedaGKGhelpers.edaDateRange(mainDF['V21DATE'])
 
-    edaLogName = "".join(["GDELT_GKG_main_EDA_",
-      mainDF['V21DATE'].min().strftime(strftimeFormat),"_to_",
-      mainDF['V21DATE'].max().strftime(strftimeFormat), '.html',
-      ])
+    edaLogName = "".join(["GDELT_GKG_main_EDA_", edaDates, '.html'])
 
     print("  File output:", edaLogName, "\n")
 
-    print("    Setting index to 'GKGRECORDID'...")
-    #   Not using 'inplace = True' in order to preserve mainDF state,
-    # regardless of how Python treats function parameters. Safety.
-    thisDF = mainDF.set_index(keys='GKGRECORDID', drop = True, append = False,
-                              verify_integrity = False)
-    profile = ProfileReport(thisDF, config_file = configFileName)
-    profile.to_file(output_file = edaLogName)
+    #   'GKGRECORDID' is left as a column, rather than set as the index,
+    # since ProfileReport() resets any index other than a RangeIndex back
+    # to a column, and each set_index() copies the whole DataFrame.
+    thisDF = mainDF
+    edaLogPath = os.path.join(GDELTedaGKGhelpers.logPath, edaLogName)
+    configFilePath = os.path.join(GDELTedaGKGhelpers.logPath, configFileName)
+    thisDF = GDELTedaGKGhelpers.sampleForReport(thisDF, sampleRows,
+                                                edaLogPath)
+    profile = ProfileReport(
+      thisDF, config = GDELTedaGKGhelpers.profileConfig(configFilePath))
+    GDELTedaGKGhelpers.saveReport(profile, edaLogPath)
     del profile
     del thisDF
+    GDELTedaGKGhelpers.releaseMemory()
     return True
 
 
   # B06
-  def locationsReport(mainDF):
+  def locationsReport(mainDF, sampleRows = 500000, subfieldValues = None,
+                      edaDates = None):
     '''Converts V1Locations subfield dict lists to V1Locations_X
  columns as a DataFrame normalized for variable-length lists of
  locations, which is then used to generate a Pandas Profiling report.
@@ -180,76 +314,13 @@ mode - arbitrary
  disk I/O will be dominated by these operations for any large GKG
  subsets.
     '''
-    localDb = {}
-    localDb['client'] = pymongo.MongoClient()
-    localDb['database'] = localDb['client'].capstone
-    localDb['collection'] = localDb['database'].GDELT.gkg
-
-    print("    Converting Pymongo result cursor to Python list of dicts...")
-    locationList = list(localDb['collection'].find(
-                                                   
-      projection = {'V1Locations' : True, '_id' : False},
-      allow_disk_use = True,
-      no_cursor_timeout = True,
-      ))
-
-    print("    Converting list of dicts to Pandas DataFrame...")
-    locationDF = pd.DataFrame.from_records(locationList)
-    del locationList
-    
-    print("    Joining with other columns...")
-    locationDF = pd.concat([mainDF, locationDF], axis = 1)
-
-    print("    Performing explode()...")
-    locationDF = locationDF.explode('V1Locations')
-
-    print("    Normalizing...")
-    subcols = pd.json_normalize(locationDF['V1Locations'])
-
-    print("    Renaming subfield columns...")
-    subcols.columns = [f"V1Locations_{c}" for c in subcols.columns]
-
-    print("    Dropping old 'V1Locations', joining subfield columns...")
-    locationDF = locationDF.drop(columns = ['V1Locations']).join(
-      subcols).astype({'V1Locations_FullName'    : pd.StringDtype(),
-                       'V1Locations_CountryCode' : pd.StringDtype(),
-                       'V1Locations_ADM1Code'    : pd.StringDtype(),
-                       'V1Locations_FeatureID'   : pd.StringDtype(),},
-                      copy = False)
-
-    print("\n  GKG Locations DataFrame .info():\n")
-    print(locationDF.info())
-
-    configFileName = "GDELTgkgLocationsEDAconfig_batch.yaml"
-    strftimeFormat = "%Y-%m-%dh%Hm%M"
-
-    print("\n    Generating report...")
-    edaDates = "".join([
-      locationDF['V21DATE'].min().strftime(strftimeFormat),"_to_",
-      locationDF['V21DATE'].max().strftime(strftimeFormat),
-      ])
-    edaLogName = "".join(["GDELT_GKG_locations_EDA_", edaDates,".html"])
-    print("    File output:", edaLogName, "\n")
-
-    #   Using 'inplace = True' here and in all following functions in
-    # order to save whatever RAM is possible from doing so, though
-    # setting the index repeatedly is not ideal.
-    print("    Setting index to 'GKGRECORDID'...")
-    locationDF.set_index(keys='GKGRECORDID', drop = True, append = False,
-                         inplace = True, verify_integrity = False)
-    
-    profile = ProfileReport(locationDF, config_file = configFileName)
-
-    print("\n    Generating html from report...")
-    profile.to_file(edaLogName)
-
-    del profile
-    del locationDF
-    return True
+    return GDELTedaGKGhelpers.subfieldReport(mainDF, 'locations', sampleRows,
+                                             subfieldValues, edaDates)
 
 
   # B07
-  def countsReport(mainDF):
+  def countsReport(mainDF, sampleRows = 500000, subfieldValues = None,
+                   edaDates = None):
     '''Converts V1Counts subfield dict lists to V1Counts_X columns as a
  DataFrame normalized for variable-length lists of counts, which is then
  used to generate a Pandas Profiling report. Intended for use in
@@ -260,259 +331,1035 @@ mode - arbitrary
  potentially operable for smaller sets, but such testing has not been
  performed as part of this capstone project.
     '''
-    localDb = {}
-    localDb['client'] = pymongo.MongoClient()
-    localDb['database'] = localDb['client'].capstone
-    localDb['collection'] = localDb['database'].GDELT.gkg
-
-    print("    Converting Pymongo result cursor to Python list of dicts...")
-    countList = list(localDb['collection'].find(
-      projection = {'V1Counts' : True, '_id' : False},
-      allow_disk_use = True,
-      no_cursor_timeout = True,
-      ))
-
-    print("    Converting list of dicts to Pandas DataFrame...")
-    countDF = pd.DataFrame.from_records(countList)
-    del countList
-
-    print("    Joining with other columns...")
-    countDF = pd.concat([mainDF, countDF], axis = 1)
-
-    print("    Performing explode()...")
-    countDF = countDF.explode('V1Counts')
-
-    print("    Normalizing...")
-    subcols = pd.json_normalize(countDF['V1Counts'])
-
-    print("    Renaming subfield columns...")
-    subcols.columns = [f"V1Counts_{c}" for c in subcols.columns]
-    subcols.drop(columns = ['V1Counts_LocationLatitude',
-                            'V1Counts_LocationLongitude'],
-                 inplace = True)
-
-    print("\n    Dropping old 'V1Counts', joining subfield columns...")
-    countDF = countDF.drop(columns = ['V1Counts']).join(
-      subcols).astype({
-        'V1Counts_CountType'           : pd.StringDtype(),
-        'V1Counts_ObjectType'          : pd.StringDtype(),
-        'V1Counts_LocationFullName'    : pd.StringDtype(),
-        'V1Counts_LocationCountryCode' : pd.StringDtype(),
-        'V1Counts_LocationADM1Code'    : pd.StringDtype(),
-        'V1Counts_LocationFeatureID'   : pd.StringDtype(),
-        }, copy = False)
-
-    print("\n  GKG Counts DataFrame .info():\n")
-    pp(countDF.info())
-
-    configFileName = "GDELTgkgCountsEDAconfig_batch.yaml"
-    strftimeFormat = "%Y-%m-%dh%Hm%M"
-
-    print("    Generating report...")
-    edaDates = "".join([
-      countDF['V21DATE'].min().strftime(strftimeFormat),"_to_",
-      countDF['V21DATE'].max().strftime(strftimeFormat),
-      ])
-    edaLogName = "".join(["GDELT_GKG_count_EDA_", edaDates,".html"])
-    print("    File output:", edaLogName, "\n")
-
-    print("    Setting index to 'GKGRECORDID'...")
-    countDF.set_index(keys='GKGRECORDID', drop = True, append = False,
-                      inplace = True, verify_integrity = False)
-
-    profile = ProfileReport(countDF, config_file = configFileName)
-    print("    Generating html from report...")
-    profile.to_file(edaLogName)
-    del profile
-    del countDF
-    return True
+    return GDELTedaGKGhelpers.subfieldReport(mainDF, 'counts', sampleRows,
+                                             subfieldValues, edaDates)
 
 
   # B08
-  def themesReport(mainDF):
+  def themesReport(mainDF, sampleRows = 500000, subfieldValues = None,
+                   edaDates = None):
     '''Converts V1Themes subfield lists to individual column values as
  a DataFrame normalized for variable-length lists of themes, which is
- then used to generate a Pandas Profiling report. Intended for use in
- GDELTeda method gkgBatchEDA() multiprocessing Pool.map() calls.
+ then used to generate a value counts report, see valueCountsReport().
+ Intended for use in GDELTeda method gkgBatchEDA() multiprocessing Pool.map()
+ calls.
 
    WARNING: this function is not working for the 30 day batch EDA test
  subset of GDELT records. As such, it's been left in place as
  potentially operable for smaller sets, but such testing has not been
  performed as part of this capstone project.
     '''
-    localDb = {}
-    localDb['client'] = pymongo.MongoClient()
-    localDb['database'] = localDb['client'].capstone
-    localDb['collection'] = localDb['database'].GDELT.gkg
+    return GDELTedaGKGhelpers.subfieldReport(mainDF, 'themes', sampleRows,
+                                             subfieldValues, edaDates)
 
-    print("    Converting Pymongo result cursor to Python listdicts...")
-    themeList = list(localDb['collection'].find(
-      projection = {'V1Themes' : True, '_id' : False},
-      allow_disk_use = True,
-      no_cursor_timeout = True,
-      ))
 
-    print("    Converting list of dicts to Pandas DataFrame...")
-    themeDF = pd.DataFrame.from_records(themeList)
-    del themeList
+  # B09
+  def personsReport(mainDF, sampleRows = 500000, subfieldValues = None,
+                    edaDates = None):
+    '''Converts V1Persons subfield lists to individual column values as
+ a DataFrame normalized for variable-length lists of persons, which is
+ then used to generate a value counts report, see valueCountsReport().
+ Intended for use in GDELTeda method gkgBatchEDA() multiprocessing Pool.map()
+ calls.
 
-    print("    Joining with other columns...")
-    themeDF = pd.concat([mainDF, themeDF], axis = 1)
+   WARNING: this function is not working for the 30 day batch EDA test
+ subset of GDELT records. As such, it's been left in place as
+ potentially operable for smaller sets, but such testing has not been
+ performed as part of this capstone project.
+    '''
+    return GDELTedaGKGhelpers.subfieldReport(mainDF, 'persons', sampleRows,
+                                             subfieldValues, edaDates)
 
-    print("    Performing explode()...")
-    themeDF = themeDF.explode('V1Themes')
 
-    print("    Correcting dtypes...")
-    themeDF = themeDF.astype({'V1Themes' : pd.StringDtype()}, copy = False)
+  # B10
+  def organizationsReport(mainDF, sampleRows = 500000,
+                          subfieldValues = None, edaDates = None):
+    '''Converts V1Organizations subfield lists to individual column values as
+ a DataFrame normalized for variable-length lists of organizations, which is
+ then used to generate a value counts report, see valueCountsReport().
+ Intended for use in GDELTeda method gkgBatchEda() multiprocessing Pool.map()
+ calls.
 
-    print("\n  GKG Themes DataFrame .info():\n")
-    pp(themeDF.info())
+   WARNING: this function is not working for the 30 day batch EDA test
+ subset of GDELT records. As such, it's been left in place as
+ potentially operable for smaller sets, but such testing has not been
+ performed as part of this capstone project.
+    '''
+    return GDELTedaGKGhelpers.subfieldReport(mainDF, 'organizations',
+                                             sampleRows, subfieldValues,
+                                             edaDates)
 
-    configFileName = "GDELTgkgThemesEDAconfig_batch.yaml"
-    strftimeFormat = "%Y-%m-%dh%Hm%M"
 
-    print("    Generating report...")
-    edaDates = "".join([
-      themeDF['V21DATE'].min().strftime(strftimeFormat),"_to_",
-      themeDF['V21DATE'].max().strftime(strftimeFormat),
-      ])
-    edaLogName = "".join(["GDELT_GKG_themes_EDA_", edaDates,".html"])
-    print("    File to output:", edaLogName, "\n")
+  # B11
+  def sampleForReport(tableDF, sampleRows, edaLogName):
+    '''Writes summary statistics for all of tableDF next to its EDA
+ report, then returns a random sample of at most 'sampleRows' records
+ for ProfileReport(). Correlations and interactions in ProfileReport()
+ grow much faster than the number of records, so reports on large
+ subsets are generated from samples, with exact per-column counts,
+ min/max, and most frequent values kept in the summary file.
+   Also used by GDELTeda methods eventsBatchEDA() and mentionsBatchEDA().
+
+Parameters:
+----------
+
+tableDF - Pandas DataFrame
+  Records to be profiled.
 
-    print("    Setting index to 'GKGRECORDID'...")
-    themeDF.set_index(keys='GKGRECORDID', drop = True, append = False,
-                      inplace = True, verify_integrity = False)
+sampleRows - int or None
+  Maximum records returned for ProfileReport(). If None, or if tableDF
+ has no more than this many records, tableDF is returned as-is.
 
-    profile = ProfileReport(themeDF, config_file = configFileName)
+edaLogName - string
+  File name of the report's html document. The summary is written to
+ the same name, with '.html' replaced by '_summary.parquet'.
+
+output:
+------
+
+  Writes a Parquet file of 'column', 'kind', 'key', and 'value' string
+ columns, holding describe()-style statistics ('kind' of 'describe') and
+ the top 50 values with their counts ('kind' of 'value_counts') for each
+ column, see summarizeColumns(). Returns tableDF or a sample of it.
+    '''
+    if sampleRows is None or len(tableDF) <= sampleRows:
+      return tableDF
+
+    print("    Writing full summary and sampling %d of %d records..." %
+          (sampleRows, len(tableDF)))
+    GDELTedaGKGhelpers.summarizeColumns(tableDF).to_parquet(
+      edaLogName.replace('.html', '_summary.parquet'), index = False)
+
+    #   The sample's index is reset, so ProfileReport() doesn't profile its
+    # shuffled row numbers as an extra 'index' column.
+    return tableDF.sample(n = sampleRows, random_state = 0).reset_index(
+      drop = True)
+
+
+  # B12
+  def explodeSubfield(mainDF, subfieldValues, subfieldName, skipKeys = (),
+                      columnTypes = None):
+    '''Joins mainDF rows to each value of a variable-length GKG column,
+ one row per value, as with DataFrame.explode(). Lists of dicts
+ (V1Locations, V1Counts) have each dict key split to its own column, as
+ with pd.json_normalize().
+   Lists are flattened by pyarrow compute functions on Arrow buffers,
+ with values converted to Pandas only as finished columns, strings as
+ pd.StringDtype(). Records with no values for the column have no rows in
+ the result.
+
+Parameters:
+----------
 
-    print("    Generating html from report...")
-    profile.to_file(edaLogName)
+mainDF - Pandas DataFrame
+  Non-variable-length GKG columns, with a default RangeIndex.
+
+subfieldValues - list or pyarrow list array
+  Values of column 'subfieldName' for each record, in the order of
+ mainDF records. Each value is a list of dicts, a list of strings, or None.
+ A pyarrow list array, e.g. a column read from an Arrow file, is used as
+ is.
+
+subfieldName - string
+  Name of the variable-length column, used for naming result columns as
+ 'subfieldName' or 'subfieldName_key'. float64 keys (e.g. latitudes and
+ longitudes) are narrowed to float32.
+
+skipKeys - list of strings, default ()
+  Dict keys left out of the result, never converted to columns. For a
+ list given as 'subfieldValues', these keys aren't converted to Arrow.
+
+columnTypes - dict, default None
+  Result column names mapped to dtypes, e.g. subfieldTypes['V1Locations'].
+ Columns typed 'category' are dictionary-encoded in Arrow, and become
+ Pandas categoricals without first being built as strings.
+
+output:
+------
+
+  Returns a Pandas DataFrame of mainDF columns and subfield columns.
+    '''
+    listType = None
+    if subfieldName in GDELTedaGKGhelpers.subfieldArrowTypes:
+      valueType = GDELTedaGKGhelpers.subfieldArrowTypes[subfieldName]
+      listType = pa.list_(pa.struct([
+        valueType[fieldIndex] for fieldIndex in range(valueType.num_fields)
+        if valueType[fieldIndex].name not in skipKeys]))
+    if isinstance(subfieldValues, pa.Array):
+      subfieldArray = subfieldValues
+    else:
+      subfieldArray = pa.array(subfieldValues, type = listType)
+    #   A column with no values in any record is typed null, which the list
+    # compute functions below reject, so it's given its list type, leaving
+    # a result with no rows.
+    if pa.types.is_null(subfieldArray.type):
+      subfieldArray = pa.nulls(len(subfieldArray),
+                               type = listType or pa.list_(pa.string()))
+    flatValues = pc.list_flatten(subfieldArray)
+    parentIndices = pc.list_parent_indices(subfieldArray).to_numpy()
+    del subfieldArray
+
+    #   take() gathers mainDF rows into one new DataFrame, and its index is
+    # replaced in place, where reset_index() would copy every column again.
+    subfieldDF = mainDF.take(parentIndices)
+    subfieldDF.index = pd.RangeIndex(len(subfieldDF))
+    del parentIndices
+    columnArrays = []
+    columnNames = []
+    if pa.types.is_struct(flatValues.type):
+      fieldArrays = flatValues.flatten()
+      for fieldIndex in range(flatValues.type.num_fields):
+        fieldName = flatValues.type[fieldIndex].name
+        if fieldName in skipKeys:
+          continue
+        fieldArray = fieldArrays[fieldIndex]
+        if pa.types.is_float64(fieldArray.type):
+          fieldArray = pc.cast(fieldArray, pa.float32())
+        columnName = subfieldName + '_' + fieldName
+        if columnTypes is not None and \
+           columnTypes.get(columnName) == 'category':
+          fieldArray = fieldArray.dictionary_encode()
+        columnArrays.append(fieldArray)
+        columnNames.append(columnName)
+      del fieldArrays
+    else:
+      columnArrays.append(flatValues)
+      columnNames.append(subfieldName)
+    del flatValues
+
+    #   Arrow string columns convert straight to pd.StringDtype(), so the
+    # callers' astypeStrings() calls find them already typed and skip them,
+    # rather than each value passing through a Python str object column.
+    columnsDF = pa.Table.from_arrays(columnArrays, names = columnNames)
+    del columnArrays
+    columnsDF = columnsDF.to_pandas(
+      split_blocks = True, self_destruct = True,
+      types_mapper = {pa.string() : pd.StringDtype()}.get)
+    for columnName in columnNames:
+      #   .array skips index alignment, both having rows in the same order
+      subfieldDF[columnName] = columnsDF[columnName].array
+    del columnsDF
+    return subfieldDF
+
+
+  # B13
+  def saveReport(profile, edaLogPath):
+    '''Saves a batch ProfileReport as JSON, plus a pickled dump for later
+ rendering to html by renderReport(), in place of ProfileReport.to_file()
+ html output.
+   Rendering html for a large report is the most RAM-intensive step of
+ its generation, so batch reports skip it, leaving rendering to its own
+ process, on demand.
+
+Parameters:
+----------
+
+profile - pandas_profiling.ProfileReport
+  Report to be saved.
+
+edaLogPath - string
+  Path of the report's html document. JSON and dump files are saved to
+ the same path, with '.html' replaced by '.json' and '.pp'.
+    '''
+    profile.to_file(edaLogPath.replace('.html', '.json'))
+    profile.dump(edaLogPath.replace('.html', '.pp'))
+
+
+  # B14
+  def renderReport(dumpPath):
+    '''Renders a ProfileReport dump saved by saveReport() to an html
+ document at the same path, with '.pp' replaced by '.html'. Intended for
+ use in multiprocessing.Pool() calls, so memory used for rendering is
+ released when the worker process exits, see GDELTeda.batchEDA().
+    '''
+    profile = ProfileReport().load(dumpPath)
+    profile.to_file(dumpPath.replace('.pp', '.html'))
     del profile
-    del themeDF
     return True
 
 
-  # B09
-  def personsReport(mainDF):
-    '''Converts V1Persons subfield lists to individual column values as
- a DataFrame normalized for variable-length lists of persons, which is
- then used to generate a Pandas Profiling report. Intended for use in
- GDELTeda method gkgBatchEDA() multiprocessing Pool.map() calls.
+  # B15
+  def cursorToColumnsDF(cursor, columnNames, batchSize = 100000):
+    '''Builds a Pandas DataFrame from a pymongo cursor by appending each
+ record's values to per-column lists, in place of
+ pd.DataFrame.from_records(list(cursor)), which holds every record as a
+ dict alongside the DataFrame built from them.
+   Unlike GDELTeda.cursorToDataFrame(), values are kept as Python
+ objects, so GKG's subfield lists and V15Tone dicts reach
+ explodeSubfield() and splitV15Tone() as they're stored in MongoDB.
 
-   WARNING: this function is not working for the 30 day batch EDA test
- subset of GDELT records. As such, it's been left in place as
- potentially operable for smaller sets, but such testing has not been
- performed as part of this capstone project.
+Parameters:
+----------
+
+cursor - pymongo.cursor.Cursor
+  Result of a collection.find() call for the records to be pulled.
+
+columnNames - list of strings
+  Column names for the resulting DataFrame, in order. Fields missing from
+ a record are filled with None.
+
+batchSize - int, default 100000
+  Passed to cursor.batch_size(), so records arrive from MongoDB in fewer,
+ larger batches than pymongo's default.
     '''
-    localDb = {}
-    localDb['client'] = pymongo.MongoClient()
-    localDb['database'] = localDb['client'].capstone
-    localDb['collection'] = localDb['database'].GDELT.gkg
+    cursor.batch_size(batchSize)
+    columns = {}
+    for name in columnNames:
+      columns[name] = []
+    #   As in GDELTeda.cursorToDataFrame(), the cursor is closed on the
+    # server once iteration ends, or fails.
+    with cursor:
+      for record in cursor:
+        for name in columnNames:
+          columns[name].append(record.get(name))
+    #   Each column's list is released as soon as its Series is built,
+    # rather than all lists being held until the DataFrame is complete.
+    tableColumns = {}
+    for name in columnNames:
+      tableColumns[name] = pd.Series(columns.pop(name), dtype = object)
+    tableDF = pd.DataFrame(tableColumns, columns = columnNames, copy = False)
+    del tableColumns
+    return tableDF
 
-    print("    Converting Pymongo result cursor to Python list...")
-    personList = list(localDb['collection'].find(
-      projection = {'V1Persons' : True, '_id' : False},
-      allow_disk_use = True,
-      no_cursor_timeout = True,
-      ))
 
-    print("    Converting list of dicts to Pandas DataFrame...")
-    personDF = pd.DataFrame.from_records(personList)
-    del personList
+  # B16
+  def prepareMainChunk(mainChunk):
+    '''Applies prepareGKG() to one row chunk of the main GKG columns.
+ Intended for use in GDELTeda method gkgBatchEDA() multiprocessing
+ Pool.imap_unordered() calls.
 
-    print("    Joining with other columns...")
-    personDF = pd.concat([mainDF, personDF], axis = 1)
+Parameters:
+----------
 
-    print("    Performing explode()...")
-    personDF = personDF.explode('V1Persons')
+mainChunk - tuple of (int, Pandas DataFrame)
+  The chunk's position among all chunks, and its rows of the main GKG
+ columns as returned by pullMainGKGcolumns().
 
-    print("    Correcting dtypes...")
-    personDF = personDF.astype({'V1Persons' : pd.StringDtype()},copy = False)
+output:
+------
 
-    print("\n  GKG Persons DataFrame .info():\n")
-    pp(personDF.info())
+  Returns a tuple of the chunk's position and its converted DataFrame,
+ so chunks may be reassembled in order however they finish.
+    '''
+    chunkIndex, chunkDF = mainChunk
+    return (chunkIndex, GDELTedaGKGhelpers.prepareGKG(chunkDF))
 
-    configFileName = "GDELTgkgPersonsEDAconfig_batch.yaml"
-    strftimeFormat = "%Y-%m-%dh%Hm%M"
 
-    print("    Generating report...")
-    edaDates = "".join([
-      personDF['V21DATE'].min().strftime(strftimeFormat),"_to_",
-      personDF['V21DATE'].max().strftime(strftimeFormat),
-      ])
-    edaLogName = "".join(["GDELT_GKG_persons_EDA_", edaDates,".html"])
-    print("    File to output:", edaLogName, "\n")
+  # B17
+  def reportFromArrow(reportFunction, arrowPath, sampleRows = 500000,
+                      subfield = None, edaDates = None):
+    '''Memory-maps the main GKG columns from an Arrow IPC file and passes
+ them to a report function. Intended for use in GDELTeda method
+ gkgBatchEDA() multiprocessing Pool.apply_async() calls, in place of
+ pickling the full DataFrame to each worker. Variable-length columns in
+ the file are kept out of the DataFrame, and one may be passed to the
+ report function as a pyarrow list array.
 
-    print("    Setting index to 'GKGRECORDID'...")
-    personDF.set_index(keys='GKGRECORDID', drop = True, append = False,
-                       inplace = True, verify_integrity = False)
+Parameters:
+----------
 
-    profile = ProfileReport(personDF, config_file = configFileName)
-    print("    Generating html from report...")
-    profile.to_file(edaLogName)
-    del profile
-    del personDF
+reportFunction - function
+  One of the report functions here, e.g. mainReport().
+
+arrowPath - string
+  Path of the Arrow IPC file written by gkgBatchEDA().
+
+sampleRows - int or None, default 500000
+  Passed to 'reportFunction', see sampleForReport().
+
+subfield - string, default None
+  Variable-length column passed to 'reportFunction' as its
+ 'subfieldValues', e.g. 'V1Locations' for locationsReport(). If None, or
+ if the file doesn't hold the column, only the DataFrame is passed. If
+ given, the DataFrame holds only 'GKGRECORDID', and 'V21DATE' if
+ 'edaDates' isn't given.
+
+edaDates - string, default None
+  Passed to 'reportFunction', see edaDateRange().
+
+output:
+------
+
+  Returns the result of 'reportFunction'.
+    '''
+    with pa.memory_map(arrowPath) as source:
+      arrowTable = pa.ipc.open_file(source).read_all()
+    reportOptions = {'edaDates' : edaDates}
+    if subfield in arrowTable.column_names:
+      reportOptions['subfieldValues'] = arrowTable.column(
+        subfield).combine_chunks()
+    #   Subfield reports use only 'GKGRECORDID' from the main columns, and
+    # 'V21DATE' for their dates if not given, so only those are converted
+    # to Pandas for them, rather than every main column, e.g. V15Tone_X,
+    # being copied out of the file.
+    if subfield is None:
+      arrowTable = arrowTable.drop([
+        name for name in arrowTable.column_names
+        if name in GDELTedaGKGhelpers.subfields])
+    elif edaDates is None:
+      arrowTable = arrowTable.select(['GKGRECORDID', 'V21DATE'])
+    else:
+      arrowTable = arrowTable.select(['GKGRECORDID'])
+    mainDF = arrowTable.to_pandas(split_blocks = True, self_destruct = True)
+    del arrowTable
+    return reportFunction(mainDF, sampleRows, **reportOptions)
+
+
+  # B18
+  def realtimeReport(report, arrowPath, logDirectory, edaDateString,
+                     compressHTML = False):
+    '''Generates one realtime GKG EDA report, for the main columns or for
+ one variable-length subfield, from the realtime GKG DataFrame built by
+ GDELTeda.realtimeEDA(). Intended for use in that method's
+ multiprocessing Pool.starmap() call, so each report runs in its own
+ worker process.
+
+Parameters:
+----------
+
+report - string
+  One of 'main', 'locations', 'counts', 'themes', 'persons', or
+ 'organizations'. 'main' drops every variable-length column. Dict
+ subfield reports keep only 'GKGRECORDID' and their own column (e.g.
+ 'V1Locations'), exploded to one row per value, and single string
+ subfields keep only their own column, counted unexploded.
+
+arrowPath - string
+  Path of the Arrow IPC file of realtime GKG records, after prepareGKG(),
+ written by GDELTeda.writeArrowFile().
+
+logDirectory - string
+  Realtime GKG log directory, holding report configuration files.
+
+edaDateString - string
+  Datetime string used in the report's file name.
+
+compressHTML - boolean, default False
+  Passed to writeReportHTML() for ProfileReport() reports.
+
+output:
+------
+
+  Writes the report's html document to 'logDirectory', and returns its
+ file name, or returns None if the report's subfield has no values.
+    '''
+    timecheck = perf_counter_ns()
+    #   Only the main columns are converted to Pandas. A subfield column is
+    # taken from the memory-mapped Arrow file as a list array, and dict
+    # subfields are exploded and split into columns in one pass by
+    # explodeSubfield()'s pyarrow compute functions, without Python-level
+    # iteration over their values.
+    with pa.memory_map(arrowPath) as source:
+      arrowTable = pa.ipc.open_file(source).read_all()
+    if report == 'main':
+      reportDF = arrowTable.drop(GDELTedaGKGhelpers.subfields).to_pandas(
+        split_blocks = True)
+    else:
+      #   Main columns are reported on by the 'main' report, so subfield
+      # reports take only 'GKGRECORDID', to identify the subfield's values,
+      # rather than repeating every main column for each value.
+      subfield = 'V1' + report.capitalize()
+      reportDF = arrowTable.column(subfield).combine_chunks()
+      #   No records hold values for this subfield, so there's nothing to
+      # report on, and ProfileReport() isn't handed an empty DataFrame. A
+      # column of only None values is typed null, rejected by list_flatten(),
+      # so it's checked for first.
+      if pa.types.is_null(reportDF.type) or \
+         reportDF.null_count == len(reportDF) or \
+         len(pc.list_flatten(reportDF)) == 0:
+        print("    %s report skipped, no %s values" % (report, subfield))
+        del arrowTable
+        del reportDF
+        return None
+      #   Single string subfields are left as list arrays, for
+      # valueCountsReport() to count in batches without exploding them.
+      if subfield in GDELTedaGKGhelpers.subfieldTypes:
+        subfieldTypes = GDELTedaGKGhelpers.subfieldTypes[subfield]
+        reportDF = GDELTedaGKGhelpers.explodeSubfield(
+          arrowTable.select(['GKGRECORDID']).to_pandas(), reportDF, subfield,
+          columnTypes = subfieldTypes)
+        reportDF = GDELTedaGKGhelpers.astypeStrings(reportDF, [
+          name for name in subfieldTypes
+          if subfieldTypes[name] == pd.StringDtype()])
+    del arrowTable
+    print("    %s report DataFrame ready ( %0.3f s )" %
+          (report, (perf_counter_ns() - timecheck) / 1e9))
+
+    configName = "GDELTgkg%sEDAconfig_realtime.yaml" % (report.capitalize())
+    edaLogName = ''.join(["GDELT_GKG_realtime_", report, "_EDA_",
+                          edaDateString, ".html"])
+    timecheck = perf_counter_ns()
+    #   Single string columns (themes, persons, organizations) get value
+    # counts rather than a full ProfileReport, see valueCountsReport().
+    if report != 'main' and subfield not in GDELTedaGKGhelpers.subfieldTypes:
+      GDELTedaGKGhelpers.valueCountsReport(
+        reportDF, subfield, os.path.join(logDirectory, edaLogName),
+        "GDELT GKG %s realtime EDA %s" % (subfield, edaDateString))
+    else:
+      profile = ProfileReport(reportDF,
+                              config = GDELTedaGKGhelpers.profileConfig(
+                                os.path.join(logDirectory, configName)))
+      edaLogName = os.path.basename(GDELTedaGKGhelpers.writeReportHTML(
+        profile, os.path.join(logDirectory, edaLogName), compressHTML))
+      del profile
+    print("    %s report written to %s ( %0.3f s )" %
+          (report, edaLogName, (perf_counter_ns() - timecheck) / 1e9))
+    del reportDF
+    GDELTedaGKGhelpers.releaseMemory()
+    return edaLogName
+
+
+  # B19
+  def readArrowFile(arrowPath):
+    '''Memory-maps an Arrow IPC file written by GDELTeda.writeArrowFile()
+ and returns it as a Pandas DataFrame. Used by reportFromArrow() in
+ worker processes, so a DataFrame is written once by the parent process
+ rather than pickled to each worker.
+    '''
+    with pa.memory_map(arrowPath) as source:
+      return pa.ipc.open_file(source).read_all().to_pandas(
+        split_blocks = True, self_destruct = True)
+
+
+  # B20
+  def astypeStrings(tableDF, columnNames):
+    '''Sets columns of a DataFrame to pd.StringDtype(), skipping any that
+ already are, e.g. columns read back from Arrow or Parquet files, since
+ astype() scans and validates every value even when the dtype already
+ matches. Returns the resulting DataFrame.
+
+Parameters:
+----------
+
+tableDF - Pandas DataFrame
+  DataFrame holding the columns.
+
+columnNames - list of strings
+  Names of the columns to be set to pd.StringDtype().
+    '''
+    columnTypes = {}
+    for name in columnNames:
+      if tableDF[name].dtype != pd.StringDtype():
+        columnTypes[name] = pd.StringDtype()
+    if len(columnTypes) == 0:
+      return tableDF
+    return tableDF.astype(dtype = columnTypes, copy = False)
+
+
+  # B21
+  def valueCountsReport(reportDF, column, edaLogPath, title,
+                        topValues = 1000, batchRecords = 16384):
+    '''Writes a lightweight html report of one string column, with its
+ summary counts and its most frequent values, in place of a
+ ProfileReport. Used for V1Themes, V1Persons, and V1Organizations
+ reports, where a ProfileReport's per-variable analysis, correlations,
+ interactions, and missing-value diagrams over millions of exploded rows
+ add nothing to the value counts of a single string column.
+
+Parameters:
+----------
+
+reportDF - Pandas DataFrame or pyarrow list array
+  Exploded subfield DataFrame, with a 'GKGRECORDID' column, or the
+ subfield's unexploded list array, one list of values per record, which
+ is counted 'batchRecords' records at a time, never exploded as a whole.
+
+column - string
+  Name of the string column to be counted.
+
+edaLogPath - string
+  Path of the html document to be written.
+
+title - string
+  Report title.
+
+topValues - int, default 1000
+  Number of most frequent values listed.
+
+batchRecords - int, default 16384
+  Records per batch for a pyarrow list array 'reportDF'.
+    '''
+    if isinstance(reportDF, pa.Array):
+      #   As in explodeSubfield(), a column with no values in any record is
+      # typed null, and is given its list type for the compute functions.
+      if pa.types.is_null(reportDF.type):
+        reportDF = pa.nulls(len(reportDF), type = pa.list_(pa.string()))
+      #   Exploding every record's values at once multiplies memory by the
+      # average number of values per record. Each batch of records is
+      # flattened and counted on its own, and only the per-batch counts of
+      # distinct values are kept, to be summed once all batches are done.
+      rowCount = 0
+      recordCount = 0
+      missingCount = 0
+      countParts = []
+      for offset in range(0, len(reportDF), batchRecords):
+        batchValues = reportDF.slice(offset, batchRecords)
+        recordCount += pc.sum(pc.cast(
+          pc.greater(pc.list_value_length(batchValues), 0),
+          pa.int64())).as_py() or 0
+        batchValues = pc.list_flatten(batchValues)
+        rowCount += len(batchValues)
+        missingCount += batchValues.null_count
+        batchCounts = pc.value_counts(
+          batchValues.filter(pc.is_valid(batchValues)))
+        countParts.append(pd.Series(
+          batchCounts.field('counts').to_numpy(),
+          index = batchCounts.field('values').to_pandas()))
+        del batchValues
+        del batchCounts
+      if countParts:
+        valueCounts = pd.concat(countParts).groupby(level = 0).sum(
+          ).sort_values(ascending = False)
+      else:
+        valueCounts = pd.Series([], dtype = 'int64')
+      del countParts
+    else:
+      valueCounts = reportDF[column].value_counts(dropna = True)
+      rowCount = len(reportDF)
+      recordCount = reportDF['GKGRECORDID'].nunique()
+      missingCount = int(reportDF[column].isna().sum())
+    summaryDF = pd.DataFrame({
+      'statistic' : ['rows', 'records', 'missing values', 'distinct values'],
+      'value'     : [rowCount, recordCount, missingCount, len(valueCounts)],
+      })
+    topDF = valueCounts.head(topValues).rename_axis(column).reset_index(
+      name = 'count')
+    del valueCounts
+    with open(edaLogPath, 'w', encoding = 'utf-8') as reportFile:
+      reportFile.write(''.join([
+        '<!DOCTYPE html>\n<html>\n<head><meta charset="utf-8"><title>',
+        html.escape(title), '</title></head>\n<body>\n<h1>',
+        html.escape(title), '</h1>\n<h2>Summary</h2>\n',
+        summaryDF.to_html(index = False), '\n<h2>Top ', str(len(topDF)),
+        ' values</h2>\n', topDF.to_html(index = False),
+        '\n</body>\n</html>\n',
+        ]))
     return True
 
 
-  # B10
-  def organizationsReport(mainDF):
-    '''Converts V1Organizations subfield lists to individual column values as
- a DataFrame normalized for variable-length lists of organizations, which is
- then used to generate a Pandas Profiling report. Intended for use in
- GDELTeda method gkgBatchEda() multiprocessing Pool.map() calls.
+  # B22
+  def prepareGKG(mainDF):
+    '''Applies the work of applyDtypes(), convertDatetimes(), and
+ convertGKGV15Tone() in one pass, returns resulting modified DataFrame.
+ Intended for use in GDELTeda methods gkgBatchEDA() (through
+ prepareMainChunk()) and realtimeEDA().
 
-   WARNING: this function is not working for the 30 day batch EDA test
- subset of GDELT records. As such, it's been left in place as
- potentially operable for smaller sets, but such testing has not been
- performed as part of this capstone project.
+   'V21DATE' is parsed straight from its stored strings, without first
+ being set to pd.StringDtype() as applyDtypes() would, and V15Tone_X
+ columns are assigned to mainDF in place of a join, so each column is
+ converted once with no intermediate copy of the DataFrame.
+
+Parameters:
+----------
+
+mainDF - Pandas DataFrame
+  GKG records with 'V21DATE' and 'V15Tone' columns as returned by
+ cursorToColumnsDF(), and any of 'GKGRECORDID', 'V2SourceCommonName',
+ and 'V2DocumentIdentifier'.
     '''
-    localDb = {}
-    localDb['client'] = pymongo.MongoClient()
-    localDb['database'] = localDb['client'].capstone
-    localDb['collection'] = localDb['database'].GDELT.gkg
+    mainDF = GDELTedaGKGhelpers.astypeStrings(mainDF, [
+      c for c in ['GKGRECORDID', 'V2SourceCommonName', 'V2DocumentIdentifier']
+      if c in mainDF.columns])
+    mainDF['V21DATE'] = pd.to_datetime(mainDF['V21DATE'],
+                                       format = "%Y-%m-%dT%H:%M:%S.000000Z",
+                                       cache = True)
+    subcols = GDELTedaGKGhelpers.splitV15Tone(mainDF.pop('V15Tone'),
+                                              mainDF.index)
+    for toneColumn in subcols.columns:
+      mainDF[toneColumn] = subcols[toneColumn]
+    del subcols
+    return mainDF
+
+
+  # B23
+  def profileConfig(configPath):
+    '''Returns ProfileReport settings parsed from a configuration file,
+ for use as ProfileReport(config = ...) in place of 'config_file'. Each
+ file's YAML is parsed once per process, and again only if the file has
+ been modified since, so repeated realtimeEDA() iterations and batch
+ reports don't re-read unchanged files.
+
+Parameters:
+----------
+
+configPath - string
+  Path of the ProfileReport configuration file.
+
+output:
+------
+
+  Returns a copy of the cached Settings, so changes made to it by one
+ ProfileReport don't carry over to the next.
+    '''
+    modifiedTime = os.stat(configPath).st_mtime
+    cached = GDELTedaGKGhelpers.profileSettings.get(configPath)
+    if cached is None or cached[0] != modifiedTime:
+      #   Parsed as ProfileReport(config_file = ...) parses it, since
+      # pandas-profiling 3.0.0's Settings has no loader of its own.
+      with open(configPath) as configFile:
+        configData = yaml.safe_load(configFile)
+      cached = (modifiedTime, Settings().parse_obj(configData))
+      GDELTedaGKGhelpers.profileSettings[configPath] = cached
+    return cached[1].copy(deep = True)
+
+
+  # B24
+  def subfieldReport(mainDF, report, sampleRows = 500000,
+                     subfieldValues = None, edaDates = None):
+    '''Generates one batch GKG EDA report for a variable-length subfield,
+ shared by locationsReport(), countsReport(), themesReport(),
+ personsReport(), and organizationsReport(). The subfield's values are
+ pulled from MongoDB. Dict subfields (see subfieldTypes) are exploded
+ against mainDF's 'GKGRECORDID' column for a ProfileReport(), saved by
+ saveReport(), and plain string subfields get a valueCountsReport() from
+ their unexploded values.
+
+Parameters:
+----------
 
-    print("    Converting Pymongo result cursor to Python list...")
-    orgList = list(localDb['collection'].find(
-      projection = {'V1Organizations' : True, '_id' : False},
+mainDF - Pandas DataFrame
+  Main GKG columns, as passed to each report function by
+ reportFromArrow().
+
+report - string
+  One of 'locations', 'counts', 'themes', 'persons', or 'organizations',
+ naming the subfield (e.g. 'V1Locations'), its configuration file, and
+ its report.
+
+sampleRows - int or None, default 500000
+  See sampleForReport(). Unused for valueCountsReport() subfields.
+
+subfieldValues - pyarrow list array, default None
+  The subfield's values in mainDF's record order, as taken from the
+ Arrow file by reportFromArrow(). If None, values are pulled from
+ MongoDB by pullSubfieldValues().
+
+edaDates - string, default None
+  Report date range string, see edaDateRange(). If None, it's computed
+ from mainDF's 'V21DATE' column.
+    '''
+    subfield = 'V1' + report.capitalize()
+
+    #   Report dates are taken from mainDF's records, before any explode,
+    # since only 'GKGRECORDID' is joined to the subfield's values.
+    if edaDates is None:
+      edaDates = GDELTedaGKGhelpers.edaDateRange(mainDF['V21DATE'])
+
+    edaLogName = "".join(["GDELT_GKG_", report, "_EDA_", edaDates, ".html"])
+    edaLogPath = os.path.join(GDELTedaGKGhelpers.logPath, edaLogName)
+
+    #   The subfield's pulled (and, for dict subfields, exploded) values are
+    # cached as Parquet in the batch log directory, named for the records'
+    # dates and count, so later runs over the same records skip MongoDB and
+    # explodeSubfield() entirely. Parquet's dictionary encoding stores each
+    # repeated name or code once per column chunk. GDELTeda.gkgBatchEDA()
+    # removes these caches when called with 'useCache = False'.
+    cachePath = os.path.join(GDELTedaGKGhelpers.logPath,
+                             "GDELT_gkg_cache_%s_%s_%d.parquet" %
+                             (report, edaDates, len(mainDF)))
+
+    if subfield in GDELTedaGKGhelpers.subfieldTypes:
+      if os.path.isfile(cachePath):
+        print("    Reading cached %s DataFrame..." % subfield)
+        reportDF = pd.read_parquet(cachePath)
+      else:
+        if subfieldValues is None:
+          valueList = GDELTedaGKGhelpers.pullSubfieldValues(subfield)
+        else:
+          valueList = subfieldValues
+        del subfieldValues
+        print("    Flattening %s with pyarrow..." % subfield)
+        subfieldTypes = GDELTedaGKGhelpers.subfieldTypes[subfield]
+        reportDF = GDELTedaGKGhelpers.explodeSubfield(
+          mainDF[['GKGRECORDID']], valueList, subfield,
+          skipKeys = GDELTedaGKGhelpers.batchSkipKeys.get(subfield, ()),
+          columnTypes = subfieldTypes)
+        del valueList
+        reportDF = GDELTedaGKGhelpers.astypeStrings(reportDF, [
+          name for name in subfieldTypes
+          if subfieldTypes[name] == pd.StringDtype()])
+        reportDF.to_parquet(cachePath, compression = 'zstd', index = False)
+
+      print("\n  GKG %s DataFrame .info():\n" % report.capitalize())
+      pp(reportDF.info())
+
+      print("    Generating report...")
+      print("    File to output:", edaLogName, "\n")
+      configFilePath = os.path.join(
+        GDELTedaGKGhelpers.logPath,
+        "GDELTgkg%sEDAconfig_batch.yaml" % report.capitalize())
+      reportDF = GDELTedaGKGhelpers.sampleForReport(reportDF, sampleRows,
+                                                    edaLogPath)
+      #   The full subfield DataFrame, and any explode temporaries, are
+      # released here, before ProfileReport()'s own peak, rather than held
+      # until the report is saved.
+      GDELTedaGKGhelpers.releaseMemory()
+      profile = ProfileReport(
+        reportDF, config = GDELTedaGKGhelpers.profileConfig(configFilePath))
+      GDELTedaGKGhelpers.saveReport(profile, edaLogPath)
+      del profile
+      del reportDF
+    else:
+      #   A single string column gets value counts rather than a full
+      # ProfileReport, see valueCountsReport(). Counts are cheap enough to
+      # take over every row, so no sample is taken, and they're taken in
+      # batches of records from the unexploded list array, so no exploded
+      # DataFrame is built at all.
+      if os.path.isfile(cachePath):
+        print("    Reading cached %s values..." % subfield)
+        subfieldArray = pq.read_table(cachePath).column(
+          subfield).combine_chunks()
+      elif subfieldValues is not None:
+        subfieldArray = subfieldValues
+      else:
+        subfieldArray = pa.array(
+          GDELTedaGKGhelpers.pullSubfieldValues(subfield),
+          type = pa.list_(pa.string()))
+        pq.write_table(pa.table({subfield : subfieldArray}), cachePath,
+                       compression = 'zstd')
+      print("    Generating report...")
+      print("    File to output:", edaLogName, "\n")
+      GDELTedaGKGhelpers.valueCountsReport(
+        subfieldArray, subfield, edaLogPath,
+        "GDELT GKG %s batch EDA" % subfield)
+      del subfieldArray
+    GDELTedaGKGhelpers.releaseMemory()
+    return True
+
+
+  # B25
+  def releaseMemory():
+    '''Collects any reference cycles left by a report's DataFrames and
+ ProfileReport, then returns pyarrow's freed but still-held buffers, and
+ glibc's freed heap pages, to the OS. Called once a report's objects are
+ deleted, so pool worker processes and realtimeEDA()'s long-running loop
+ hold only the working set of the report in progress, rather than growing
+ from report to report. Also called by subfieldReport() between building
+ its full subfield DataFrame and ProfileReport().
+    '''
+    gc.collect()
+    pa.default_memory_pool().release_unused()
+    if GDELTedaGKGhelpers.libc is not None:
+      GDELTedaGKGhelpers.libc.malloc_trim(0)
+
+
+  # B26
+  def writeReportHTML(profile, htmlPath, compressHTML = False):
+    '''Writes a ProfileReport's html document, as ProfileReport.to_file()
+ would, or gzip-compressed to 'htmlPath' + '.gz'. Report html compresses
+ to a small fraction of its size, so compressed reports cut disk writes
+ and storage for realtimeEDA() loops that write several per update.
+
+Parameters:
+----------
+
+profile - pandas_profiling.ProfileReport
+  Report to be written.
+
+htmlPath - string
+  Path of the report's html document.
+
+compressHTML - boolean, default False
+  If True, the html is written through gzip.open() in place of
+ ProfileReport.to_file(), with no uncompressed copy written.
+
+output:
+------
+
+  Returns the path of the file written.
+    '''
+    if not compressHTML:
+      profile.to_file(htmlPath)
+      return htmlPath
+    with gzip.open(htmlPath + '.gz', 'wt', compresslevel = 6,
+                   encoding = 'utf-8') as htmlFile:
+      htmlFile.write(profile.to_html())
+    return htmlPath + '.gz'
+
+
+  # B27
+  def pullSubfieldValues(subfield):
+    '''Pulls one variable-length column's values for every batch GKG
+ record from MongoDB, in collection order, for subfieldReport().
+
+Parameters:
+----------
+
+subfield - string
+  Name of the variable-length column, e.g. 'V1Locations'.
+
+output:
+------
+
+  Returns a list of each record's values, or None for records without
+ the column.
+    '''
+    print("    Pulling %s values from Pymongo result cursor..." % subfield)
+    valueList = []
+    with GDELTbase.localDb['collections']['gkg'].find(
+      projection = dict(GDELTedaGKGhelpers.subfieldProjection(subfield),
+                        _id = False),
       allow_disk_use = True,
       no_cursor_timeout = True,
-      ))
+      batch_size = 100000,
+      ) as cursor:
+      for record in cursor:
+        valueList.append(record.get(subfield))
+    return valueList
+
+
+  # B28
+  def splitV15Tone(toneValues, index):
+    '''Splits V15Tone dicts into V15Tone_X columns, typed as in
+ v15ToneDtypes, for convertGKGV15Tone() and prepareGKG(). The dicts are
+ converted once to a pyarrow struct array, whose fields are the finished
+ columns, in place of pd.json_normalize(), which walks each dict in
+ Python to build an intermediate record per row.
 
-    print("    Converting list of dicts to Pandas DataFrame...")
-    orgDF = pd.DataFrame.from_records(orgList)
-    del orgList
+Parameters:
+----------
+
+toneValues - Pandas Series or list
+  V15Tone dict for each record. Missing keys, or records without a dict,
+ result in missing values.
 
-    print("    Joining with other columns...")
-    orgDF = pd.concat([mainDF, orgDF], axis = 1)
+index - Pandas Index
+  Index given to the resulting DataFrame, e.g. that of a row chunk of
+ the main columns, see prepareMainChunk().
 
-    print("    Performing explode()...")
-    orgDF = orgDF.explode('V1Organizations')
+output:
+------
 
-    print("    Correcting dtypes...")
-    orgDF = orgDF.astype({'V1Organizations' : pd.StringDtype()}, copy = False)
+  Returns a Pandas DataFrame of V15Tone_X columns.
+    '''
+    toneArray = pa.array(toneValues, type = GDELTedaGKGhelpers.v15ToneType)
+    toneNames = ["V15Tone_%s" % toneArray.type[fieldIndex].name
+                 for fieldIndex in range(toneArray.type.num_fields)]
+    subcols = pa.Table.from_arrays(toneArray.flatten(),
+                                   names = toneNames).to_pandas(
+      split_blocks = True, self_destruct = True)
+    del toneArray
+    subcols.index = index
+    return subcols.astype({c : GDELTedaGKGhelpers.v15ToneDtypes[c]
+                           for c in subcols.columns}, copy = False)
+
+
+  # B29
+  def summarizeColumns(tableDF, topValues = 50):
+    '''Summarizes every column of a DataFrame with pyarrow compute
+ kernels, for sampleForReport(). Each column is converted once to Arrow
+ and scanned by vectorized kernels, in place of describe(include = 'all')
+ and a value_counts() per column, which walk the full, unsampled records
+ in Pandas before ProfileReport() is handed its sample.
 
-    print("\n  GKG Organizations DataFrame .info():\n")
-    pp(orgDF.info())
+Parameters:
+----------
 
-    configFileName = "GDELTgkgOrganizationsEDAconfig_batch.yaml"
-    strftimeFormat = "%Y-%m-%dh%Hm%M"
+tableDF - Pandas DataFrame
+  Records to be summarized.
 
-    print("    Generating report...")
-    edaDates = "".join([
-      orgDF['V21DATE'].min().strftime(strftimeFormat),"_to_",
-      orgDF['V21DATE'].max().strftime(strftimeFormat),
-      ])
-    edaLogName = "".join(["GDELT_GKG_organizations_EDA_", edaDates,".html"])
-    print("    File to output:", edaLogName, "\n")
+topValues - int, default 50
+  Number of most frequent values kept per column.
 
-    print("    Setting index to 'GKGRECORDID'...")
-    orgDF.set_index(keys='GKGRECORDID', drop = True, append = False,
-                       inplace = True, verify_integrity = False)
+output:
+------
 
-    profile = ProfileReport(orgDF, config_file = configFileName)
-    print("    Generating html from report...")
-    profile.to_file(edaLogName)
-    del profile
-    del orgDF
-    return True
+  Returns a Pandas DataFrame of 'column', 'kind', 'key', and 'value'
+ string columns. 'describe' rows hold count, and mean, std, min,
+ quartiles, and max for numeric columns, first and last for datetimes, or
+ unique, top, and freq for others. 'value_counts' rows hold the most
+ frequent values, missing values included, for columns not holding lists
+ or dicts.
+    '''
+    summaryParts = []
+    arrowTable = pa.Table.from_pandas(tableDF, preserve_index = False)
+    for column in arrowTable.column_names:
+      values = arrowTable.column(column).combine_chunks()
+      valueType = values.type
+      describeKeys = ['count']
+      describeValues = [len(values) - values.null_count]
+      counts = None
+      #   Columns holding lists or dicts can't be counted, and only get a
+      # count of records holding values.
+      if not pa.types.is_nested(valueType):
+        valueCounts = pc.value_counts(values)
+        counts = pd.Series(
+          valueCounts.field('counts').to_numpy(),
+          index = valueCounts.field('values').to_pandas()).sort_values(
+            ascending = False, kind = 'mergesort')
+        del valueCounts
+      if pa.types.is_integer(valueType) or pa.types.is_floating(valueType):
+        minMax = pc.min_max(values).as_py()
+        describeKeys += ['mean', 'std', 'min', '25%', '50%', '75%', 'max']
+        describeValues += [pc.mean(values).as_py(),
+                           pc.stddev(values, ddof = 1).as_py(),
+                           minMax['min']]
+        describeValues += pc.quantile(values, q = [0.25, 0.5, 0.75]
+                                      ).to_pylist()
+        describeValues += [minMax['max']]
+      elif pa.types.is_timestamp(valueType):
+        describeKeys += ['first', 'last']
+        describeValues += [tableDF[column].min(), tableDF[column].max()]
+      elif counts is not None:
+        describeKeys += ['unique', 'top', 'freq']
+        describeValues += [len(counts), counts.index[0] if len(counts) else
+                           None, counts.iloc[0] if len(counts) else None]
+      del values
+      summaryParts.append(pd.DataFrame({
+        'column' : column,
+        'kind'   : 'describe',
+        'key'    : describeKeys,
+        'value'  : [str(value) for value in describeValues],
+        }))
+      if counts is not None:
+        counts = counts.head(topValues)
+        summaryParts.append(pd.DataFrame({
+          'column' : column,
+          'kind'   : 'value_counts',
+          'key'    : counts.index.astype(str),
+          'value'  : counts.values.astype(str),
+          }))
+      del counts
+    del arrowTable
+    return pd.concat(summaryParts, ignore_index = True)
+
+
+  # B30
+  def edaDateRange(datetimes):
+    '''Returns the date range string used in batch report file names,
+ e.g. '2020-05-24h00m00_to_2020-06-22h23m45'. Computed once by
+ GDELTeda.gkgBatchEDA() and passed to every GKG report function, which
+ otherwise compute it from their own 'V21DATE' columns, and used for
+ GDELTeda.eventsBatchEDA() and mentionsBatchEDA() report file names.
+
+Parameters:
+----------
+
+datetimes - Pandas Series
+  Parsed datetime values, e.g. 'V21DATE'.
+    '''
+    strftimeFormat = GDELTedaGKGhelpers.strftimeFormat
+    return "".join([datetimes.min().strftime(strftimeFormat), "_to_",
+                    datetimes.max().strftime(strftimeFormat)])
+
+
+  # B31
+  def subfieldProjection(subfield):
+    '''Returns MongoDB projection items for one GKG column. For a dict
+ subfield with keys in batchSkipKeys, e.g. V1Counts' LocationLatitude
+ and LocationLongitude, only its remaining keys are projected, by dotted
+ name, so skipped values are pruned by MongoDB and never sent to Python.
+ Used by pullMainGKGcolumns() and pullSubfieldValues().
+
+Parameters:
+----------
+
+subfield - string
+  Name of the GKG column, e.g. 'V1Counts'.
+    '''
+    skipKeys = GDELTedaGKGhelpers.batchSkipKeys.get(subfield, ())
+    if not skipKeys:
+      return {subfield : True}
+    return {'.'.join([subfield, key]) : True
+            for key, keyType in GDELTbase.toolData['subfields'][subfield]
+            if key not in skipKeys}
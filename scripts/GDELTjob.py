@@ -18,6 +18,9 @@ Contents:
     C01 - previously-run GDELT data acquisition, preprocessing, storage
 '''
 from GDELTbase import GDELTbase
+from time import perf_counter_ns
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, \
+                               wait, FIRST_COMPLETED
 
 # A00 - GDELTjob
 class GDELTjob:
@@ -27,9 +30,10 @@ exporting GDELT files for a user-specified period.
 Shared class data:
 -----------------
 
-dateList -- list of strings.
+dateList -- tuple of strings.
   Values must be formatted like 'YYYY/MM/DD'.
-Controls what dates will be passed to GDELTbase.downloadGDELTDay().
+Controls what dates will be passed to GDELTbase.downloadGDELTDay(). Kept
+in the order given, with any repeated dates dropped.
 
 tableList -- list of strings, default ['events','mentions','gkg'].
   Values must be one or more of ['events', 'gkg', 'mentions'].
@@ -66,6 +70,8 @@ dateList - list of strings
 versions of Events/Mentions and GKG datafiles are available no further
 in the past than January 2017, which means requests for earlier files
 may result in '404 - file not found' errors and skipped downloads.
+Repeated dates are dropped, rather than each repeat's files being
+skipped by GDELTbase as already downloaded, cleaned, and stored.
 
 tableList - list of strings, default ['events','mentions','gkg']
   Permits limiting the datafiles acquired for a given time period.
@@ -81,7 +87,7 @@ output:
 and in all related GDELTbase methods.
     '''
     self.Gbase = GDELTbase()
-    self.dateList = dateList
+    self.dateList = tuple(dict.fromkeys(dateList))
     self.tableList = tableList
     self.verbose = verbose
 
@@ -111,13 +117,90 @@ dateList and tableList.
       self.Gbase.mongoTable(table, verbose = self.verbose)
 
   # B04
-  def execute(self):
-    '''Executes each of download(), clean(), and store() for a given
-GDELTjob() instance.
+  def execute(self, workers = None, days = 2, exports = 4):
+    '''Downloads, cleans, and stores all files for a given GDELTjob()
+instance, as download(), clean(), and store() do, but as a pipeline: each
+raw file is cleaned as soon as its day is downloaded, and each clean file
+is exported as soon as it's cleaned, rather than every download finishing
+before any cleaning starts, and every clean before any export.
+
+Parameters:
+----------
+
+workers - int, default None
+  Maximum number of worker processes cleaning files concurrently, default
+None uses one per CPU, as in GDELTbase.cleanTable().
+
+days - int, default 2
+  Number of (date, table) days downloaded concurrently, each with its own
+GDELTbase.downloadGDELTDay() download threads.
+
+exports - int, default 4
+  Number of clean files exported to MongoDB concurrently, as in
+GDELTbase.mongoTable().
+
+output:
+------
+
+  Prints counts for files cleaned and records exported, with time to
+completion. See __init__() parameter 'verbose' for further output.
     '''
-    self.download()
-    self.clean()
-    self.store()
+    timecheck = perf_counter_ns()
+    filesCleaned = 0
+    totalFiles = 0
+    totalRecords = 0
+    #   Each pending future is mapped to its step and the (name, table) it
+    # covers, so each finished step's results can be handed to the next.
+    # Downloads and exports wait on the network and MongoDB, so they run in
+    # threads, while cleaning is CPU-bound, so it runs in worker processes.
+    pendingSteps = {}
+    with ThreadPoolExecutor(max_workers = days) as downloadPool, \
+         ProcessPoolExecutor(max_workers = workers) as cleanPool, \
+         ThreadPoolExecutor(max_workers = exports) as exportPool:
+      for date in self.dateList:
+        for table in self.tableList:
+          pendingSteps[downloadPool.submit(
+            self.Gbase.downloadGDELTDay, date, table,
+            verbose = self.verbose)] = ('download', date, table)
+
+      while pendingSteps:
+        doneSteps = wait(pendingSteps, return_when = FIRST_COMPLETED).done
+        for future in doneSteps:
+          step, name, table = pendingSteps.pop(future)
+          result = future.result()
+          if step == 'download':
+            #   Raw files for this day, downloaded now or by an earlier job,
+            # are cleaned in worker processes, each working from a copy of
+            # the GDELTbase instance, as in GDELTbase.cleanTable().
+            dayPrefix = name.replace('/', '')
+            for fileName in sorted(self.Gbase.localFiles[table]['raw']):
+              if fileName.startswith(dayPrefix):
+                pendingSteps[cleanPool.submit(
+                  self.Gbase.cleanFile, fileName, False,
+                  self.verbose)] = ('clean', fileName, table)
+          elif step == 'clean':
+            #   Workers' localFiles changes stay in the workers, so the
+            # clean file is added here for mongoFile() to find it. Files
+            # cleaned by an earlier job are exported too, as in store().
+            if table == 'gkg':
+              cleanFileName = name.replace('.csv', '.parquet')
+            else:
+              cleanFileName = name.replace('.CSV', '.parquet')
+            if result:
+              filesCleaned += 1
+              self.Gbase.localFiles[table]['clean'].add(cleanFileName)
+            if cleanFileName in self.Gbase.localFiles[table]['clean']:
+              pendingSteps[exportPool.submit(
+                self.Gbase.mongoFile, cleanFileName, table,
+                self.verbose)] = ('export', cleanFileName, table)
+          elif result:
+            totalFiles += 1
+            totalRecords += result
+
+    self.Gbase.updateLocalFilesIndex()
+    print("Job complete, %d files cleaned, %d files with %d records added" \
+          " to MongoDB (%0.3f seconds)" % (filesCleaned, totalFiles,
+          totalRecords, (perf_counter_ns() - timecheck) / 1e9))
 
 # C00
 # in-design iterative testing with direct execution
@@ -145,20 +228,10 @@ if __name__ == "__main__":
   tables = ['events', 'mentions', 'gkg']
   
   #     Automating generation of string dates from '2020/05/24' to '2020/06/22'
-  # in list form for passing to a GDELTjob instance. This could probably get
-  # replaced with a list comprehension and a lambda function.
-  jobDates = []
-  dateStart = '2020/05/'
-  for day in range(24, 32):
-    thisday = str(day)
-    jobDates.append(dateStart + thisday)
-  dateStart = dateStart.replace('5', '6')
-  for day in range(1, 23):
-    if day < 10:
-      thisday = '0' + str(day)
-    else:
-      thisday = str(day)
-    jobDates.append(dateStart + thisday)
+  # in list form for passing to a GDELTjob instance.
+  import pandas as pd
+  jobDates = pd.date_range('2020-05-24', '2020-06-22').strftime(
+    '%Y/%m/%d').tolist()
   
   gJob = GDELTjob(dateList = jobDates, tableList = tables, verbose = True)
 